@@ -11,6 +11,10 @@ import zipfile
 from collections.abc import Iterable
 from textwrap import dedent  # noqa: PNT20
 
+from pants.backend.go.util_rules.build_opts import GoBuildOptions
+from pants.backend.go.util_rules.build_pkg import BuildGoPackageRequest
+from pants.testutil.rule_runner import RuleRunner
+
 
 # Implements hashing algorithm from https://cs.opensource.google/go/x/mod/+/refs/tags/v0.5.0:sumdb/dirhash/hash.go.
 def compute_module_hash(files: Iterable[tuple[str, str]]) -> str:
@@ -68,3 +72,46 @@ def gen_module_gomodproxy(
         f"go-mod-proxy/{import_path}/@v/{version}.mod": go_mod_content,
         f"go-mod-proxy/{import_path}/@v/{version}.zip": mod_zip_bytes.getvalue(),
     }
+
+
+def package_chain_build_requests(
+    rule_runner: RuleRunner, *, depth: int, leaf_body: str
+) -> list[BuildGoPackageRequest]:
+    """Create requests to build a chain of packages, each of which imports the one before it.
+
+    The `Value` function of the first package (the leaf) returns `leaf_body`, and so changing it
+    changes only the implementation (and not the export data) of the leaf.
+    """
+    requests: list[BuildGoPackageRequest] = []
+    for i in range(depth):
+        imports = f'import "example.com/chain/pkg{i - 1}"' if i else ""
+        body = f"pkg{i - 1}.Value(n) + {i}" if i else leaf_body
+        requests.append(
+            BuildGoPackageRequest(
+                import_path=f"example.com/chain/pkg{i}",
+                pkg_name=f"pkg{i}",
+                dir_path=f"pkg{i}",
+                build_opts=GoBuildOptions(),
+                go_files=("f.go",),
+                digest=rule_runner.make_snapshot(
+                    {
+                        f"pkg{i}/f.go": dedent(
+                            f"""\
+                            package pkg{i}
+
+                            {imports}
+
+                            //go:noinline
+                            func Value(n int) int {{
+                                return {body}
+                            }}
+                            """
+                        )
+                    }
+                ).digest,
+                s_files=(),
+                direct_dependencies=tuple(requests[-1:]),
+                minimum_go_version=None,
+            )
+        )
+    return requests
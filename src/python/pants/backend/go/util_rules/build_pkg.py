@@ -297,10 +297,18 @@ class BuiltGoPackage:
     """A package and its dependencies compiled as `__pkg__.a` files.
 
     The packages are arranged into `__pkgs__/{path_safe(import_path)}/__pkg__.a`.
+
+    Each package's export data (the API information that the compiler needs in order to compile
+    packages which import it) is also available separately, as
+    `__pkgs__/{path_safe(import_path)}/__pkg__.x` files in `export_digest`. Dependents are compiled
+    against only those files, and so are not recompiled when a dependency's implementation changes
+    without changing its export data.
     """
 
     digest: Digest
     import_paths_to_pkg_a_files: FrozenDict[str, str]
+    export_digest: Digest
+    import_paths_to_export_files: FrozenDict[str, str]
     coverage_metadata: BuiltGoPackageCodeCoverageMetadata | None = None
 
 
@@ -579,7 +587,9 @@ async def build_go_package(
     )
 
     import_paths_to_pkg_a_files: dict[str, str] = {}
+    import_paths_to_export_files: dict[str, str] = {}
     dep_digests = []
+    dep_export_digests = []
     for maybe_dep in maybe_built_deps:
         if maybe_dep.output is None:
             return dataclasses.replace(
@@ -590,12 +600,19 @@ async def build_go_package(
             if dep_import_path not in import_paths_to_pkg_a_files:
                 import_paths_to_pkg_a_files[dep_import_path] = pkg_archive_path
                 dep_digests.append(dep.digest)
-
+        for dep_import_path, export_file_path in dep.import_paths_to_export_files.items():
+            if dep_import_path not in import_paths_to_export_files:
+                import_paths_to_export_files[dep_import_path] = export_file_path
+                dep_export_digests.append(dep.export_digest)
+
+    # NB: The package is compiled against only the export data of its dependencies (as `go build`
+    # does), so that changes to their implementations which don't affect their export data leave
+    # the inputs of this compilation unchanged, and it can be a cache hit.
     merged_deps_digest, import_config, embedcfg, action_id_result = await concurrently(
-        merge_digests(MergeDigests(dep_digests)),
+        merge_digests(MergeDigests(dep_export_digests)),
         generate_import_config(
             ImportConfigRequest(
-                FrozenDict(import_paths_to_pkg_a_files),
+                FrozenDict(import_paths_to_export_files),
                 build_opts=request.build_opts,
                 import_map=request.import_map,
             )
@@ -771,6 +788,8 @@ async def build_go_package(
         "-buildid",
         action_id_result.action_id,
         "-o",
+        "__pkg__.x",
+        "-linkobj",
         "__pkg__.a",
         "-pack",
         "-p",
@@ -890,7 +909,11 @@ async def build_go_package(
                 input_digest=input_digest,
                 command=tuple(compile_args),
                 description=f"Compile Go package: {request.import_path}",
-                output_files=("__pkg__.a", *([asm_header_path] if asm_header_path else [])),
+                output_files=(
+                    "__pkg__.a",
+                    "__pkg__.x",
+                    *([asm_header_path] if asm_header_path else []),
+                ),
                 env={"__PANTS_GO_COMPILE_ACTION_ID": action_id_result.action_id},
             )
         )
@@ -904,7 +927,15 @@ async def build_go_package(
             stderr=compile_result.stderr.decode("utf-8"),
         )
 
-    compilation_digest = compile_result.output_digest
+    # Separate the export data from the linker object (and any assembly header).
+    export_data_digest, compilation_digest = await concurrently(
+        digest_subset_to_digest(
+            DigestSubset(compile_result.output_digest, PathGlobs(["__pkg__.x"]))
+        ),
+        digest_subset_to_digest(
+            DigestSubset(compile_result.output_digest, PathGlobs(["**", "!__pkg__.x"]))
+        ),
+    )
 
     # TODO: Compile any C files if this package does not use Cgo.
 
@@ -964,8 +995,15 @@ async def build_go_package(
 
     path_prefix = os.path.join("__pkgs__", path_safe(request.import_path))
     import_paths_to_pkg_a_files[request.import_path] = os.path.join(path_prefix, "__pkg__.a")
-    output_digest = await add_prefix(AddPrefix(compilation_digest, path_prefix))
-    merged_result_digest = await merge_digests(MergeDigests([*dep_digests, output_digest]))
+    import_paths_to_export_files[request.import_path] = os.path.join(path_prefix, "__pkg__.x")
+    output_digest, export_output_digest = await concurrently(
+        add_prefix(AddPrefix(compilation_digest, path_prefix)),
+        add_prefix(AddPrefix(export_data_digest, path_prefix)),
+    )
+    merged_result_digest, merged_export_digest = await concurrently(
+        merge_digests(MergeDigests([*dep_digests, output_digest])),
+        merge_digests(MergeDigests([*dep_export_digests, export_output_digest])),
+    )
 
     # Include the modules sources in the output `Digest` alongside the package archive if the Cgo rules
     # detected a potential attempt to link against a static archive (or other reference to `${SRCDIR}` in
@@ -989,6 +1027,8 @@ async def build_go_package(
     output = BuiltGoPackage(
         digest=merged_result_digest,
         import_paths_to_pkg_a_files=FrozenDict(import_paths_to_pkg_a_files),
+        export_digest=merged_export_digest,
+        import_paths_to_export_files=FrozenDict(import_paths_to_export_files),
         coverage_metadata=coverage_metadata,
     )
     return FallibleBuiltGoPackage(output, request.import_path)
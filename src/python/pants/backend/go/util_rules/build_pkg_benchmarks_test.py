@@ -0,0 +1,54 @@
+# Copyright 2025 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+
+from pants.backend.go.testutil import package_chain_build_requests
+from pants.backend.go.util_rules import assembly, build_pkg, import_analysis, sdk
+from pants.backend.go.util_rules.build_pkg import BuildGoPackageRequest, BuiltGoPackage
+from pants.engine.rules import QueryRule
+from pants.testutil.benchmark_util import BenchmarkResults
+from pants.testutil.rule_runner import RuleRunner
+
+# NB: These benchmarks only run when their results are requested. When running under Pants, pass
+# the depth through with `--test-extra-env-vars`.
+DEPTH_ENV_VAR = "PANTS_GO_BENCHMARKS_DEPTH"
+
+BENCHMARK_RESULTS = BenchmarkResults("PANTS_GO_BENCHMARKS_RESULTS")
+pytestmark = BENCHMARK_RESULTS.opt_in
+write_results = BENCHMARK_RESULTS.write_results_fixture()
+
+
+@pytest.fixture
+def rule_runner() -> RuleRunner:
+    rule_runner = RuleRunner(
+        rules=[
+            *sdk.rules(),
+            *assembly.rules(),
+            *build_pkg.rules(),
+            *import_analysis.rules(),
+            QueryRule(BuiltGoPackage, [BuildGoPackageRequest]),
+        ],
+    )
+    rule_runner.set_options([], env_inherit={"PATH"})
+    return rule_runner
+
+
+def test_bench_deep_chain_rebuild(rule_runner: RuleRunner) -> None:
+    depth = int(os.environ.get(DEPTH_ENV_VAR, "25"))
+    timings = {}
+    built = {}
+    for name, leaf_body in (("cold", "n + 1"), ("leaf_implementation_change", "n + 2")):
+        requests = package_chain_build_requests(rule_runner, depth=depth, leaf_body=leaf_body)
+        start = time.perf_counter()
+        built[name] = rule_runner.request(BuiltGoPackage, [requests[-1]])
+        timings[name] = time.perf_counter() - start
+
+    # The change to the leaf did not change its export data, so its dependents needed no rebuild.
+    assert built["cold"].export_digest == built["leaf_implementation_change"].export_digest
+    BENCHMARK_RESULTS.results["deep_chain_rebuild"] = {"depth": depth, "seconds": timings}
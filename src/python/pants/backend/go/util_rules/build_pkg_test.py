@@ -10,6 +10,7 @@ import pytest
 
 from pants.backend.go import target_type_rules
 from pants.backend.go.target_types import GoModTarget
+from pants.backend.go.testutil import package_chain_build_requests
 from pants.backend.go.util_rules import (
     assembly,
     build_pkg,
@@ -26,7 +27,7 @@ from pants.backend.go.util_rules.build_pkg import (
     BuiltGoPackage,
     FallibleBuiltGoPackage,
 )
-from pants.engine.fs import Snapshot
+from pants.engine.fs import Digest, DigestEntries, FileDigest, FileEntry, Snapshot
 from pants.engine.rules import QueryRule
 from pants.testutil.rule_runner import RuleRunner
 from pants.util.strutil import path_safe
@@ -47,6 +48,7 @@ def rule_runner() -> RuleRunner:
             *target_type_rules.rules(),
             QueryRule(BuiltGoPackage, [BuildGoPackageRequest]),
             QueryRule(FallibleBuiltGoPackage, [BuildGoPackageRequest]),
+            QueryRule(DigestEntries, [Digest]),
         ],
         target_types=[GoModTarget],
     )
@@ -66,6 +68,14 @@ def assert_built(
     assert dict(built_package.import_paths_to_pkg_a_files) == expected
     assert sorted(result_files) == sorted(expected.values())
 
+    export_files = rule_runner.request(Snapshot, [built_package.export_digest]).files
+    expected_exports = {
+        import_path: os.path.join("__pkgs__", path_safe(import_path), "__pkg__.x")
+        for import_path in expected_import_paths
+    }
+    assert dict(built_package.import_paths_to_export_files) == expected_exports
+    assert sorted(export_files) == sorted(expected_exports.values())
+
 
 def test_build_pkg(rule_runner: RuleRunner) -> None:
     transitive_dep = BuildGoPackageRequest(
@@ -161,6 +171,73 @@ def test_build_pkg(rule_runner: RuleRunner) -> None:
     )
 
 
+def test_implementation_changes_preserve_export_data(rule_runner: RuleRunner) -> None:
+    def build_dep(body: str) -> BuiltGoPackage:
+        request = BuildGoPackageRequest(
+            import_path="example.com/foo/dep",
+            pkg_name="dep",
+            dir_path="dep",
+            build_opts=GoBuildOptions(),
+            go_files=("f.go",),
+            digest=rule_runner.make_snapshot(
+                {
+                    "dep/f.go": dedent(
+                        f"""\
+                        package dep
+
+                        //go:noinline
+                        func Add(a, b int) int {{
+                            return {body}
+                        }}
+                        """
+                    )
+                }
+            ).digest,
+            s_files=(),
+            direct_dependencies=(),
+            minimum_go_version=None,
+        )
+        return rule_runner.request(BuiltGoPackage, [request])
+
+    before = build_dep("a + b")
+    after = build_dep("b + a")
+    # The implementation changed, but dependents (which are compiled against the export data) are
+    # not affected.
+    assert before.digest != after.digest
+    assert before.export_digest == after.export_digest
+
+
+def test_implementation_changes_do_not_recompile_dependents(rule_runner: RuleRunner) -> None:
+    def build_chain(leaf_body: str) -> list[BuiltGoPackage]:
+        requests = package_chain_build_requests(rule_runner, depth=5, leaf_body=leaf_body)
+        return [rule_runner.request(BuiltGoPackage, [request]) for request in requests]
+
+    def pkg_a_files(built_package: BuiltGoPackage) -> dict[str, FileDigest]:
+        entries = rule_runner.request(DigestEntries, [built_package.digest])
+        return {
+            entry.path: entry.file_digest
+            for entry in entries
+            if isinstance(entry, FileEntry) and entry.path.endswith("__pkg__.a")
+        }
+
+    before = build_chain("n + 1")
+    after = build_chain("n + 2")
+
+    # None of the packages' export data changed...
+    assert [b.export_digest for b in before] == [a.export_digest for a in after]
+    # ...and so while the leaf was recompiled, each of its dependents was compiled against the same
+    # inputs as before, and its compiled package is the one which was previously built.
+    leaf_a_file = os.path.join("__pkgs__", path_safe("example.com/chain/pkg0"), "__pkg__.a")
+    pkg_a_files_before, pkg_a_files_after = pkg_a_files(before[-1]), pkg_a_files(after[-1])
+    assert pkg_a_files_before.keys() == pkg_a_files_after.keys()
+    assert len(pkg_a_files_after) == 5
+    assert {
+        path
+        for path, file_digest in pkg_a_files_after.items()
+        if pkg_a_files_before[path] != file_digest
+    } == {leaf_a_file}
+
+
 def test_build_invalid_pkg(rule_runner: RuleRunner) -> None:
     invalid_dep = BuildGoPackageRequest(
         import_path="example.com/foo/dep",
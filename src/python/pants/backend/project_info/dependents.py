@@ -88,22 +88,25 @@ class Dependents(DeduplicatedCollection[Address]):
 async def find_dependents(
     request: DependentsRequest, address_to_dependents: AddressToDependents
 ) -> Dependents:
-    check = set(request.addresses)
-    known_dependents: set[Address] = set()
-    while True:
-        dependents = set(known_dependents)
-        for target in check:
-            target_dependents = address_to_dependents.mapping.get(target, FrozenOrderedSet())
-            dependents.update(target_dependents)
-        check = dependents - known_dependents
-        if not check or not request.transitive:
-            result = (
-                dependents | set(request.addresses)
-                if request.include_roots
-                else dependents - set(request.addresses)
-            )
-            return Dependents(result)
-        known_dependents = dependents
+    # NB: `AddressToDependents` is computed once and memoized by the engine (and so stays resident
+    # in pantsd until a BUILD file or target changes), so the walk below only visits each
+    # dependent once: its cost is proportional to the size of the result rather than to the size
+    # of the repository.
+    empty: FrozenOrderedSet[Address] = FrozenOrderedSet()
+    roots = set(request.addresses)
+    dependents: set[Address] = set()
+    frontier: Iterable[Address] = roots
+    while frontier:
+        new_dependents = {
+            dependent
+            for address in frontier
+            for dependent in address_to_dependents.mapping.get(address, empty)
+            if dependent not in dependents
+        }
+        dependents.update(new_dependents)
+        frontier = new_dependents if request.transitive else ()
+
+    return Dependents(dependents | roots if request.include_roots else dependents - roots)
 
 
 class DependentsSubsystem(LineOriented, GoalSubsystem):
@@ -5,10 +5,19 @@ from functools import partial
 
 import pytest
 
-from pants.backend.project_info.dependents import DependentsGoal, DependentsOutputFormat
+from pants.backend.project_info.dependents import (
+    AddressToDependents,
+    DependentsGoal,
+    DependentsOutputFormat,
+    DependentsRequest,
+    find_dependents,
+)
 from pants.backend.project_info.dependents import rules as dependent_rules
+from pants.engine.addresses import Address
 from pants.engine.target import Dependencies, SpecialCasedDependencies, Target
-from pants.testutil.rule_runner import RuleRunner
+from pants.testutil.rule_runner import RuleRunner, run_rule_with_mocks
+from pants.util.frozendict import FrozenDict
+from pants.util.ordered_set import FrozenOrderedSet
 
 
 class SpecialDeps(SpecialCasedDependencies):
@@ -109,6 +118,37 @@ def test_multiple_specified_targets(rule_runner: RuleRunner) -> None:
     )
 
 
+def test_find_dependents_with_cycle() -> None:
+    a, b, c, d = (Address("", target_name=name) for name in "abcd")
+    # `b` and `c` depend on one another, and `d` depends on `c`.
+    address_to_dependents = AddressToDependents(
+        FrozenDict(
+            {
+                a: FrozenOrderedSet([b]),
+                b: FrozenOrderedSet([c]),
+                c: FrozenOrderedSet([b, d]),
+            }
+        )
+    )
+
+    def find(roots: list[Address], *, transitive: bool, include_roots: bool) -> list[Address]:
+        return list(
+            run_rule_with_mocks(
+                find_dependents,
+                rule_args=[
+                    DependentsRequest(roots, transitive=transitive, include_roots=include_roots),
+                    address_to_dependents,
+                ],
+            )
+        )
+
+    assert find([a], transitive=False, include_roots=False) == [b]
+    assert find([a], transitive=True, include_roots=False) == [b, c, d]
+    assert find([b], transitive=True, include_roots=False) == [c, d]
+    assert find([b], transitive=True, include_roots=True) == [b, c, d]
+    assert find([d], transitive=True, include_roots=True) == [d]
+
+
 def test_special_cased_dependencies(rule_runner: RuleRunner) -> None:
     rule_runner.write_files({"special/BUILD": "tgt(special_deps=['intermediate'])"})
     assert_dependents(
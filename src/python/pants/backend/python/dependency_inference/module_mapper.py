@@ -10,7 +10,7 @@ import logging
 import os
 from collections import defaultdict
 from collections.abc import Iterable, Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import total_ordering
 from pathlib import PurePath
 from typing import DefaultDict
@@ -72,6 +72,93 @@ class PossibleModuleProvider:
     ancestry: int
 
 
+class _ModuleProvidersTrie:
+    """A trie of dotted module name components, holding the providers of each module per resolve.
+
+    Looking up a module walks its components once, and yields the providers of the module and of
+    each of its ancestors, for all resolves at the same time.
+    """
+
+    __slots__ = ("resolve_order", "root")
+
+    def __init__(
+        self,
+        resolves_to_modules_to_providers: Mapping[
+            ResolveName, Mapping[str, tuple[ModuleProvider, ...]]
+        ],
+    ) -> None:
+        self.resolve_order = {
+            resolve: i for i, resolve in enumerate(resolves_to_modules_to_providers)
+        }
+        self.root = _ModuleProvidersTrieNode()
+        for resolve, modules_to_providers in resolves_to_modules_to_providers.items():
+            for module, providers in modules_to_providers.items():
+                if not providers:
+                    continue
+                node = self.root
+                for component in module.split("."):
+                    node = node.child(component)
+                node.resolves_to_providers[resolve] = providers
+
+    def providers(
+        self, module: str, resolve: str | None, *, max_ancestry: int | None = None
+    ) -> tuple[PossibleModuleProvider, ...]:
+        """The providers of the nearest ancestor of `module` that has any, for each resolve.
+
+        An ancestry of 0 is the module itself, 1 is its parent, etc. Ancestors further away than
+        `max_ancestry` are not considered.
+        """
+        if resolve is not None and resolve not in self.resolve_order:
+            return ()
+        components = module.split(".")
+        path: list[_ModuleProvidersTrieNode] = []
+        node: _ModuleProvidersTrieNode | None = self.root
+        for component in components:
+            assert node is not None
+            node = node.children.get(component)
+            if node is None:
+                break
+            path.append(node)
+
+        found: dict[ResolveName, tuple[PossibleModuleProvider, ...]] = {}
+        for depth in range(len(path), 0, -1):
+            ancestry = len(components) - depth
+            if max_ancestry is not None and ancestry > max_ancestry:
+                break
+            resolves_to_providers = path[depth - 1].resolves_to_providers
+            if resolve is not None:
+                providers = resolves_to_providers.get(resolve)
+                if providers:
+                    return tuple(PossibleModuleProvider(mp, ancestry) for mp in providers)
+                continue
+            for provider_resolve, providers in resolves_to_providers.items():
+                if provider_resolve not in found:
+                    found[provider_resolve] = tuple(
+                        PossibleModuleProvider(mp, ancestry) for mp in providers
+                    )
+        if len(found) < 2:
+            return next(iter(found.values()), ())
+        return tuple(
+            itertools.chain.from_iterable(
+                found[r] for r in sorted(found, key=self.resolve_order.__getitem__)
+            )
+        )
+
+
+class _ModuleProvidersTrieNode:
+    __slots__ = ("children", "resolves_to_providers")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _ModuleProvidersTrieNode] = {}
+        self.resolves_to_providers: dict[ResolveName, tuple[ModuleProvider, ...]] = {}
+
+    def child(self, component: str) -> _ModuleProvidersTrieNode:
+        node = self.children.get(component)
+        if node is None:
+            node = self.children[component] = _ModuleProvidersTrieNode()
+        return node
+
+
 def module_from_stripped_path(path: PurePath) -> str:
     module_name_with_slashes = (
         path.parent if path.name in ("__init__.py", "__init__.pyi") else path.with_suffix("")
@@ -154,31 +241,12 @@ class FirstPartyPythonModuleMapping:
     implementations for each codegen backends.
     """
 
-    def _providers_for_resolve(
-        self, module: str, resolve: str
-    ) -> tuple[PossibleModuleProvider, ...]:
-        mapping = self.resolves_to_modules_to_providers.get(resolve)
-        if not mapping:
-            return ()
-
-        result = mapping.get(module, ())
-        if result:
-            return tuple(PossibleModuleProvider(provider, 0) for provider in result)
+    _trie: _ModuleProvidersTrie = field(init=False, repr=False, compare=False, hash=False)
 
-        # If the module is not found, try the parent, if any. This is to handle `from` imports
-        # where the "module" we were handed was actually a symbol inside the module.
-        # E.g., with `from my_project.app import App`, we would be passed "my_project.app.App".
-        #
-        # We do not look past the direct parent, as this could cause multiple ambiguous owners to
-        # be resolved. This contrasts with the third-party module mapping, which will try every
-        # ancestor.
-        # TODO: Now that we capture the ancestry, we could look past the direct parent.
-        #  One reason to do so would be to unify more of the FirstParty and ThirdParty impls.
-        if "." not in module:
-            return ()
-        parent_module = module.rsplit(".", maxsplit=1)[0]
-        parent_providers = mapping.get(parent_module, ())
-        return tuple(PossibleModuleProvider(mp, 1) for mp in parent_providers)
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "_trie", _ModuleProvidersTrie(self.resolves_to_modules_to_providers)
+        )
 
     def providers_for_module(
         self, module: str, resolve: str | None
@@ -188,14 +256,16 @@ class FirstPartyPythonModuleMapping:
         If `resolve` is None, will not consider resolves, i.e. any `python_source` et al can be
         used. Otherwise, providers can only come from first-party targets with the resolve.
         """
-        if resolve:
-            return self._providers_for_resolve(module, resolve)
-        return tuple(
-            itertools.chain.from_iterable(
-                self._providers_for_resolve(module, resolve)
-                for resolve in list(self.resolves_to_modules_to_providers.keys())
-            )
-        )
+        # If the module is not found, try the parent, if any. This is to handle `from` imports
+        # where the "module" we were handed was actually a symbol inside the module.
+        # E.g., with `from my_project.app import App`, we would be passed "my_project.app.App".
+        #
+        # We do not look past the direct parent, as this could cause multiple ambiguous owners to
+        # be resolved. This contrasts with the third-party module mapping, which will try every
+        # ancestor: a distribution owns everything beneath its top-level modules, whereas a
+        # first-party package's `__init__.py` does not own its undeclared submodules, and
+        # inferring it as their provider would hide the imports that nothing owns.
+        return self._trie.providers(module, resolve or None, max_ancestry=1)
 
 
 @rule(level=LogLevel.DEBUG)
@@ -280,24 +350,12 @@ class ThirdPartyPythonModuleMapping:
     resolves_to_modules_to_providers: FrozenDict[
         ResolveName, FrozenDict[str, tuple[ModuleProvider, ...]]
     ]
+    _trie: _ModuleProvidersTrie = field(init=False, repr=False, compare=False, hash=False)
 
-    def _providers_for_resolve(
-        self, module: str, resolve: str, ancestry: int = 0
-    ) -> tuple[PossibleModuleProvider, ...]:
-        mapping = self.resolves_to_modules_to_providers.get(resolve)
-        if not mapping:
-            return ()
-
-        result = mapping.get(module, ())
-        if result:
-            return tuple(PossibleModuleProvider(mp, ancestry) for mp in result)
-
-        # If the module is not found, recursively try the ancestor modules, if any. For example,
-        # pants.task.task.Task -> pants.task.task -> pants.task -> pants
-        if "." not in module:
-            return ()
-        parent_module = module.rsplit(".", maxsplit=1)[0]
-        return self._providers_for_resolve(parent_module, resolve, ancestry + 1)
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "_trie", _ModuleProvidersTrie(self.resolves_to_modules_to_providers)
+        )
 
     def providers_for_module(
         self, module: str, resolve: str | None
@@ -307,14 +365,9 @@ class ThirdPartyPythonModuleMapping:
         If `resolve` is None, will not consider resolves, i.e. any `python_requirement` can be
         consumed. Otherwise, providers can only come from `python_requirements` with the resolve.
         """
-        if resolve:
-            return self._providers_for_resolve(module, resolve)
-        return tuple(
-            itertools.chain.from_iterable(
-                self._providers_for_resolve(module, resolve)
-                for resolve in list(self.resolves_to_modules_to_providers.keys())
-            )
-        )
+        # If the module is not found, try the ancestor modules, if any. For example,
+        # pants.task.task.Task -> pants.task.task -> pants.task -> pants
+        return self._trie.providers(module, resolve or None)
 
 
 @functools.cache
@@ -410,6 +463,29 @@ async def map_third_party_modules_to_addresses(
     )
 
 
+@dataclass(frozen=True)
+class PythonModuleProviderResolves:
+    """The resolve of every address which provides a first-party or third-party module."""
+
+    value: FrozenDict[Address, ResolveName]
+
+
+@rule(desc="Creating map of Python module providers to their resolves", level=LogLevel.DEBUG)
+async def map_module_providers_to_resolves(
+    first_party_mapping: FirstPartyPythonModuleMapping,
+    third_party_mapping: ThirdPartyPythonModuleMapping,
+) -> PythonModuleProviderResolves:
+    return PythonModuleProviderResolves(
+        FrozenDict(
+            (provider.addr, resolve)
+            for mapping in (first_party_mapping, third_party_mapping)
+            for resolve, modules_to_providers in mapping.resolves_to_modules_to_providers.items()
+            for providers in modules_to_providers.values()
+            for provider in providers
+        )
+    )
+
+
 # -----------------------------------------------------------------------------------------------
 # module -> owners
 # -----------------------------------------------------------------------------------------------
@@ -450,15 +526,47 @@ class PythonModuleOwnersRequest:
     locality: str | None = None
 
 
-@rule
-async def map_module_to_address(
-    request: PythonModuleOwnersRequest,
+@dataclass(frozen=True)
+class PythonModulesOwnersRequest:
+    """Find the owners of many modules at once, e.g. all of the imports of a single file."""
+
+    modules: tuple[str, ...]
+    resolve: str | None
+    # See `PythonModuleOwnersRequest.locality`.
+    locality: str | None = None
+
+
+@dataclass(frozen=True)
+class PythonModulesOwners:
+    """The owners of each module of a `PythonModulesOwnersRequest`, in the same order."""
+
+    owners: tuple[PythonModuleOwners, ...]
+
+
+@functools.cache
+def _path_components(path: str) -> tuple[str, ...]:
+    return tuple(component for component in path.split(os.path.sep) if component not in ("", "."))
+
+
+def _common_prefix_len(a: tuple[str, ...], b: tuple[str, ...]) -> int:
+    n = 0
+    for x, y in zip(a, b):
+        if x != y:
+            break
+        n += 1
+    return n
+
+
+def _module_owners(
+    module: str,
+    resolve: str | None,
+    locality: tuple[str, ...] | None,
     first_party_mapping: FirstPartyPythonModuleMapping,
     third_party_mapping: ThirdPartyPythonModuleMapping,
 ) -> PythonModuleOwners:
     possible_providers: tuple[PossibleModuleProvider, ...] = (
-        *third_party_mapping.providers_for_module(request.module, resolve=request.resolve),
-        *first_party_mapping.providers_for_module(request.module, resolve=request.resolve),
+        *third_party_mapping.providers_for_module(module, resolve=resolve),
+        *first_party_mapping.providers_for_module(module, resolve=resolve),
     )
 
     # We first attempt to disambiguate conflicting providers by taking - for each provider type -
@@ -480,7 +588,7 @@ async def map_module_to_address(
         if possible_provider.ancestry == val[0]:
             val[1].append(possible_provider.provider)
 
-    if request.locality:
+    if locality is not None:
         # For each provider type, if we have more than one provider left, prefer
         # the one with the closest common ancestor to the requester.
         for val in type_to_closest_providers.values():
@@ -490,8 +598,10 @@ async def map_module_to_address(
             providers_with_closest_common_ancestor: list[ModuleProvider] = []
             closest_common_ancestor_len = 0
             for provider in providers:
-                common_ancestor_len = len(
-                    os.path.commonpath([request.locality, provider.addr.spec_path])
+                # NB: Both paths are relative to the build root, so the length of their common
+                # path only grows with the number of leading components they share.
+                common_ancestor_len = _common_prefix_len(
+                    locality, _path_components(provider.addr.spec_path)
                 )
                 if common_ancestor_len > closest_common_ancestor_len:
                     closest_common_ancestor_len = common_ancestor_len
@@ -512,6 +622,38 @@ async def map_module_to_address(
     return PythonModuleOwners(addresses)
 
 
+@rule
+async def map_module_to_address(
+    request: PythonModuleOwnersRequest,
+    first_party_mapping: FirstPartyPythonModuleMapping,
+    third_party_mapping: ThirdPartyPythonModuleMapping,
+) -> PythonModuleOwners:
+    return _module_owners(
+        request.module,
+        request.resolve,
+        _path_components(request.locality) if request.locality else None,
+        first_party_mapping,
+        third_party_mapping,
+    )
+
+
+@rule
+async def map_modules_to_addresses(
+    request: PythonModulesOwnersRequest,
+    first_party_mapping: FirstPartyPythonModuleMapping,
+    third_party_mapping: ThirdPartyPythonModuleMapping,
+) -> PythonModulesOwners:
+    locality = _path_components(request.locality) if request.locality else None
+    return PythonModulesOwners(
+        tuple(
+            _module_owners(
+                module, request.resolve, locality, first_party_mapping, third_party_mapping
+            )
+            for module in request.modules
+        )
+    )
+
+
 def rules():
     return (
         *collect_rules(),
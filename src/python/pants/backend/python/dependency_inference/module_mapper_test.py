@@ -34,6 +34,9 @@ from pants.backend.python.dependency_inference.module_mapper import (
     PossibleModuleProvider,
     PythonModuleOwners,
     PythonModuleOwnersRequest,
+    PythonModuleProviderResolves,
+    PythonModulesOwners,
+    PythonModulesOwnersRequest,
     ThirdPartyPythonModuleMapping,
     generate_mappings_from_pattern,
     module_from_stripped_path,
@@ -269,6 +272,8 @@ def rule_runner() -> RuleRunner:
             QueryRule(FirstPartyPythonModuleMapping, []),
             QueryRule(ThirdPartyPythonModuleMapping, []),
             QueryRule(PythonModuleOwners, [PythonModuleOwnersRequest]),
+            QueryRule(PythonModulesOwners, [PythonModulesOwnersRequest]),
+            QueryRule(PythonModuleProviderResolves, []),
         ],
         target_types=[
             PythonSourceTarget,
@@ -892,6 +897,19 @@ def test_resolving_ambiguity_by_filesystem_proximity(rule_runner: RuleRunner) ->
         Address("root2/aa/bb", relative_file_path="foo.py"),
     ]
 
+    # The batched request resolves each module the same way as an individual request.
+    modules = ("aa.bb.foo", "aa.bb.foo.Bar", "aa.cc.bar", "aa.unknown")
+    for locality in (None, "root1/", "root2/", "root3/"):
+        batched = rule_runner.request(
+            PythonModulesOwners, [PythonModulesOwnersRequest(modules, None, locality=locality)]
+        )
+        assert batched.owners == tuple(
+            rule_runner.request(
+                PythonModuleOwners, [PythonModuleOwnersRequest(module, None, locality=locality)]
+            )
+            for module in modules
+        )
+
 
 def test_map_module_considers_resolves(rule_runner: RuleRunner) -> None:
     rule_runner.write_files(
@@ -927,6 +945,11 @@ def test_map_module_considers_resolves(rule_runner: RuleRunner) -> None:
         Address("", target_name="dep2"),
     )
 
+    provider_resolves = rule_runner.request(PythonModuleProviderResolves, [])
+    assert provider_resolves.value == FrozenDict(
+        {Address("", target_name="dep1"): "a", Address("", target_name="dep2"): "b"}
+    )
+
 
 def test_issue_15111(rule_runner: RuleRunner) -> None:
     """Ensure we can handle when a single address provides multiple modules.
@@ -98,18 +98,23 @@ async def get_scripts_digest(scripts_package: str, filenames: Iterable[str]) ->
     return digest
 
 
+@dataclass(frozen=True)
+class _ParseStrippedPythonFileRequest:
+    """A digest holding a single Python source file, with its source root stripped.
+
+    Parsing depends only on this digest (i.e. the file's stripped path and content), so the result
+    is shared by every target and set of interpreter constraints which own the same file.
+    """
+
+    digest: Digest
+
+
 @rule(level=LogLevel.DEBUG)
-async def parse_python_dependencies(
-    request: ParsePythonDependenciesRequest,
+async def parse_stripped_python_file(
+    request: _ParseStrippedPythonFileRequest,
     python_infer_subsystem: PythonInferSubsystem,
 ) -> ParsedPythonDependencies:
-    stripped_sources = await strip_source_roots(**implicitly(SourceFilesRequest([request.source])))
-    # We operate on PythonSourceField, which should be one file.
-    assert len(stripped_sources.snapshot.files) == 1
-
-    native_result = await parse_python_deps(
-        NativeDependenciesRequest(stripped_sources.snapshot.digest)
-    )
+    native_result = await parse_python_deps(NativeDependenciesRequest(request.digest))
     imports = dict(native_result.imports)
     assets = set()
 
@@ -135,6 +140,19 @@ async def parse_python_dependencies(
     )
 
 
+@rule(level=LogLevel.DEBUG)
+async def parse_python_dependencies(
+    request: ParsePythonDependenciesRequest,
+) -> ParsedPythonDependencies:
+    stripped_sources = await strip_source_roots(**implicitly(SourceFilesRequest([request.source])))
+    # We operate on PythonSourceField, which should be one file.
+    assert len(stripped_sources.snapshot.files) == 1
+
+    return await parse_stripped_python_file(
+        _ParseStrippedPythonFileRequest(stripped_sources.snapshot.digest), **implicitly()
+    )
+
+
 def rules():
     return [
         *collect_rules(),
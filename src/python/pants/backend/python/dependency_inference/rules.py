@@ -16,9 +16,10 @@ from pants.backend.python.dependency_inference.default_unowned_dependencies impo
 )
 from pants.backend.python.dependency_inference.module_mapper import (
     PythonModuleOwners,
-    PythonModuleOwnersRequest,
+    PythonModulesOwnersRequest,
     ResolveName,
-    map_module_to_address,
+    map_module_providers_to_resolves,
+    map_modules_to_addresses,
 )
 from pants.backend.python.dependency_inference.parse_python_dependencies import (
     ParsedPythonAssetPaths,
@@ -248,64 +249,33 @@ class UnownedImportsPossibleOwnersRequest:
     original_resolve: str
 
 
-@dataclass(frozen=True)
-class UnownedImportPossibleOwnerRequest:
-    unowned_import: str
-    original_resolve: str
-
-
 @dataclass(frozen=True)
 class UnownedImportsPossibleOwners:
     value: dict[str, list[tuple[Address, ResolveName]]]
 
 
-@dataclass(frozen=True)
-class UnownedImportPossibleOwners:
-    value: list[tuple[Address, ResolveName]]
-
-
 async def _find_other_owners_for_unowned_imports(
     req: UnownedImportsPossibleOwnersRequest,
 ) -> UnownedImportsPossibleOwners:
-    individual_possible_owners = await concurrently(
-        find_other_owners_for_unowned_import(
-            UnownedImportPossibleOwnerRequest(r, req.original_resolve), **implicitly()
-        )
-        for r in req.unowned_imports
-    )
-
-    return UnownedImportsPossibleOwners(
-        {
-            imported_module: possible_owners.value
-            for imported_module, possible_owners in zip(
-                req.unowned_imports, individual_possible_owners
-            )
-            if possible_owners.value
-        }
-    )
-
-
-@rule
-async def find_other_owners_for_unowned_import(
-    req: UnownedImportPossibleOwnerRequest,
-    python_setup: PythonSetup,
-) -> UnownedImportPossibleOwners:
-    other_owner_from_other_resolves = await map_module_to_address(
-        PythonModuleOwnersRequest(req.unowned_import, resolve=None, locality=None), **implicitly()
-    )
-
-    owners = other_owner_from_other_resolves
-    other_owners_as_targets = await resolve_targets(
-        **implicitly(Addresses(owners.unambiguous + owners.ambiguous))
+    unowned_imports = tuple(req.unowned_imports)
+    owners_per_import, provider_resolves = await concurrently(
+        map_modules_to_addresses(
+            PythonModulesOwnersRequest(unowned_imports, resolve=None, locality=None),
+            **implicitly(),
+        ),
+        map_module_providers_to_resolves(**implicitly()),
     )
 
-    other_owners = []
-
-    for t in other_owners_as_targets:
-        other_owner_resolve = t[PythonResolveField].normalized_value(python_setup)
-        if other_owner_resolve != req.original_resolve:
-            other_owners.append((t.address, other_owner_resolve))
-    return UnownedImportPossibleOwners(other_owners)
+    imports_to_other_owners: dict[str, list[tuple[Address, ResolveName]]] = {}
+    for imported_module, owners in zip(unowned_imports, owners_per_import.owners):
+        other_owners = []
+        for address in owners.unambiguous + owners.ambiguous:
+            other_owner_resolve = provider_resolves.value[address]
+            if other_owner_resolve != req.original_resolve:
+                other_owners.append((address, other_owner_resolve))
+        if other_owners:
+            imports_to_other_owners[imported_module] = other_owners
+    return UnownedImportsPossibleOwners(imports_to_other_owners)
 
 
 async def _handle_unowned_imports(
@@ -423,16 +393,13 @@ async def resolve_parsed_dependencies(
         locality = source_root.path
 
     if parsed_imports:
-        owners_per_import = await concurrently(
-            map_module_to_address(
-                PythonModuleOwnersRequest(imported_module, request.resolve, locality),
-                **implicitly(),
-            )
-            for imported_module in parsed_imports
+        owners_per_import = await map_modules_to_addresses(
+            PythonModulesOwnersRequest(tuple(parsed_imports), request.resolve, locality),
+            **implicitly(),
         )
         resolve_results = _get_imports_info(
             address=request.field_set.address,
-            owners_per_import=owners_per_import,
+            owners_per_import=owners_per_import.owners,
             parsed_imports=parsed_imports,
             explicitly_provided_deps=explicitly_provided_deps,
         )
@@ -601,7 +568,6 @@ async def infer_python_conftest_dependencies(
 def import_rules():
     return [
         resolve_parsed_dependencies,
-        find_other_owners_for_unowned_import,
         infer_python_dependencies_via_source,
         *pex.rules(),
         *parse_python_dependencies.rules(),
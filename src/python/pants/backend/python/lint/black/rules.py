@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+import os
+from dataclasses import dataclass
 from typing import cast
 
 from pants.backend.python.lint.black.subsystem import Black, BlackFieldSet
@@ -10,12 +12,14 @@ from pants.backend.python.subsystems.setup import PythonSetup
 from pants.backend.python.util_rules import pex
 from pants.backend.python.util_rules.interpreter_constraints import InterpreterConstraints
 from pants.backend.python.util_rules.pex import VenvPexProcess, create_venv_pex
+from pants.core.goals.fix import known_clean_key
 from pants.core.goals.fmt import AbstractFmtRequest, FmtResult, FmtTargetsRequest, Partitions
 from pants.core.util_rules.config_files import find_config_file
 from pants.engine.fs import MergeDigests
 from pants.engine.intrinsics import merge_digests
 from pants.engine.process import execute_process_or_raise
 from pants.engine.rules import collect_rules, concurrently, implicitly, rule
+from pants.util.dirutil import recursive_dirname
 from pants.util.logging import LogLevel
 from pants.util.strutil import pluralize, softwrap
 
@@ -25,6 +29,16 @@ class BlackRequest(FmtTargetsRequest):
     tool_subsystem = Black
 
 
+@dataclass(frozen=True)
+class BlackPartitionMetadata:
+    interpreter_constraints: InterpreterConstraints
+    known_clean_key: str
+
+    @property
+    def description(self) -> str:
+        return self.interpreter_constraints.description
+
+
 async def _run_black(
     request: AbstractFmtRequest.Batch,
     black: Black,
@@ -102,17 +116,30 @@ async def partition_black(
         ):
             tool_interpreter_constraints = all_interpreter_constraints
 
+    filepaths = tuple(field_set.source.file_path for field_set in request.field_sets)
+    # NB: Batches look for config files in their own directories, and so the config files of all of
+    # the directories are a (conservative) key for the configuration of each batch.
+    dirs = {d for path in filepaths for d in recursive_dirname(os.path.dirname(path)) if d}
+    black_pex, config_files = await concurrently(
+        create_venv_pex(
+            **implicitly(black.to_pex_request(interpreter_constraints=tool_interpreter_constraints))
+        ),
+        find_config_file(black.config_request(dirs)),
+    )
+
     return Partitions.single_partition(
-        (field_set.source.file_path for field_set in request.field_sets),
-        metadata=tool_interpreter_constraints,
+        filepaths,
+        metadata=BlackPartitionMetadata(
+            tool_interpreter_constraints,
+            known_clean_key(black_pex.digest, config_files.snapshot.digest, args=black.args),
+        ),
     )
 
 
 @rule(desc="Format with Black", level=LogLevel.DEBUG)
 async def black_fmt(request: BlackRequest.Batch, black: Black) -> FmtResult:
-    return await _run_black(
-        request, black, cast(InterpreterConstraints, request.partition_metadata)
-    )
+    partition_metadata = cast(BlackPartitionMetadata, request.partition_metadata)
+    return await _run_black(request, black, partition_metadata.interpreter_constraints)
 
 
 def rules():
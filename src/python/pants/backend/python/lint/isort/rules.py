@@ -2,6 +2,7 @@
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 
 from pants.backend.python.lint.isort.skip_field import SkipIsortField
@@ -13,15 +14,16 @@ from pants.backend.python.util_rules.pex import (
     create_venv_pex,
     determine_venv_pex_resolve_info,
 )
-from pants.core.goals.fmt import FmtResult, FmtTargetsRequest
+from pants.core.goals.fix import known_clean_key
+from pants.core.goals.fmt import FmtResult, FmtTargetsRequest, Partitions
 from pants.core.util_rules.config_files import find_config_file
-from pants.core.util_rules.partitions import PartitionerType
 from pants.engine.fs import MergeDigests
 from pants.engine.intrinsics import merge_digests
 from pants.engine.process import ProcessExecutionFailure, execute_process_or_raise
 from pants.engine.rules import collect_rules, concurrently, implicitly, rule
 from pants.engine.target import FieldSet, Target
 from pants.option.global_options import KeepSandboxes
+from pants.util.dirutil import recursive_dirname
 from pants.util.logging import LogLevel
 from pants.util.strutil import pluralize
 
@@ -40,7 +42,15 @@ class IsortFieldSet(FieldSet):
 class IsortRequest(FmtTargetsRequest):
     field_set_type = IsortFieldSet
     tool_subsystem = Isort
-    partitioner_type = PartitionerType.DEFAULT_SINGLE_PARTITION
+
+
+@dataclass(frozen=True)
+class IsortPartitionMetadata:
+    known_clean_key: str
+
+    @property
+    def description(self) -> None:
+        return None
 
 
 def generate_argv(
@@ -66,6 +76,29 @@ def generate_argv(
     return tuple(args)
 
 
+@rule
+async def partition_isort(
+    request: IsortRequest.PartitionRequest, isort: Isort
+) -> Partitions[IsortPartitionMetadata]:
+    if isort.skip:
+        return Partitions()
+
+    filepaths = tuple(field_set.source.file_path for field_set in request.field_sets)
+    # NB: Batches look for config files in their own directories, and so the config files of all of
+    # the directories are a (conservative) key for the configuration of each batch.
+    dirs = {d for path in filepaths for d in recursive_dirname(os.path.dirname(path)) if d}
+    isort_pex, config_files = await concurrently(
+        create_venv_pex(**implicitly(isort.to_pex_request())),
+        find_config_file(isort.config_request(dirs)),
+    )
+    return Partitions.single_partition(
+        filepaths,
+        metadata=IsortPartitionMetadata(
+            known_clean_key(isort_pex.digest, config_files.snapshot.digest, args=isort.args)
+        ),
+    )
+
+
 @rule(desc="Format with isort", level=LogLevel.DEBUG)
 async def isort_fmt(
     request: IsortRequest.Batch, isort: Isort, keep_sandboxes: KeepSandboxes
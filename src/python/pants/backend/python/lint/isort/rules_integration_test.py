@@ -5,16 +5,21 @@ from __future__ import annotations
 
 import re
 from textwrap import dedent
+from typing import cast
 
 import pytest
 
 from pants.backend.python import target_types_rules
-from pants.backend.python.lint.isort.rules import IsortFieldSet, IsortRequest
+from pants.backend.python.lint.isort.rules import (
+    IsortFieldSet,
+    IsortPartitionMetadata,
+    IsortRequest,
+)
 from pants.backend.python.lint.isort.rules import rules as isort_rules
 from pants.backend.python.lint.isort.subsystem import Isort
 from pants.backend.python.lint.isort.subsystem import rules as isort_subsystem_rules
 from pants.backend.python.target_types import PythonSourcesGeneratorTarget
-from pants.core.goals.fmt import FmtResult
+from pants.core.goals.fmt import FmtResult, Partitions
 from pants.core.util_rules import config_files, source_files
 from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
 from pants.engine.addresses import Address
@@ -34,6 +39,7 @@ def rule_runner() -> RuleRunner:
             *config_files.rules(),
             *target_types_rules.rules(),
             QueryRule(FmtResult, (IsortRequest.Batch,)),
+            QueryRule(Partitions, (IsortRequest.PartitionRequest,)),
             QueryRule(SourceFiles, (SourceFilesRequest,)),
         ],
         target_types=[PythonSourcesGeneratorTarget],
@@ -141,6 +147,31 @@ def test_config_file(rule_runner: RuleRunner, path: str, extra_args: list[str])
     assert fmt_result.did_change is True
 
 
+def test_known_clean_key(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files({"dir/f.py": GOOD_FILE, "dir/BUILD": "python_sources(name='t')"})
+    tgt = rule_runner.get_target(Address("dir", target_name="t", relative_file_path="f.py"))
+
+    def known_clean_key(*extra_args: str) -> str:
+        rule_runner.set_options(
+            ["--backend-packages=pants.backend.python.lint.isort", *extra_args],
+            env_inherit={"PATH", "PYENV_ROOT", "HOME"},
+        )
+        partitions = rule_runner.request(
+            Partitions, [IsortRequest.PartitionRequest((IsortFieldSet.create(tgt),))]
+        )
+        assert len(partitions) == 1
+        assert partitions[0].elements == ("dir/f.py",)
+        metadata = cast(IsortPartitionMetadata, partitions[0].metadata)
+        return metadata.known_clean_key
+
+    key = known_clean_key()
+    assert known_clean_key() == key
+    # Changing the arguments or the (discovered) config of isort changes the key.
+    assert known_clean_key("--isort-args=--profile=black") != key
+    rule_runner.write_files({"dir/.isort.cfg": "[settings]\ncombine_as_imports=True\n"})
+    assert known_clean_key() != key
+
+
 def test_invalid_config_file(rule_runner: RuleRunner) -> None:
     """Reference https://github.com/pantsbuild/pants/issues/18618."""
 
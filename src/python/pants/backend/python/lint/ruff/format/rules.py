@@ -1,6 +1,7 @@
 # Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
+import os
 from dataclasses import dataclass
 
 from pants.backend.python.lint.ruff.common import RunRuffRequest, run_ruff
@@ -13,11 +14,14 @@ from pants.backend.python.target_types import (
     PythonSourceField,
 )
 from pants.backend.python.util_rules import pex
-from pants.core.goals.fmt import AbstractFmtRequest, FmtResult, FmtTargetsRequest
-from pants.core.util_rules.partitions import PartitionerType
+from pants.core.goals.fix import known_clean_key
+from pants.core.goals.fmt import AbstractFmtRequest, FmtResult, FmtTargetsRequest, Partitions
+from pants.core.util_rules.config_files import find_config_file
+from pants.core.util_rules.external_tool import download_external_tool
 from pants.engine.platform import Platform
-from pants.engine.rules import collect_rules, rule
+from pants.engine.rules import collect_rules, concurrently, rule
 from pants.engine.target import FieldSet, Target
+from pants.util.dirutil import recursive_dirname
 from pants.util.logging import LogLevel
 from pants.util.meta import classproperty
 
@@ -38,7 +42,6 @@ class RuffFormatFieldSet(FieldSet):
 class RuffFormatRequest(FmtTargetsRequest):
     field_set_type = RuffFormatFieldSet
     tool_subsystem = Ruff
-    partitioner_type = PartitionerType.DEFAULT_SINGLE_PARTITION
 
     @classproperty
     def tool_name(cls) -> str:
@@ -49,6 +52,38 @@ class RuffFormatRequest(FmtTargetsRequest):
         return "ruff-format"
 
 
+@dataclass(frozen=True)
+class RuffFormatPartitionMetadata:
+    known_clean_key: str
+
+    @property
+    def description(self) -> None:
+        return None
+
+
+@rule
+async def partition_ruff_fmt(
+    request: RuffFormatRequest.PartitionRequest, ruff: Ruff, platform: Platform
+) -> Partitions[RuffFormatPartitionMetadata]:
+    if ruff.skip:
+        return Partitions()
+
+    filepaths = tuple(field_set.source.file_path for field_set in request.field_sets)
+    # NB: Batches look for config files in their own directories, and so the config files of all of
+    # the directories are a (conservative) key for the configuration of each batch.
+    dirs = {d for path in filepaths for d in recursive_dirname(os.path.dirname(path)) if d}
+    ruff_tool, config_files = await concurrently(
+        download_external_tool(ruff.get_request(platform)),
+        find_config_file(ruff.config_request(dirs)),
+    )
+    return Partitions.single_partition(
+        filepaths,
+        metadata=RuffFormatPartitionMetadata(
+            known_clean_key(ruff_tool.digest, config_files.snapshot.digest, args=ruff.args)
+        ),
+    )
+
+
 # Note - this function is kept separate because it is invoked from update_build_files.py, but
 # not as a rule.
 async def _run_ruff_fmt(
@@ -10,6 +10,7 @@ from typing import cast
 from pants.backend.scala.lint.scalafmt.skip_field import SkipScalafmtField
 from pants.backend.scala.lint.scalafmt.subsystem import ScalafmtSubsystem
 from pants.backend.scala.target_types import ScalaSourceField
+from pants.core.goals.fix import known_clean_key
 from pants.core.goals.fmt import FmtResult, FmtTargetsRequest, Partitions
 from pants.core.goals.resolves import ExportableTool
 from pants.core.util_rules.config_files import (
@@ -71,6 +72,13 @@ class PartitionInfo:
     def description(self) -> str:
         return self.config_snapshot.files[0]
 
+    @property
+    def known_clean_key(self) -> str:
+        # The tool classpath captures the version of scalafmt, and the snapshot its configuration.
+        return known_clean_key(
+            *self.extra_immutable_input_digests.values(), self.config_snapshot.digest
+        )
+
 
 @rule
 async def partition_scalafmt(
@@ -2,7 +2,8 @@
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 import json
 import logging
-from typing import Any
+from enum import Enum
+from typing import IO, Any
 
 from pants.engine.internals.scheduler import Workunit
 from pants.engine.rules import collect_rules, rule
@@ -13,34 +14,36 @@ from pants.engine.streaming_workunit_handler import (
     WorkunitsCallbackFactoryRequest,
 )
 from pants.engine.unions import UnionRule
-from pants.option.option_types import BoolOption, StrOption
+from pants.option.option_types import BoolOption, EnumOption, IntOption, StrOption
 from pants.option.subsystem import Subsystem
 from pants.util.dirutil import safe_open
+from pants.util.strutil import softwrap
 
 logger = logging.getLogger(__name__)
 
 
+_WORKUNIT_KEYS = frozenset(
+    (
+        "name",
+        "span_id",
+        "level",
+        "parent_id",
+        "start_secs",
+        "start_nanos",
+        "description",
+        "duration_secs",
+        "duration_nanos",
+        "metadata",
+    )
+)
+
+
+def just_dump(workunit):
+    return {k: v for k, v in workunit.items() if k in _WORKUNIT_KEYS}
+
+
 def just_dump_map(workunits_map):
-    return [
-        {
-            k: v
-            for k, v in wu.items()
-            if k
-            in (
-                "name",
-                "span_id",
-                "level",
-                "parent_id",
-                "start_secs",
-                "start_nanos",
-                "description",
-                "duration_secs",
-                "duration_nanos",
-                "metadata",
-            )
-        }
-        for wu in workunits_map.values()
-    ]
+    return [just_dump(wu) for wu in workunits_map.values()]
 
 
 def pass_through_unserializable_metadata(obj):
@@ -86,6 +89,81 @@ class WorkunitLoggerCallback(WorkunitsCallback):
                 logger.info(f"Wrote log to {filepath}")
 
 
+class StreamingWorkunitWriter:
+    """Incrementally writes completed workunits to a file, as newline-delimited JSON records.
+
+    Encoded records are buffered in memory until `max_buffered` of them have accumulated (or until
+    `flush` is called), so memory usage is bounded regardless of how many workunits a run has.
+    """
+
+    def __init__(self, filepath: str, max_buffered: int) -> None:
+        self.filepath = filepath
+        self.max_buffered = max_buffered
+        self.written = 0
+        self._buffer: list[str] = []
+        self._file: IO[str] | None = None
+
+    def add(self, workunits: tuple[Workunit, ...]) -> None:
+        for wu in workunits:
+            self._buffer.append(
+                json.dumps(just_dump(wu), default=pass_through_unserializable_metadata)
+            )
+            if len(self._buffer) >= self.max_buffered:
+                self.flush()
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        if self._file is None:
+            self._file = safe_open(self.filepath, "w")
+        self._file.write("\n".join(self._buffer))
+        self._file.write("\n")
+        self.written += len(self._buffer)
+        self._buffer.clear()
+
+    def close(self) -> None:
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class StreamingWorkunitLoggerCallback(WorkunitsCallback):
+    """Writes completed workunits as they are polled, rather than retaining them until the end."""
+
+    def __init__(self, wulogger: "WorkunitLogger"):
+        self.wulogger = wulogger
+        self._writer: StreamingWorkunitWriter | None = None
+
+    @property
+    def can_finish_async(self) -> bool:
+        return False
+
+    def __call__(
+        self,
+        *,
+        completed_workunits: tuple[Workunit, ...],
+        started_workunits: tuple[Workunit, ...],
+        context: StreamingWorkunitContext,
+        finished: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        if self._writer is None:
+            self._writer = StreamingWorkunitWriter(
+                f"{self.wulogger.logdir}/{context.run_tracker.run_id}.ndjson",
+                self.wulogger.max_buffered_workunits,
+            )
+        self._writer.add(completed_workunits)
+        if finished:
+            self._writer.close()
+            logger.info(f"Wrote {self._writer.written} workunits to {self._writer.filepath}")
+
+
+class WorkunitLogFormat(Enum):
+    json = "json"
+    ndjson = "ndjson"
+
+
 class WorkunitLoggerCallbackFactoryRequest:
     """A unique request type that is installed to trigger construction of our WorkunitsCallback."""
 
@@ -96,6 +174,31 @@ class WorkunitLogger(Subsystem):
 
     enabled = BoolOption("--enabled", default=False, help="Whether to enable workunit logging.")
     logdir = StrOption("--logdir", default=".pants.d", help="Where to write the log to.")
+    format = EnumOption(
+        default=WorkunitLogFormat.json,
+        help=softwrap(
+            """
+            The format to write the log in.
+
+            With `json`, completed workunits are held in memory until the end of the run, and then
+            written as a single JSON array to `<logdir>/<run_id>.json`.
+
+            With `ndjson`, completed workunits are written incrementally while the run progresses,
+            one JSON object per line, to `<logdir>/<run_id>.ndjson`. This bounds memory usage, and
+            so is preferable for very large runs.
+            """
+        ),
+    )
+    max_buffered_workunits = IntOption(
+        default=1000,
+        advanced=True,
+        help=softwrap(
+            """
+            When `--format=ndjson`, the maximum number of completed workunits to buffer in memory
+            before writing them to the log.
+            """
+        ),
+    )
 
 
 @rule
@@ -103,9 +206,14 @@ async def construct_callback(
     _: WorkunitLoggerCallbackFactoryRequest,
     wulogger: WorkunitLogger,
 ) -> WorkunitsCallbackFactory:
-    return WorkunitsCallbackFactory(
-        lambda: WorkunitLoggerCallback(wulogger) if wulogger.enabled else None
-    )
+    def create() -> WorkunitsCallback | None:
+        if not wulogger.enabled:
+            return None
+        if wulogger.format == WorkunitLogFormat.ndjson:
+            return StreamingWorkunitLoggerCallback(wulogger)
+        return WorkunitLoggerCallback(wulogger)
+
+    return WorkunitsCallbackFactory(create)
 
 
 def rules():
@@ -0,0 +1,42 @@
+# Copyright 2025 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from pants.backend.tools.workunit_logger.rules import StreamingWorkunitWriter
+
+
+def workunit(span_id: str) -> dict:
+    return {"name": "wu", "span_id": span_id, "level": "INFO", "artifacts": {}}
+
+
+def test_streaming_writer_buffers_and_flushes(tmp_path: Path) -> None:
+    log = tmp_path / "logs" / "run.ndjson"
+    writer = StreamingWorkunitWriter(str(log), max_buffered=2)
+
+    # Nothing is written until the buffer is full.
+    writer.add((workunit("1"),))
+    assert not log.exists()
+
+    writer.add((workunit("2"), workunit("3")))
+    writer.close()
+
+    records = [json.loads(line) for line in log.read_text().splitlines()]
+    # Only the selected keys are recorded.
+    assert records == [
+        {"name": "wu", "span_id": span_id, "level": "INFO"} for span_id in ("1", "2", "3")
+    ]
+    assert writer.written == 3
+
+
+def test_streaming_writer_unserializable_metadata(tmp_path: Path) -> None:
+    log = tmp_path / "run.ndjson"
+    writer = StreamingWorkunitWriter(str(log), max_buffered=10)
+    writer.add(({"span_id": "1", "metadata": {"obj": object()}},))
+    writer.close()
+
+    (record,) = (json.loads(line) for line in log.read_text().splitlines())
+    assert record["metadata"]["obj"]["json_serializable"] is False
@@ -5,8 +5,9 @@ import logging
 import os
 import sys
 import time
+from collections.abc import Iterator
 from contextlib import contextmanager
-from threading import Lock
+from threading import Condition
 
 from pants.base.exiter import PANTS_FAILED_EXIT_CODE, ExitCode
 from pants.bin.local_pants_runner import LocalPantsRunner
@@ -14,7 +15,7 @@ from pants.engine.env_vars import CompleteEnvironmentVars
 from pants.engine.internals.native_engine import PySessionCancellationLatch
 from pants.init.logging import stdio_destination
 from pants.option.options_bootstrapper import OptionsBootstrapper
-from pants.pantsd.pants_daemon_core import PantsDaemonCore
+from pants.pantsd.pants_daemon_core import PantsDaemonCore, SchedulerRestartRequired
 
 logger = logging.getLogger(__name__)
 
@@ -24,12 +25,25 @@ class ExclusiveRequestTimeout(Exception):
 
 
 class DaemonPantsRunner:
-    """A RawFdRunner (callable) that will be called for each client request to Pantsd."""
+    """A RawFdRunner (callable) that will be called for each client request to Pantsd.
+
+    Runs which can share the current scheduler (see `PantsDaemonCore.can_share_scheduler`) run
+    concurrently with one another, except that at most one of them may write to the workspace (see
+    `PantsDaemonCore.goals_writing_to_workspace`). Runs which might need to (re)initialize the
+    scheduler run exclusively.
+    """
 
     def __init__(self, core: PantsDaemonCore) -> None:
         super().__init__()
         self._core = core
-        self._run_lock = Lock()
+        # Guards the following fields, and is notified whenever a run completes.
+        self._run_condition = Condition()
+        self._shared_runs = 0
+        self._shared_run_writing_to_workspace = False
+        self._exclusive_run = False
+        # Runs waiting for exclusive access block new shared runs, so that a steady stream of
+        # shared runs cannot starve them.
+        self._exclusive_waiters = 0
 
     @staticmethod
     def _send_stderr(stderr_fileno: int, msg: str) -> None:
@@ -40,16 +54,83 @@ class DaemonPantsRunner:
         with os.fdopen(stderr_fileno, mode="w", closefd=False) as stderr:
             print(msg, file=stderr, flush=True)
 
+    @staticmethod
+    def _max_shared_runs(options_bootstrapper: OptionsBootstrapper) -> int:
+        # NB: Each run's `@goal_rule` blocks an engine thread for its duration, so we leave at least
+        # one core thread free. See the `--rule-threads-core` validation in `GlobalOptions`. This
+        # means that runs only share the scheduler when `--rule-threads-core` is at least 3.
+        rule_threads_core = int(
+            options_bootstrapper.bootstrap_options.for_global_scope().rule_threads_core
+        )
+        return max(1, rule_threads_core - 1)
+
+    def _try_acquire(
+        self, *, shared: bool, writes_to_workspace: bool, max_shared_runs: int, timeout: float
+    ) -> bool:
+        def available() -> bool:
+            if self._exclusive_run:
+                return False
+            if shared:
+                return (
+                    self._exclusive_waiters == 0
+                    and self._shared_runs < max_shared_runs
+                    and not (writes_to_workspace and self._shared_run_writing_to_workspace)
+                )
+            return self._shared_runs == 0
+
+        with self._run_condition:
+            if not self._run_condition.wait_for(available, timeout=timeout):
+                return False
+            if shared:
+                self._shared_runs += 1
+                if writes_to_workspace:
+                    self._shared_run_writing_to_workspace = True
+            else:
+                self._exclusive_run = True
+            return True
+
+    def _release(self, *, shared: bool, writes_to_workspace: bool) -> None:
+        with self._run_condition:
+            if shared:
+                self._shared_runs -= 1
+                if writes_to_workspace:
+                    self._shared_run_writing_to_workspace = False
+            else:
+                self._exclusive_run = False
+            self._run_condition.notify_all()
+
+    @contextmanager
+    def _waiting_for_exclusive_access(self, shared: bool) -> Iterator[None]:
+        if shared:
+            yield
+            return
+        with self._run_condition:
+            self._exclusive_waiters += 1
+        try:
+            yield
+        finally:
+            with self._run_condition:
+                self._exclusive_waiters -= 1
+                self._run_condition.notify_all()
+
     @contextmanager
-    def _one_run_at_a_time(
-        self, stderr_fileno: int, cancellation_latch: PySessionCancellationLatch, timeout: float
+    def _scheduler_access(
+        self,
+        stderr_fileno: int,
+        cancellation_latch: PySessionCancellationLatch,
+        timeout: float,
+        *,
+        shared: bool = False,
+        writes_to_workspace: bool = False,
+        max_shared_runs: int = 1,
     ):
-        """Acquires exclusive access within the daemon.
+        """Acquires either shared or exclusive access within the daemon.
 
-        Periodically prints a message on the given stderr_fileno while exclusive access cannot be
-        acquired.
+        A shared run which writes to the workspace additionally waits for any other such run.
 
-        TODO: This method will be removed as part of #7654, so it currently polls the lock and
+        Periodically prints a message on the given stderr_fileno while access cannot be acquired.
+
+        TODO: This method will be removed as part of #7654, so it currently polls the condition and
         cancellation latch rather than waiting for both of them asynchronously, which would be a bit
         cleaner.
         """
@@ -63,36 +144,68 @@ class DaemonPantsRunner:
         def should_keep_polling(now):
             return not cancellation_latch.is_cancelled() and (not deadline or deadline > now)
 
-        acquired = self._run_lock.acquire(blocking=False)
-        if not acquired:
-            # If we don't acquire immediately, send an explanation.
-            length = "forever" if should_poll_forever else f"up to {timeout} seconds"
-            self._send_stderr(
-                stderr_fileno,
-                f"Another pants invocation is running. Will wait {length} for it to finish before giving up.\n"
-                "If you don't want to wait for the first run to finish, please press Ctrl-C and run "
-                "this command with PANTS_CONCURRENT=True in the environment.\n",
+        with self._waiting_for_exclusive_access(shared):
+            acquired = self._try_acquire(
+                shared=shared,
+                writes_to_workspace=writes_to_workspace,
+                max_shared_runs=max_shared_runs,
+                timeout=0,
             )
-        while True:
-            now = time.time()
-            if acquired:
-                try:
-                    yield
-                    break
-                finally:
-                    self._run_lock.release()
-            elif should_keep_polling(now):
-                if now > render_deadline:
-                    self._send_stderr(
-                        stderr_fileno,
-                        f"Waiting for invocation to finish (waited for {int(now - start)}s so far)...\n",
-                    )
-                    render_deadline = now + render_timeout
-                acquired = self._run_lock.acquire(blocking=True, timeout=0.1)
-            else:
-                raise ExclusiveRequestTimeout(
-                    "Timed out while waiting for another pants invocation to finish."
+            if not acquired:
+                # If we don't acquire immediately, send an explanation.
+                length = "forever" if should_poll_forever else f"up to {timeout} seconds"
+                self._send_stderr(
+                    stderr_fileno,
+                    f"Another pants invocation is running. Will wait {length} for it to finish before giving up.\n"
+                    "If you don't want to wait for the first run to finish, please press Ctrl-C and run "
+                    "this command with PANTS_CONCURRENT=True in the environment.\n",
                 )
+            while True:
+                now = time.time()
+                if acquired:
+                    try:
+                        yield
+                        break
+                    finally:
+                        self._release(shared=shared, writes_to_workspace=writes_to_workspace)
+                elif should_keep_polling(now):
+                    if now > render_deadline:
+                        self._send_stderr(
+                            stderr_fileno,
+                            f"Waiting for invocation to finish (waited for {int(now - start)}s so far)...\n",
+                        )
+                        render_deadline = now + render_timeout
+                    acquired = self._try_acquire(
+                        shared=shared,
+                        writes_to_workspace=writes_to_workspace,
+                        max_shared_runs=max_shared_runs,
+                        timeout=0.1,
+                    )
+                else:
+                    raise ExclusiveRequestTimeout(
+                        "Timed out while waiting for another pants invocation to finish."
+                    )
+
+    def _run_sharing(self, args: tuple[str, ...], env: dict[str, str]) -> tuple[bool, bool, int]:
+        """Returns whether a run may share the current scheduler, whether it might write to the
+        workspace, and how many shared runs may run concurrently."""
+        try:
+            options_bootstrapper = OptionsBootstrapper.create(
+                args=args, env=env, allow_pantsrc=True
+            )
+            if not self._core.can_share_scheduler(options_bootstrapper):
+                return False, True, 1
+            goals_writing_to_workspace = self._core.goals_writing_to_workspace(
+                options_bootstrapper, CompleteEnvironmentVars(env)
+            )
+            return (
+                True,
+                bool(goals_writing_to_workspace),
+                self._max_shared_runs(options_bootstrapper),
+            )
+        except Exception:
+            # Run exclusively: the error will be reported to the client by `single_daemonized_run`.
+            return False, True, 1
 
     def single_daemonized_run(
         self,
@@ -100,12 +213,17 @@ class DaemonPantsRunner:
         env: dict[str, str],
         working_dir: str,
         cancellation_latch: PySessionCancellationLatch,
+        *,
+        allow_scheduler_restart: bool = True,
     ) -> ExitCode:
         """Run a single daemonized run of Pants.
 
         All aspects of the `sys` global should already have been replaced in `__call__`, so this
         method should not need any special handling for the fact that it's running in a proxied
         environment.
+
+        Raises `SchedulerRestartRequired` if `allow_scheduler_restart` is False and the run would
+        need to restart the scheduler.
         """
 
         try:
@@ -129,7 +247,9 @@ class DaemonPantsRunner:
 
             # Run using the pre-warmed Session.
             complete_env = CompleteEnvironmentVars(env)
-            scheduler, options_initializer = self._core.prepare(options_bootstrapper, complete_env)
+            scheduler, options_initializer = self._core.prepare(
+                options_bootstrapper, complete_env, allow_restart=allow_scheduler_restart
+            )
             runner = LocalPantsRunner.create(
                 complete_env,
                 working_dir,
@@ -139,6 +259,8 @@ class DaemonPantsRunner:
                 cancellation_latch=cancellation_latch,
             )
             return runner.run(start_time)
+        except SchedulerRestartRequired:
+            raise
         except Exception as e:
             logger.exception(e)
             return PANTS_FAILED_EXIT_CODE
@@ -158,23 +280,36 @@ class DaemonPantsRunner:
         stderr_fileno: int,
     ) -> ExitCode:
         request_timeout = float(env.get("PANTSD_REQUEST_TIMEOUT_LIMIT", -1))
-        # NB: Order matters: we acquire a lock before mutating either `sys.std*`, `os.environ`, etc.
-        with self._one_run_at_a_time(
-            stderr_fileno,
-            cancellation_latch=cancellation_latch,
-            timeout=request_timeout,
-        ):
-            # NB: `single_daemonized_run` implements exception handling, so only the most primitive
-            # errors will escape this function, where they will be logged by the server.
-            logger.info(f"handling request: `{' '.join(args)}`")
-            try:
-                with stdio_destination(
-                    stdin_fileno=stdin_fileno,
-                    stdout_fileno=stdout_fileno,
-                    stderr_fileno=stderr_fileno,
-                ):
-                    return self.single_daemonized_run(
-                        ((command,) + args), env, working_dir, cancellation_latch
-                    )
-            finally:
-                logger.info(f"request completed: `{' '.join(args)}`")
+        shared, writes_to_workspace, max_shared_runs = self._run_sharing(((command,) + args), env)
+        while True:
+            # NB: Order matters: we acquire access before redirecting stdio. Because stdio is
+            # redirected per-thread, runs which share the scheduler do not interfere with one another.
+            with self._scheduler_access(
+                stderr_fileno,
+                cancellation_latch=cancellation_latch,
+                timeout=request_timeout,
+                shared=shared,
+                writes_to_workspace=writes_to_workspace,
+                max_shared_runs=max_shared_runs,
+            ):
+                # NB: `single_daemonized_run` implements exception handling, so only the most
+                # primitive errors will escape this function, where they will be logged by the server.
+                logger.info(f"handling request: `{' '.join(args)}`")
+                try:
+                    with stdio_destination(
+                        stdin_fileno=stdin_fileno,
+                        stdout_fileno=stdout_fileno,
+                        stderr_fileno=stderr_fileno,
+                    ):
+                        return self.single_daemonized_run(
+                            ((command,) + args),
+                            env,
+                            working_dir,
+                            cancellation_latch,
+                            allow_scheduler_restart=not shared,
+                        )
+                except SchedulerRestartRequired as e:
+                    logger.info(f"{e}: retrying request with exclusive access.")
+                finally:
+                    logger.info(f"request completed: `{' '.join(args)}`")
+            shared = False
@@ -0,0 +1,162 @@
+# Copyright 2025 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import contextlib
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from unittest import mock
+
+import pytest
+
+from pants.bin.daemon_pants_runner import DaemonPantsRunner, ExclusiveRequestTimeout
+from pants.pantsd.pants_daemon_core import SchedulerRestartRequired
+
+
+class FakeCancellationLatch:
+    def is_cancelled(self) -> bool:
+        return False
+
+
+@pytest.fixture
+def stderr_fileno() -> Iterator[int]:
+    fd = os.open(os.devnull, os.O_WRONLY)
+    try:
+        yield fd
+    finally:
+        os.close(fd)
+
+
+def scheduler_access(
+    runner: DaemonPantsRunner,
+    stderr_fileno: int,
+    *,
+    shared: bool,
+    writes_to_workspace: bool = False,
+    max_shared_runs: int = 2,
+    timeout: float = -1,
+):
+    return runner._scheduler_access(
+        stderr_fileno,
+        FakeCancellationLatch(),  # type: ignore[arg-type]
+        timeout,
+        shared=shared,
+        writes_to_workspace=writes_to_workspace,
+        max_shared_runs=max_shared_runs,
+    )
+
+
+def wait_until(condition: Callable[[], bool], timeout: float = 5) -> None:
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline, "Timed out waiting for condition."
+        time.sleep(0.01)
+
+
+def test_shared_runs_are_concurrent(stderr_fileno: int) -> None:
+    runner = DaemonPantsRunner(mock.Mock())
+    with scheduler_access(runner, stderr_fileno, shared=True):
+        with scheduler_access(runner, stderr_fileno, shared=True):
+            assert runner._shared_runs == 2
+            # Shared runs are capped...
+            with (
+                pytest.raises(ExclusiveRequestTimeout),
+                scheduler_access(runner, stderr_fileno, shared=True, timeout=0.2),
+            ):
+                pass
+        # ...and exclude exclusive runs.
+        with (
+            pytest.raises(ExclusiveRequestTimeout),
+            scheduler_access(runner, stderr_fileno, shared=False, timeout=0.2),
+        ):
+            pass
+    assert runner._shared_runs == 0
+    assert not runner._exclusive_run
+
+
+def test_shared_runs_writing_to_workspace_exclude_one_another(stderr_fileno: int) -> None:
+    runner = DaemonPantsRunner(mock.Mock())
+    with scheduler_access(runner, stderr_fileno, shared=True, writes_to_workspace=True):
+        # A run which only reads from the workspace does not wait for the writing run...
+        with scheduler_access(runner, stderr_fileno, shared=True):
+            assert runner._shared_runs == 2
+        # ...but another writing run does.
+        with (
+            pytest.raises(ExclusiveRequestTimeout),
+            scheduler_access(
+                runner, stderr_fileno, shared=True, writes_to_workspace=True, timeout=0.2
+            ),
+        ):
+            pass
+    assert not runner._shared_run_writing_to_workspace
+    with scheduler_access(runner, stderr_fileno, shared=True, writes_to_workspace=True):
+        assert runner._shared_run_writing_to_workspace
+    assert runner._shared_runs == 0
+
+
+def test_exclusive_run_waits_for_shared_runs(stderr_fileno: int) -> None:
+    runner = DaemonPantsRunner(mock.Mock())
+    acquired_exclusive = threading.Event()
+
+    def exclusive_run() -> None:
+        with scheduler_access(runner, stderr_fileno, shared=False):
+            assert runner._shared_runs == 0
+            acquired_exclusive.set()
+
+    with scheduler_access(runner, stderr_fileno, shared=True):
+        thread = threading.Thread(target=exclusive_run, daemon=True)
+        thread.start()
+        wait_until(lambda: runner._exclusive_waiters == 1)
+        assert not acquired_exclusive.is_set()
+        # A waiting exclusive run blocks new shared runs, so that it cannot be starved.
+        with (
+            pytest.raises(ExclusiveRequestTimeout),
+            scheduler_access(runner, stderr_fileno, shared=True, timeout=0.2),
+        ):
+            pass
+    thread.join(timeout=5)
+    assert acquired_exclusive.is_set()
+    assert runner._exclusive_waiters == 0
+    assert not runner._exclusive_run
+
+
+def test_shared_run_retried_exclusively_on_restart(
+    monkeypatch: pytest.MonkeyPatch, stderr_fileno: int
+) -> None:
+    runner = DaemonPantsRunner(mock.Mock())
+    calls = []
+
+    def single_daemonized_run(
+        args, env, working_dir, cancellation_latch, *, allow_scheduler_restart: bool
+    ) -> int:
+        calls.append((allow_scheduler_restart, runner._shared_runs, runner._exclusive_run))
+        if not allow_scheduler_restart:
+            raise SchedulerRestartRequired("The options changed.")
+        return 0
+
+    monkeypatch.setattr(runner, "_run_sharing", lambda args, env: (True, False, 2))
+    monkeypatch.setattr(runner, "single_daemonized_run", single_daemonized_run)
+    monkeypatch.setattr(
+        "pants.bin.daemon_pants_runner.stdio_destination",
+        lambda **kwargs: contextlib.nullcontext(),
+    )
+
+    exit_code = runner(
+        "pants",
+        ("list", "::"),
+        {},
+        "/",
+        FakeCancellationLatch(),  # type: ignore[arg-type]
+        0,
+        1,
+        stderr_fileno,
+    )
+    assert exit_code == 0
+    # The run first shared the scheduler without being allowed to restart it, and was then
+    # retried with exclusive access.
+    assert calls == [(False, 1, False), (True, 0, True)]
+    assert runner._shared_runs == 0
+    assert not runner._exclusive_run
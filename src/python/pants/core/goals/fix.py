@@ -3,11 +3,14 @@
 
 from __future__ import annotations
 
+import hashlib
 import itertools
+import json
 import logging
+import time
 from collections import defaultdict
 from collections.abc import Callable, Coroutine, Iterable, Iterator, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, ClassVar, NamedTuple, Protocol, TypeVar
 
 from pants.base.specs import Specs
@@ -19,25 +22,45 @@ from pants.core.goals.lint import (
     _MultiToolGoalSubsystem,
     get_partitions_by_request_type,
 )
-from pants.core.goals.multi_tool_goal_helper import BatchSizeOption, OnlyOption
+from pants.core.goals.multi_tool_goal_helper import (
+    BatchSizeOption,
+    KnownCleanFileOption,
+    OnlyOption,
+)
 from pants.core.util_rules.partitions import PartitionerType, PartitionMetadataT
 from pants.core.util_rules.partitions import Partitions as UntypedPartitions
 from pants.engine.collection import Collection
 from pants.engine.console import Console
 from pants.engine.engine_aware import EngineAwareReturnType
 from pants.engine.environment import EnvironmentName
-from pants.engine.fs import MergeDigests, PathGlobs, Snapshot, SnapshotDiff, Workspace
+from pants.engine.fs import (
+    Digest,
+    FileEntry,
+    MergeDigests,
+    PathGlobs,
+    Snapshot,
+    SnapshotDiff,
+    Workspace,
+)
 from pants.engine.goal import Goal, GoalSubsystem
-from pants.engine.intrinsics import digest_to_snapshot, merge_digests
-from pants.engine.process import FallibleProcessResult, ProcessResult
+from pants.engine.internals.session import RunId
+from pants.engine.intrinsics import (
+    digest_to_snapshot,
+    get_digest_entries,
+    merge_digests,
+    path_globs_to_digest,
+)
+from pants.engine.process import FallibleProcessResult, ProcessResult, ProcessResultMetadata
 from pants.engine.rules import collect_rules, concurrently, goal_rule, implicitly, rule
 from pants.engine.unions import UnionMembership, UnionRule, distinct_union_type_per_subclass, union
 from pants.option.option_types import BoolOption
 from pants.util.collections import partition_sequentially
+from pants.util.dirutil import safe_open
 from pants.util.docutil import bin_name, doc_url
 from pants.util.logging import LogLevel
 from pants.util.ordered_set import FrozenOrderedSet
-from pants.util.strutil import Simplifier, softwrap
+from pants.util.strutil import Simplifier, pluralize, softwrap
+from pants.version import VERSION
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +72,9 @@ class FixResult(EngineAwareReturnType):
     stdout: str
     stderr: str
     tool_name: str
+    # The metadata of the tool's process, if there was one. Like a `ProcessResult`'s metadata, it
+    # varies between runs, and so is not part of the identity of the result.
+    result_metadata: ProcessResultMetadata | None = field(default=None, compare=False, hash=False)
 
     @staticmethod
     async def create(
@@ -63,6 +89,7 @@ class FixResult(EngineAwareReturnType):
             stdout=output_simplifier.simplify(process_result.stdout),
             stderr=output_simplifier.simplify(process_result.stderr),
             tool_name=request.tool_name,
+            result_metadata=process_result.metadata,
         )
 
     def __post_init__(self):
@@ -245,6 +272,7 @@ class FixSubsystem(GoalSubsystem):
         ),
     )
     batch_size = BatchSizeOption(uppercase="Fixer", lowercase="fixer")
+    experimental_known_clean_file = KnownCleanFileOption("fixer")
 
 
 class Fix(Goal):
@@ -265,9 +293,17 @@ async def _write_files(workspace: Workspace, batched_results: Iterable[_FixBatch
         workspace.write_digest(merged_digest)
 
 
+_SOURCE_MAP = {
+    ProcessResultMetadata.Source.MEMOIZED: "memoized",
+    ProcessResultMetadata.Source.HIT_LOCALLY: "cached locally",
+    ProcessResultMetadata.Source.HIT_REMOTELY: "cached remotely",
+}
+
+
 def _print_results(
     console: Console,
     results: Iterable[FixResult],
+    run_id: RunId,
 ):
     if results:
         console.print_stderr("")
@@ -286,7 +322,22 @@ def _print_results(
         else:
             sigil = console.sigil_succeeded()
             status = "made no changes"
-        console.print_stderr(f"{sigil} {tool} {status}.")
+        # NB: This is the time that the tool spent running across the batches which ran in this
+        # run, some of which may have run concurrently. Batches which were memoized or cached did
+        # not run, and so are labeled by their source rather than timed.
+        elapsed_ms = []
+        sources = set()
+        for result in results:
+            if result.result_metadata is None:
+                continue
+            source = result.result_metadata.source(run_id)
+            if source != ProcessResultMetadata.Source.RAN:
+                sources.add(_SOURCE_MAP[source])
+            elif result.result_metadata.total_elapsed_ms is not None:
+                elapsed_ms.append(result.result_metadata.total_elapsed_ms)
+        elapsed_print = f" in {sum(elapsed_ms) / 1000:.2f}s" if elapsed_ms else ""
+        source_print = f" ({', '.join(sorted(sources))})" if sources else ""
+        console.print_stderr(f"{sigil} {tool} {status}{elapsed_print}{source_print}.")
 
 
 _CoreRequestType = TypeVar("_CoreRequestType", bound=AbstractFixRequest)
@@ -296,7 +347,73 @@ _GoalT = TypeVar("_GoalT", bound=Goal)
 
 
 class _BatchableMultiToolGoalSubsystem(_MultiToolGoalSubsystem, Protocol):
-    batch_size: BatchSizeOption
+    batch_size: int
+    experimental_known_clean_file: str | None
+
+
+# A mapping from a tool key (see `_known_clean_tool_key`) to the paths which that tool made no
+# changes to, and the fingerprint of each of those paths' content at the time.
+_KnownClean = dict[str, dict[str, str]]
+
+
+def _known_clean_tool_key(
+    batch_type: type[AbstractFixRequest.Batch], tool_name: str, partition_metadata: Any
+) -> str | None:
+    """The key under which to record the files that a tool made no changes to, if any.
+
+    A tool opts in by giving its partition metadata a `known_clean_key` property, which must
+    capture everything besides the files' content that could change the tool's output: usually
+    the digests of the tool itself and of its configuration files. Files are never recorded as
+    clean for tools which don't provide one.
+    """
+    tool_key = getattr(partition_metadata, "known_clean_key", None)
+    if tool_key is None:
+        return None
+    batch_type_name = f"{batch_type.__module__}.{batch_type.__qualname__}"
+    return f"{batch_type_name}:{tool_name}:{tool_key}:{VERSION}"
+
+
+def known_clean_key(*digests: Digest, args: Iterable[str] = ()) -> str:
+    """Compute a `known_clean_key` for partition metadata from the digests of a tool and of its
+    configuration files, and from the arguments which it is run with."""
+    parts = [*(f"{d.fingerprint}-{d.serialized_bytes_length}" for d in digests), *args]
+    return hashlib.sha256(json.dumps(parts).encode()).hexdigest()
+
+
+def _file_fingerprint(entry: FileEntry) -> str:
+    return f"{entry.file_digest.fingerprint}-{entry.file_digest.serialized_bytes_length}"
+
+
+def _load_known_clean(path: str) -> _KnownClean:
+    try:
+        with open(path) as fh:
+            known_clean = json.load(fh)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable known clean file `{path}`: {e}")
+        return {}
+    if not isinstance(known_clean, dict) or not all(
+        isinstance(v, dict) for v in known_clean.values()
+    ):
+        logger.warning(f"Ignoring malformed known clean file `{path}`.")
+        return {}
+    return known_clean
+
+
+def _save_known_clean(
+    path: str, known_clean: _KnownClean, tool_keys: set[str], fingerprints: dict[str, str]
+) -> None:
+    # NB: Records for tool keys which were not used in this run (e.g. those of a previous version
+    # or configuration of a tool), and for paths which were not part of it (e.g. deleted files),
+    # are dropped so that the file does not grow without bound.
+    pruned = {
+        tool_key: {path: fp for path, fp in clean.items() if path in fingerprints}
+        for tool_key, clean in known_clean.items()
+        if tool_key in tool_keys
+    }
+    with safe_open(path, "w") as fh:
+        json.dump(pruned, fh, indent=2, sort_keys=True)
 
 
 @rule(polymorphic=True)
@@ -336,6 +453,7 @@ async def _do_fix(
     specs: Specs,
     workspace: Workspace,
     console: Console,
+    run_id: RunId,
     make_targets_partition_request_get: Callable[
         [_TargetPartitioner], Coroutine[Any, Any, Partitions]
     ],
@@ -354,6 +472,27 @@ async def _do_fix(
     if not partitions_by_request_type:
         return goal_cls(exit_code=0)
 
+    known_clean_file = subsystem.experimental_known_clean_file
+    known_clean: _KnownClean = {}
+    fingerprints: dict[str, str] = {}
+    if known_clean_file:
+        known_clean = _load_known_clean(known_clean_file)
+        all_files = {
+            file
+            for partitions_list in partitions_by_request_type.values()
+            for partitions in partitions_list
+            for partition in partitions
+            for file in partition.elements
+        }
+        entries = await get_digest_entries(await path_globs_to_digest(PathGlobs(sorted(all_files))))
+        fingerprints = {
+            entry.path: _file_fingerprint(entry)
+            for entry in entries
+            if isinstance(entry, FileEntry)
+        }
+    skipped_files: set[str] = set()
+    tool_keys: set[str] = set()
+
     def batch_by_size(files: Iterable[str]) -> Iterator[tuple[str, ...]]:
         batches = partition_sequentially(
             files,
@@ -372,8 +511,19 @@ async def _do_fix(
         for request_type, partitions_list in partitions_by_request_type.items():
             for partitions in partitions_list:
                 for partition in partitions:
+                    tool_key = _known_clean_tool_key(
+                        request_type.Batch, request_type.tool_name, partition.metadata
+                    )
+                    if tool_key:
+                        tool_keys.add(tool_key)
+                    clean = known_clean.get(tool_key, {}) if tool_key else {}
                     for file in partition.elements:
+                        if file in fingerprints and clean.get(file) == fingerprints[file]:
+                            skipped_files.add(file)
+                            continue
                         partition_infos_by_files[file].append((request_type, partition.metadata))
+        # Only files which are clean for all of their tools are skipped entirely.
+        skipped_files.difference_update(partition_infos_by_files)
 
         files_by_partition_info = defaultdict(list)
         for file, partition_infos in partition_infos_by_files.items():
@@ -392,16 +542,41 @@ async def _do_fix(
                     for request_type, partition_metadata in partition_infos
                 )
 
-    all_results = await concurrently(
-        fix_batch_sequential(request) for request in _make_disjoint_batch_requests()
-    )
+    batch_requests = list(_make_disjoint_batch_requests())
+    start = time.monotonic()
+    all_results = await concurrently(fix_batch_sequential(request) for request in batch_requests)
+    batches = "batch" if len(batch_requests) == 1 else "batches"
+    logger.debug(f"Ran {len(batch_requests)} {batches} in {time.monotonic() - start:.2f}s.")
+
+    if known_clean_file:
+        for batch_request, batch_result in zip(batch_requests, all_results):
+            for element, result in zip(batch_request, batch_result.results):
+                # NB: Once a tool has changed the batch, the inputs of the tools which follow it
+                # no longer match the files on disk, and so they aren't recorded as clean.
+                if result.did_change:
+                    break
+                tool_key = _known_clean_tool_key(
+                    element.request_type, element.tool_name, element.key
+                )
+                if tool_key is None:
+                    continue
+                clean = known_clean.setdefault(tool_key, {})
+                for file in element.files:
+                    if file in fingerprints:
+                        clean[file] = fingerprints[file]
+        _save_known_clean(known_clean_file, known_clean, tool_keys, fingerprints)
+        if skipped_files:
+            logger.info(
+                f"Skipped {pluralize(len(skipped_files), 'file')} which had not changed since "
+                "they were last found to be clean."
+            )
 
     individual_results = list(
         itertools.chain.from_iterable(result.results for result in all_results)
     )
 
     await _write_files(workspace, all_results)
-    _print_results(console, individual_results)
+    _print_results(console, individual_results, run_id)
 
     # Since the rules to produce FixResult should use ProcessResult, rather than
     # FallibleProcessResult, we assume that there were no failures.
@@ -425,6 +600,7 @@ async def fix(
     fix_subsystem: FixSubsystem,
     workspace: Workspace,
     union_membership: UnionMembership,
+    run_id: RunId,
 ) -> Fix:
     return await _do_fix(
         sorted(
@@ -448,6 +624,7 @@ async def fix(
         specs,
         workspace,
         console,
+        run_id,
         lambda request_type: partition_targets(
             **implicitly({request_type: FixTargetsRequest.PartitionRequest})
         ),
@@ -5,12 +5,14 @@ from __future__ import annotations
 
 import dataclasses
 import itertools
+import json
 import logging
 import re
 from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path, PurePath
 from textwrap import dedent
+from unittest import mock
 
 import pytest
 
@@ -22,13 +24,26 @@ from pants.core.goals.fix import (
     FixResult,
     FixTargetsRequest,
     Partitions,
+    _known_clean_tool_key,
+    _print_results,
+    known_clean_key,
 )
 from pants.core.goals.fix import rules as fix_rules
 from pants.core.goals.fmt import FmtResult, FmtTargetsRequest
 from pants.core.util_rules import source_files
 from pants.core.util_rules.partitions import PartitionerType
-from pants.engine.fs import EMPTY_SNAPSHOT, CreateDigest, FileContent, Snapshot
+from pants.engine.fs import (
+    EMPTY_DIGEST,
+    EMPTY_SNAPSHOT,
+    CreateDigest,
+    Digest,
+    FileContent,
+    Snapshot,
+)
+from pants.engine.internals.session import RunId
 from pants.engine.intrinsics import digest_to_snapshot, get_digest_contents
+from pants.engine.platform import Platform
+from pants.engine.process import ProcessExecutionEnvironment, ProcessResultMetadata
 from pants.engine.rules import QueryRule, collect_rules, implicitly, rule
 from pants.engine.target import (
     FieldSet,
@@ -95,9 +110,25 @@ async def fortran_fix_partition(request: FortranFixRequest.PartitionRequest) ->
     return Partitions.single_partition(fs.sources.file_path for fs in request.field_sets)
 
 
+@dataclass(frozen=True)
+class FortranFmtMetadata:
+    version: str
+
+    @property
+    def description(self) -> None:
+        return None
+
+    @property
+    def known_clean_key(self) -> str:
+        return self.version
+
+
 @rule
 async def fortran_fmt_partition(request: FortranFmtRequest.PartitionRequest) -> Partitions:
-    return Partitions.single_partition(fs.sources.file_path for fs in request.field_sets)
+    return Partitions.single_partition(
+        (fs.sources.file_path for fs in request.field_sets),
+        metadata=FortranFmtMetadata(version="1.0"),
+    )
 
 
 @rule
@@ -370,6 +401,72 @@ def test_summary() -> None:
     )
 
 
+def test_summary_elapsed() -> None:
+    console = mock.Mock()
+    console.sigil_succeeded.return_value = "✓"
+    changed_snapshot = Snapshot.create_for_testing(["other_file.txt"], [])
+
+    def result(
+        tool_name: str,
+        source: ProcessResultMetadata.Source,
+        total_elapsed_ms: int | None,
+        *,
+        snapshot: Snapshot = EMPTY_SNAPSHOT,
+        source_run_id: int = 0,
+    ) -> FixResult:
+        return FixResult(
+            snapshot,
+            snapshot,
+            "",
+            "",
+            tool_name=tool_name,
+            result_metadata=ProcessResultMetadata(
+                total_elapsed_ms,
+                ProcessExecutionEnvironment(
+                    environment_name=None,
+                    platform=Platform.create_for_localhost().value,
+                    docker_image=None,
+                    remote_execution=False,
+                    remote_execution_extra_platform_properties=[],
+                    execute_in_workspace=False,
+                    keep_sandboxes="never",
+                ),
+                source.value,
+                source_run_id,
+            ),
+        )
+
+    _print_results(
+        console,
+        [
+            result("timed", ProcessResultMetadata.Source.RAN, 1500),
+            result("timed", ProcessResultMetadata.Source.RAN, 250, snapshot=changed_snapshot),
+            result("partly_cached", ProcessResultMetadata.Source.RAN, 500),
+            result(
+                "partly_cached",
+                ProcessResultMetadata.Source.HIT_LOCALLY,
+                2000,
+                snapshot=changed_snapshot,
+            ),
+            # A result created in an earlier run is memoized, regardless of how it was created.
+            result("memoized", ProcessResultMetadata.Source.RAN, 3000, source_run_id=-1),
+            FixResult(EMPTY_SNAPSHOT, EMPTY_SNAPSHOT, "", "", tool_name="untimed"),
+        ],
+        RunId(0),
+    )
+    assert [call.args[0] for call in console.print_stderr.call_args_list] == [
+        "",
+        "✓ memoized made no changes (memoized).",
+        "✓ partly_cached made no changes in 0.50s (cached locally).",
+        "✓ timed made no changes in 1.75s.",
+        "✓ untimed made no changes.",
+    ]
+    # Metadata is not part of the identity of a result.
+    assert result("timed", ProcessResultMetadata.Source.RAN, 1) == result(
+        "timed", ProcessResultMetadata.Source.HIT_REMOTELY, 2
+    )
+
+
 def test_skip_formatters() -> None:
     rule_runner = fix_rule_runner(
         target_types=[FortranTarget, SmalltalkTarget],
@@ -383,6 +480,63 @@ def test_skip_formatters() -> None:
     assert not stderr
 
 
+def test_known_clean_file() -> None:
+    rule_runner = fix_rule_runner(
+        target_types=[FortranTarget, SmalltalkTarget],
+        request_types=[FortranFmtRequest, SmalltalkNoopRequest],
+    )
+    write_files(rule_runner)
+    known_clean_file = Path(rule_runner.build_root, "known_clean.json")
+    args = [f"--fix-experimental-known-clean-file={known_clean_file}"]
+
+    # A batch which was changed isn't recorded as clean, but once the formatter makes no changes
+    # to it, it is skipped.
+    stderr = run_fix(rule_runner, target_specs=["::"], extra_args=args)
+    assert "+ Fortran Formatter made changes." in stderr
+    stderr = run_fix(rule_runner, target_specs=["::"], extra_args=args)
+    assert "✓ Fortran Formatter made no changes." in stderr
+    stderr = run_fix(rule_runner, target_specs=["::"], extra_args=args)
+    assert "Fortran Formatter" not in stderr
+    # A tool which does not provide a `known_clean_key` is never skipped.
+    assert "✓ Smalltalk Did Not Change made no changes." in stderr
+    known_clean = json.loads(known_clean_file.read_text())
+    assert len(known_clean) == 1
+    assert all(":1.0:" in tool_key for tool_key in known_clean)
+
+    # Records of tool keys and of paths which were not part of a run are dropped.
+    stale_known_clean = {
+        tool_key: {**clean, "deleted.f98": "stale"} for tool_key, clean in known_clean.items()
+    }
+    stale_known_clean[next(iter(known_clean)).replace(":1.0:", ":0.9:")] = {"ft1.f98": "stale"}
+    known_clean_file.write_text(json.dumps(stale_known_clean))
+    run_fix(rule_runner, target_specs=["::"], extra_args=args)
+    assert json.loads(known_clean_file.read_text()) == known_clean
+
+    # Editing a file causes the formatter to run again.
+    rule_runner.write_files({"ft1.f98": "READ INPUT TAPE 6"})
+    stderr = run_fix(rule_runner, target_specs=["::"], extra_args=args)
+    assert "+ Fortran Formatter made changes." in stderr
+    assert Path(rule_runner.build_root, "ft1.f98").read_text() == FORTRAN_FILE.content.decode()
+
+
+def test_known_clean_tool_key() -> None:
+    def tool_key(metadata: object) -> str | None:
+        return _known_clean_tool_key(FortranFmtRequest.Batch, "Fortran Formatter", metadata)
+
+    assert tool_key(FortranFmtMetadata("1.0")) == tool_key(FortranFmtMetadata("1.0"))
+    # Upgrading or reconfiguring the tool invalidates its records.
+    assert tool_key(FortranFmtMetadata("1.0")) != tool_key(FortranFmtMetadata("2.0"))
+    # Tools which don't provide a key are never recorded.
+    assert tool_key(None) is None
+
+
+def test_known_clean_key() -> None:
+    digest = Digest("a" * 64, 1)
+    assert known_clean_key(digest, args=["--fast"]) == known_clean_key(digest, args=["--fast"])
+    assert known_clean_key(digest) != known_clean_key(EMPTY_DIGEST)
+    assert known_clean_key(digest) != known_clean_key(digest, args=["--fast"])
+
+
 def test_fixers_first() -> None:
     rule_runner = fix_rule_runner(
         target_types=[FortranTarget, SmalltalkTarget],
@@ -10,10 +10,15 @@ from pants.base.specs import Specs
 from pants.core.goals.fix import AbstractFixRequest, FixFilesRequest, FixResult, FixTargetsRequest
 from pants.core.goals.fix import Partitions as Partitions  # re-export
 from pants.core.goals.fix import _do_fix
-from pants.core.goals.multi_tool_goal_helper import BatchSizeOption, OnlyOption
+from pants.core.goals.multi_tool_goal_helper import (
+    BatchSizeOption,
+    KnownCleanFileOption,
+    OnlyOption,
+)
 from pants.engine.console import Console
 from pants.engine.fs import Workspace
 from pants.engine.goal import Goal, GoalSubsystem
+from pants.engine.internals.session import RunId
 from pants.engine.rules import collect_rules, goal_rule, implicitly, rule
 from pants.engine.unions import UnionMembership, UnionRule, union
 from pants.util.docutil import doc_url
@@ -80,6 +85,7 @@ class FmtSubsystem(GoalSubsystem):
 
     only = OnlyOption("formatter", "isort", "shfmt")
     batch_size = BatchSizeOption(uppercase="Formatter", lowercase="formatter")
+    experimental_known_clean_file = KnownCleanFileOption("formatter")
 
 
 class Fmt(Goal):
@@ -104,6 +110,7 @@ async def fmt(
     fmt_subsystem: FmtSubsystem,
     workspace: Workspace,
     union_membership: UnionMembership,
+    run_id: RunId,
 ) -> Fmt:
     return await _do_fix(
         union_membership.get(AbstractFmtRequest),
@@ -114,6 +121,7 @@ async def fmt(
         specs,
         workspace,
         console,
+        run_id,
         lambda request_type: partition_targets(
             **implicitly({request_type: FmtTargetsRequest.PartitionRequest})
         ),
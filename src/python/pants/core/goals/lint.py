@@ -297,7 +297,7 @@ _FilePartitioner = TypeVar("_FilePartitioner", bound=LintFilesRequest.PartitionR
 
 class _MultiToolGoalSubsystem(Protocol):
     name: str
-    only: OnlyOption
+    only: tuple[str, ...]
 
 
 async def get_partitions_by_request_type(
@@ -10,7 +10,7 @@ from typing import Protocol, TypeVar
 
 from pants.core.util_rules.distdir import DistDir
 from pants.engine.fs import EMPTY_DIGEST, Digest, Workspace
-from pants.option.option_types import IntOption, SkipOption, StrListOption
+from pants.option.option_types import IntOption, SkipOption, StrListOption, StrOption
 from pants.util.strutil import path_safe, softwrap
 
 logger = logging.getLogger(__name__)
@@ -73,6 +73,38 @@ class BatchSizeOption(IntOption):
         )
 
 
+class KnownCleanFileOption(StrOption):
+    """An --experimental-known-clean-file option to skip files which a tool has already checked."""
+
+    def __new__(cls, tool_description: str):
+        return super().__new__(
+            cls,
+            "--experimental-known-clean-file",
+            advanced=True,
+            default=None,
+            help=lambda cls: softwrap(
+                f"""
+                If set, a path (relative to the build root) to a JSON file in which to record which
+                files each {tool_description} made no changes to, and which is then used to skip
+                running the {tool_description} on those files again while their content is
+                unchanged.
+
+                {tool_description.capitalize()} processes are run (and cached) per batch of files
+                (see `[{cls.name}].batch_size`), and so without this option, editing a single file
+                reruns each {tool_description} on its entire batch. With it, only the files which
+                changed since a {tool_description} last saw them are batched and run.
+
+                Records are keyed by the {tool_description}, its version and configuration, the
+                version of Pants, and the digest of each file. Only {tool_description}s which
+                provide a key for their version and configuration (via a `known_clean_key`
+                property on their partition metadata) are skipped: others always run. Records of
+                files and {tool_description}s which were not part of a run are dropped, so
+                consecutive runs on disjoint sets of files will not benefit from one another.
+                """
+            ),
+        )
+
+
 def determine_specified_tool_ids(
     goal_name: str,
     only_option: Iterable[str],
@@ -6,6 +6,7 @@ from __future__ import annotations
 import itertools
 import json
 import logging
+import math
 import os
 import shlex
 from abc import ABC, ABCMeta
@@ -69,7 +70,7 @@ from pants.engine.target import (
 )
 from pants.engine.unions import UnionMembership, UnionRule, distinct_union_type_per_subclass, union
 from pants.option.option_types import BoolOption, EnumOption, IntOption, StrListOption, StrOption
-from pants.util.collections import partition_sequentially
+from pants.util.collections import partition_by_weight, partition_sequentially
 from pants.util.dirutil import safe_open
 from pants.util.docutil import bin_name
 from pants.util.logging import LogLevel
@@ -697,6 +698,30 @@ class TestSubsystem(GoalSubsystem):
         ),
     )
 
+    experimental_batch_durations_file = StrOption(
+        default=None,
+        advanced=True,
+        help=softwrap(
+            """
+            If set, a path (relative to the build root) to a JSON file in which to record how long
+            each test file took to run, and which is then used to balance batches by their
+            predicted runtime.
+
+            By default, batches are cut at stable boundaries based only on the number of files
+            (see `[test].batch_size`), which can place many slow tests in the same batch. When
+            this option is set, each partition is instead split into the same number of batches,
+            but the files are assigned to batches so that every batch has roughly the same total
+            historical runtime. As without this option, no batch holds more than twice
+            `[test].batch_size` files. Files with no recorded runtime are assumed to take the
+            average runtime of the recorded files in their partition.
+
+            Durations are only recorded for tests that actually ran (rather than being fetched
+            from a cache). Note that because batch membership then depends on past runtimes,
+            batches are less stable across runs, which may reduce cache hit rates.
+            """
+        ),
+    )
+
     show_rerun_command = BoolOption(
         default="CI" in os.environ,
         advanced=True,
@@ -868,18 +893,40 @@ async def _get_test_batches(
         partitions_call(request_type) for request_type in core_request_types
     )
 
+    durations = (
+        _load_test_durations(test_subsystem.experimental_batch_durations_file)
+        if test_subsystem.experimental_batch_durations_file
+        else {}
+    )
+
+    def element_key(x: Any) -> str:
+        return str(x.address) if isinstance(x, FieldSet) else str(x)
+
+    def batches_for(elements: Sequence[Any]) -> Iterable[list[Any]]:
+        known = [durations[k] for k in map(element_key, elements) if k in durations]
+        if not known:
+            return partition_sequentially(
+                elements,
+                key=element_key,
+                size_target=test_subsystem.batch_size,
+                size_max=2 * test_subsystem.batch_size,
+            )
+        default_duration = sum(known) / len(known)
+        return partition_by_weight(
+            elements,
+            key=element_key,
+            weight=lambda x: durations.get(element_key(x), default_duration),
+            num_partitions=math.ceil(len(elements) / max(1, test_subsystem.batch_size)),
+            size_max=2 * test_subsystem.batch_size,
+        )
+
     return [
         request_type.Batch(
             cast(TestRequest, request_type).tool_name, tuple(batch), partition.metadata
         )
         for request_type, partitions in zip(core_request_types, all_partitions)
         for partition in partitions
-        for batch in partition_sequentially(
-            partition.elements,
-            key=lambda x: str(x.address) if isinstance(x, FieldSet) else str(x),
-            size_target=test_subsystem.batch_size,
-            size_max=2 * test_subsystem.batch_size,
-        )
+        for batch in batches_for(partition.elements)
     ]
 
 
@@ -929,6 +976,47 @@ def _save_test_result_info_report_file(run_id: RunId, results: dict[str, dict])
         fh.write(obj)
 
 
+def _load_test_durations(path: str) -> dict[str, float]:
+    """Load the recorded duration (in milliseconds) of each test address, keyed by its spec."""
+    try:
+        with open(path) as fh:
+            durations = json.load(fh)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable test durations file `{path}`: {e}")
+        return {}
+    if not isinstance(durations, dict):
+        logger.warning(f"Ignoring malformed test durations file `{path}`.")
+        return {}
+    return {k: float(v) for k, v in durations.items() if isinstance(v, (int, float))}
+
+
+def _save_test_durations(path: str, results: Iterable[TestResult], run_id: RunId) -> None:
+    """Record the durations of the tests which ran in this run, merged with earlier records.
+
+    A batch's elapsed time is split evenly between the addresses which it contained.
+    """
+    durations = _load_test_durations(path)
+    updated = False
+    for result in results:
+        metadata = result.result_metadata
+        if (
+            result.exit_code is None
+            or metadata is None
+            or metadata.total_elapsed_ms is None
+            or metadata.source(run_id) != ProcessResultMetadata.Source.RAN
+        ):
+            continue
+        per_address_ms = metadata.total_elapsed_ms / len(result.addresses)
+        for address in result.addresses:
+            durations[address.spec] = per_address_ms
+        updated = True
+    if updated:
+        with safe_open(path, "w") as fh:
+            json.dump(durations, fh, indent=2, sort_keys=True)
+
+
 @goal_rule
 async def run_tests(
     console: Console,
@@ -1100,6 +1188,9 @@ async def run_tests(
     if test_subsystem.experimental_report_test_result_info:
         _save_test_result_info_report_file(run_id, test_result_info)
 
+    if test_subsystem.experimental_batch_durations_file:
+        _save_test_durations(test_subsystem.experimental_batch_durations_file, results, run_id)
+
     return Test(exit_code)
 
 
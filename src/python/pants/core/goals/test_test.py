@@ -37,6 +37,8 @@ from pants.core.goals.test import (
     TestTimeoutField,
     _format_test_rerun_command,
     _format_test_summary,
+    _load_test_durations,
+    _save_test_durations,
     build_runtime_package_dependencies,
     run_tests,
 )
@@ -275,6 +277,7 @@ def run_test_rule(
         extra_env_vars=[],
         shard="",
         batch_size=1,
+        experimental_batch_durations_file=None,
         show_rerun_command=show_rerun_command,
     )
     debug_adapter_subsystem = create_subsystem(
@@ -650,6 +653,78 @@ def sort_results() -> None:
     ]
 
 
+def test_save_and_load_test_durations(tmp_path: Path) -> None:
+    durations_file = str(tmp_path / "durations.json")
+    assert _load_test_durations(durations_file) == {}
+
+    run_id = RunId(1)
+    single = Address("", target_name="single")
+    batched1 = Address("", target_name="batched1")
+    batched2 = Address("", target_name="batched2")
+    cached = Address("", target_name="cached")
+    _save_test_durations(
+        durations_file,
+        [
+            make_test_result(
+                [single],
+                exit_code=0,
+                result_metadata=make_process_result_metadata(
+                    "ran", total_elapsed_ms=100, source_run_id=run_id
+                ),
+            ),
+            make_test_result(
+                [batched1, batched2],
+                exit_code=1,
+                result_metadata=make_process_result_metadata(
+                    "ran", total_elapsed_ms=300, source_run_id=run_id
+                ),
+            ),
+            make_test_result(
+                [cached],
+                exit_code=0,
+                result_metadata=make_process_result_metadata(
+                    "hit_locally", total_elapsed_ms=50, source_run_id=run_id
+                ),
+            ),
+            make_test_result([Address("", target_name="skipped")], exit_code=None),
+        ],
+        run_id,
+    )
+    assert _load_test_durations(durations_file) == {
+        single.spec: 100.0,
+        batched1.spec: 150.0,
+        batched2.spec: 150.0,
+    }
+
+    # Later runs update existing entries, and leave others untouched.
+    _save_test_durations(
+        durations_file,
+        [
+            make_test_result(
+                [single],
+                exit_code=0,
+                result_metadata=make_process_result_metadata(
+                    "ran", total_elapsed_ms=40, source_run_id=2
+                ),
+            )
+        ],
+        RunId(2),
+    )
+    assert _load_test_durations(durations_file) == {
+        single.spec: 40.0,
+        batched1.spec: 150.0,
+        batched2.spec: 150.0,
+    }
+
+
+def test_load_malformed_test_durations(tmp_path: Path) -> None:
+    durations_file = tmp_path / "durations.json"
+    durations_file.write_text("not json")
+    assert _load_test_durations(str(durations_file)) == {}
+    durations_file.write_text("[1, 2]")
+    assert _load_test_durations(str(durations_file)) == {}
+
+
 def assert_streaming_output(
     *,
     exit_code: int | None,
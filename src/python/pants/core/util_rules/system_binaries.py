@@ -25,9 +25,9 @@ from pants.engine.internals.native_engine import Digest, PathMetadataKind, PathN
 from pants.engine.internals.selectors import concurrently
 from pants.engine.intrinsics import create_digest, execute_process, path_metadata_request
 from pants.engine.platform import Platform
-from pants.engine.process import Process, execute_process_or_raise
+from pants.engine.process import Process, ProcessCacheScope, execute_process_or_raise
 from pants.engine.rules import Get, collect_rules, implicitly, rule
-from pants.option.option_types import StrListOption
+from pants.option.option_types import BoolOption, StrListOption
 from pants.option.subsystem import Subsystem
 from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
@@ -42,6 +42,24 @@ class SystemBinariesSubsystem(Subsystem):
     options_scope = "system-binaries"
     help = "System binaries related settings."
 
+    persist_binary_test_results = BoolOption(
+        default=False,
+        advanced=True,
+        help=softwrap(
+            """
+            If true, persist the results of testing candidate binaries (e.g. by running them with
+            `--version`) across restarts of Pants, for environments which can access the local
+            system.
+
+            By default, those tests are rerun whenever `pantsd` restarts, in case a binary was
+            upgraded. When this option is enabled, each candidate is instead identified by the
+            size, permissions and modification time of its file (following symlinks), and is only
+            retested when those change. Leave this disabled if your binaries are wrapper scripts
+            whose behavior depends on other files (as `pyenv` shims do, for example).
+            """
+        ),
+    )
+
     class EnvironmentAware(Subsystem.EnvironmentAware):
         env_vars_used_by_options = ("PATH",)
 
@@ -729,10 +747,35 @@ async def _find_candidate_paths_via_subprocess_helper(
     return tuple(result.stdout.decode().splitlines())
 
 
+_MAX_SYMLINK_HOPS = 16
+
+
+async def _binary_stamp(path: str) -> str:
+    """A fingerprint of the metadata of the file at `path`, and of any symlinks leading to it."""
+    stamps = []
+    for _ in range(_MAX_SYMLINK_HOPS):
+        metadata = (
+            await path_metadata_request(  # noqa: PNT30: each hop depends on the previous one
+                PathMetadataRequest(path=path, namespace=PathNamespace.SYSTEM)
+            )
+        ).metadata
+        if not metadata:
+            break
+        stamps.append(
+            f"{metadata.path}:{metadata.kind}:{metadata.length}:{metadata.unix_mode}:"
+            f"{metadata.modified}"
+        )
+        if metadata.kind != PathMetadataKind.SYMLINK or not metadata.symlink_target:
+            break
+        path = os.path.normpath(os.path.join(os.path.dirname(path), metadata.symlink_target))
+    return BinaryPath._fingerprint("\n".join(stamps).encode())
+
+
 @rule
 async def find_binary(
     request: BinaryPathRequest,
     env_target: EnvironmentTarget,
+    system_binaries: SystemBinariesSubsystem,
 ) -> BinaryPaths:
     found_paths: tuple[str, ...]
     if env_target.can_access_local_system_paths:
@@ -746,19 +789,33 @@ async def find_binary(
             paths=(BinaryPath(path) for path in found_paths),
         )
 
+    # NB: Since a failure is a valid result for this script, we always cache it, regardless of
+    # success or failure.
+    cache_scope = env_target.executable_search_path_cache_scope(cache_failures=True)
+    stamps: tuple[str | None, ...] = (None,) * len(found_paths)
+    if (
+        system_binaries.persist_binary_test_results
+        and env_target.can_access_local_system_paths
+        and cache_scope == ProcessCacheScope.PER_RESTART_ALWAYS
+    ):
+        # Including a stamp of each binary's metadata in its test process' cache key makes it safe
+        # to persist the result: the stamp is recomputed (by cheap `stat` calls) in each session,
+        # and an upgraded binary will produce a new stamp.
+        stamps = await concurrently(_binary_stamp(path) for path in found_paths)
+        cache_scope = ProcessCacheScope.ALWAYS
+
     results = await concurrently(
         execute_process(
             Process(
                 description=f"Test binary {path}.",
                 level=LogLevel.DEBUG,
                 argv=[path, *request.test.args],
-                # NB: Since a failure is a valid result for this script, we always cache it,
-                # regardless of success or failure.
-                cache_scope=env_target.executable_search_path_cache_scope(cache_failures=True),
+                env={"__PANTS_BINARY_STAMP": stamp} if stamp else None,
+                cache_scope=cache_scope,
             ),
             **implicitly(),
         )
-        for path in found_paths
+        for path, stamp in zip(found_paths, stamps)
     )
     return BinaryPaths(
         binary_name=request.binary_name,
@@ -14,6 +14,7 @@ from pants.core.util_rules.system_binaries import (
     BinaryPath,
     BinaryPathRequest,
     BinaryPaths,
+    BinaryPathTest,
     BinaryShims,
     BinaryShimsRequest,
 )
@@ -217,6 +218,44 @@ def test_no_negative_caching_of_binary_paths_lookups(
     assert binary_paths.paths[0].path == str(tmp_path / "bar" / MyBin.binary_name)
 
 
+def test_persisted_binary_test_results_follow_binary_changes(
+    rule_runner: RuleRunner, tmp_path: Path
+) -> None:
+    rule_runner.set_options(["--system-binaries-persist-binary-test-results"])
+    exe = tmp_path / "bin" / MyBin.binary_name
+    exe.parent.mkdir()
+    link = tmp_path / "link" / MyBin.binary_name
+    link.parent.mkdir()
+    link.symlink_to(exe)
+
+    def write_version(version: str) -> None:
+        exe.write_text(f"#!/bin/sh\necho {version}\n")
+        exe.chmod(0o755)
+
+    def find_version() -> str:
+        binary_paths = rule_runner.request(
+            BinaryPaths,
+            [
+                BinaryPathRequest(
+                    binary_name=MyBin.binary_name,
+                    search_path=[str(link.parent)],
+                    test=BinaryPathTest(args=["--version"], fingerprint_stdout=False),
+                )
+            ],
+        )
+        assert binary_paths.first_path is not None
+        return binary_paths.first_path.fingerprint.strip()
+
+    write_version("1.0")
+    assert find_version() == "1.0"
+
+    # Upgrading the binary behind the symlink causes it to be retested in the next session.
+    write_version("2.0.0")
+    rule_runner.new_session("session2")
+    rule_runner.set_options(["--system-binaries-persist-binary-test-results"])
+    assert find_version() == "2.0.0"
+
+
 def test_merge_and_detection_of_duplicate_binary_paths() -> None:
     # Test merge of duplicate paths where content hash is the same.
     shims_request_1 = BinaryShimsRequest.for_paths(
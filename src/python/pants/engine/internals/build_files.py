@@ -3,12 +3,10 @@
 
 from __future__ import annotations
 
-import ast
 import builtins
 import itertools
 import logging
 import os.path
-import sys
 import typing
 from collections import defaultdict
 from collections.abc import Coroutine, Sequence
@@ -40,6 +38,7 @@ from pants.engine.internals.parser import (
     BuildFilePreludeSymbols,
     BuildFileSymbolsInfo,
     Parser,
+    compile_build_file,
     error_on_imports,
 )
 from pants.engine.internals.platform_rules import environment_vars_subset
@@ -141,7 +140,7 @@ async def evaluate_preludes(
     for file_content in prelude_digest_contents:
         try:
             file_content_str = file_content.content.decode()
-            content = compile(file_content_str, file_content.path, "exec", dont_inherit=True)
+            content = compile_build_file(file_content.path, file_content_str).code
             exec(content, globals, locals)
         except Exception as e:
             raise Exception(f"Error parsing prelude file {file_content.path}: {e}")
@@ -232,49 +231,18 @@ async def ensure_address_family(request: OptionalAddressFamily) -> AddressFamily
     return request.ensure()
 
 
-class BUILDFileEnvVarExtractor(ast.NodeVisitor):
-    def __init__(self, filename: str):
-        super().__init__()
-        self.env_vars: set[str] = set()
-        self.filename = filename
-
+class BUILDFileEnvVarExtractor:
     @classmethod
     def get_env_vars(cls, file_content: FileContent) -> Sequence[str]:
-        obj = cls(file_content.path)
+        content = file_content.content
         try:
-            obj.visit(ast.parse(file_content.content, file_content.path))
+            compiled = compile_build_file(
+                file_content.path, content.decode() if isinstance(content, bytes) else content
+            )
         except SyntaxError as e:
             raise BuildFileSyntaxError.from_syntax_error(e).with_traceback(e.__traceback__)
 
-        return tuple(obj.env_vars)
-
-    def visit_Call(self, node: ast.Call):
-        is_env = isinstance(node.func, ast.Name) and node.func.id == "env"
-        for arg in node.args:
-            if not is_env:
-                self.visit(arg)
-                continue
-
-            # Only first arg may be checked as env name
-            is_env = False
-
-            if sys.version_info[0:2] < (3, 8):
-                value = arg.s if isinstance(arg, ast.Str) else None
-            else:
-                value = arg.value if isinstance(arg, ast.Constant) else None
-            if value:
-                # Found env name in this call, we're done here.
-                self.env_vars.add(value)
-                return
-            else:
-                logger.warning(
-                    f"{self.filename}:{arg.lineno}: Only constant string values as variable name to "
-                    f"`env()` is currently supported. This `env()` call will always result in "
-                    "the default value only."
-                )
-
-        for kwarg in node.keywords:
-            self.visit(kwarg)
+        return compiled.env_vars
 
 
 @rule(desc="Search for addresses in BUILD files")
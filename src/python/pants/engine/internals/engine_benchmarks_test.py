@@ -1,11 +1,59 @@
 # Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
-from dataclasses import dataclass
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
 from random import randrange
+from typing import TypeVar
+
+import pytest
 
+from pants.backend.python.dependency_inference.rules import (
+    InferPythonImportDependencies,
+    PythonImportDependenciesInferenceFieldSet,
+    import_rules,
+)
+from pants.backend.python.target_types import PythonSourcesGeneratorTarget, PythonSourceTarget
+from pants.backend.python.target_types_rules import rules as python_target_types_rules
+from pants.core.target_types import rules as core_target_types_rules
+from pants.engine.addresses import Address, Addresses
+from pants.engine.internals.build_files import AddressFamilyDir
+from pants.engine.internals.graph import Owners, OwnersRequest
+from pants.engine.internals.mapper import AddressFamily
 from pants.engine.rules import concurrently, rule
-from pants.testutil.rule_runner import QueryRule, RuleRunner
+from pants.engine.target import (
+    CoarsenedTargets,
+    InferredDependencies,
+    Targets,
+    TransitiveTargets,
+    TransitiveTargetsRequest,
+)
+from pants.testutil.benchmark_util import BenchmarkResults
+from pants.testutil.python_rule_runner import PythonRuleRunner
+from pants.testutil.rule_runner import PYTHON_BOOTSTRAP_ENV, QueryRule, RuleRunner
+
+_T = TypeVar("_T")
+
+# NB: The size of the synthetic repo may be increased with these variables. When running under
+# Pants, pass them through with `--test-extra-env-vars`.
+BUILD_FILES_ENV_VAR = "PANTS_ENGINE_BENCHMARKS_BUILD_FILES"
+TARGETS_PER_BUILD_FILE_ENV_VAR = "PANTS_ENGINE_BENCHMARKS_TARGETS_PER_BUILD_FILE"
+
+BENCHMARK_RESULTS = BenchmarkResults("PANTS_ENGINE_BENCHMARKS_RESULTS")
+write_results = BENCHMARK_RESULTS.write_results_fixture()
+# The elapsed seconds of each run of each workload, by workload name.
+_timings: dict[str, list[float]] = BENCHMARK_RESULTS.results.setdefault("timings", {})
+
+
+def _timed(name: str, run: Callable[[], _T]) -> _T:
+    start = time.perf_counter()
+    result = run()
+    _timings.setdefault(name, []).append(time.perf_counter() - start)
+    return result
 
 
 @dataclass(frozen=True)
@@ -37,11 +85,184 @@ def test_bench_deep():
     rule_runner = RuleRunner(rules=[deep, QueryRule(Deep, (int,))])
     for _ in range(0, 10):
         rule_runner.scheduler.scheduler.invalidate_all()
-        _ = rule_runner.request(Deep, [10000])
+        _ = _timed("deep", lambda: rule_runner.request(Deep, [10000]))
 
 
 def test_bench_wide():
     rule_runner = RuleRunner(rules=[wide, QueryRule(Wide, (int,))])
     for _ in range(0, 5):
         rule_runner.scheduler.scheduler.invalidate_all()
-        _ = rule_runner.request(Wide, [1000])
+        _ = _timed("wide", lambda: rule_runner.request(Wide, [1000]))
+
+
+# -----------------------------------------------------------------------------------------------
+# Graph workloads over a synthetic repo
+# -----------------------------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class SyntheticRepo:
+    """A repo of `build_files` directories, each containing a `python_sources` target generator
+    which owns `targets_per_build_file` modules.
+
+    Each module imports `fan_out` modules from the preceding directories, so that the dependency
+    graph is a DAG whose depth grows with `build_files`.
+    """
+
+    build_files: int
+    targets_per_build_file: int
+    fan_out: int
+
+    def _module(self, directory: int, module: int) -> str:
+        return f"bench{directory}.m{module}"
+
+    def files(self) -> dict[str, str]:
+        files = {}
+        for d in range(self.build_files):
+            files[f"bench{d}/BUILD"] = "python_sources()\n"
+            files[f"bench{d}/__init__.py"] = ""
+            for m in range(self.targets_per_build_file):
+                imports = [
+                    f"import {self._module(d - 1 - (f % d), (m + f) % self.targets_per_build_file)}"
+                    for f in range(self.fan_out if d > 0 else 0)
+                ]
+                files[f"bench{d}/m{m}.py"] = "\n".join(imports) + "\n"
+        return files
+
+    @property
+    def directories(self) -> tuple[str, ...]:
+        return tuple(f"bench{d}" for d in range(self.build_files))
+
+    @property
+    def source_files(self) -> tuple[str, ...]:
+        return tuple(
+            f"bench{d}/m{m}.py"
+            for d in range(self.build_files)
+            for m in range(self.targets_per_build_file)
+        )
+
+    @property
+    def addresses(self) -> Addresses:
+        return Addresses(
+            Address(os.path.dirname(path), relative_file_path=os.path.basename(path))
+            for path in self.source_files
+        )
+
+
+# NB: Kept small enough by default to run as part of the test suite.
+SYNTHETIC_REPO = SyntheticRepo(
+    build_files=int(os.environ.get(BUILD_FILES_ENV_VAR, "50")),
+    targets_per_build_file=int(os.environ.get(TARGETS_PER_BUILD_FILE_ENV_VAR, "10")),
+    fan_out=3,
+)
+BENCHMARK_RESULTS.results["synthetic_repo"] = asdict(SYNTHETIC_REPO)
+
+
+@pytest.fixture(scope="module")
+def graph_rule_runner() -> PythonRuleRunner:
+    rule_runner = PythonRuleRunner(
+        rules=[
+            *import_rules(),
+            *python_target_types_rules(),
+            *core_target_types_rules(),
+            QueryRule(AddressFamily, [AddressFamilyDir]),
+            QueryRule(Targets, [Addresses]),
+            QueryRule(TransitiveTargets, [TransitiveTargetsRequest]),
+            QueryRule(CoarsenedTargets, [Addresses]),
+            QueryRule(Owners, [OwnersRequest]),
+            QueryRule(InferredDependencies, [InferPythonImportDependencies]),
+        ],
+        target_types=[PythonSourceTarget, PythonSourcesGeneratorTarget],
+    )
+    rule_runner.set_options([], env_inherit=PYTHON_BOOTSTRAP_ENV)
+    rule_runner.write_files(SYNTHETIC_REPO.files())
+    return rule_runner
+
+
+def _run_cold(rule_runner: RuleRunner, name: str, run: Callable[[], _T]) -> _T:
+    """Time `run` repeatedly against a cold graph, and return its (consistent) result."""
+    results = []
+    for _ in range(3):
+        # NB: Unlike `invalidate_all`, evicting drops the previous values of nodes, and so forces
+        # them to re-run rather than to be cleaned.
+        rule_runner.scheduler.evict_least_recently_used(1.0)
+        results.append(_timed(name, run))
+    assert all(result == results[0] for result in results)
+    return results[0]
+
+
+def test_bench_address_families(graph_rule_runner: PythonRuleRunner) -> None:
+    families = _run_cold(
+        graph_rule_runner,
+        "address_families",
+        lambda: [
+            graph_rule_runner.request(AddressFamily, [AddressFamilyDir(directory)])
+            for directory in SYNTHETIC_REPO.directories
+        ],
+    )
+    assert [family.namespace for family in families] == list(SYNTHETIC_REPO.directories)
+    assert all(len(family.name_to_target_adaptors) == 1 for family in families)
+
+
+def test_bench_resolve_targets(graph_rule_runner: PythonRuleRunner) -> None:
+    targets = _run_cold(
+        graph_rule_runner,
+        "resolve_targets",
+        lambda: graph_rule_runner.request(Targets, [SYNTHETIC_REPO.addresses]),
+    )
+    assert [tgt.address for tgt in targets] == list(SYNTHETIC_REPO.addresses)
+
+
+def test_bench_transitive_targets(graph_rule_runner: PythonRuleRunner) -> None:
+    transitive_targets = _run_cold(
+        graph_rule_runner,
+        "transitive_targets",
+        lambda: graph_rule_runner.request(
+            TransitiveTargets, [TransitiveTargetsRequest(SYNTHETIC_REPO.addresses)]
+        ),
+    )
+    assert {tgt.address for tgt in transitive_targets.closure} == set(SYNTHETIC_REPO.addresses)
+
+
+def test_bench_coarsened_targets(graph_rule_runner: PythonRuleRunner) -> None:
+    coarsened_targets = _run_cold(
+        graph_rule_runner,
+        "coarsened_targets",
+        lambda: graph_rule_runner.request(CoarsenedTargets, [SYNTHETIC_REPO.addresses]),
+    )
+    # The graph is a DAG, and so every root is its own component.
+    assert len(coarsened_targets) == len(SYNTHETIC_REPO.addresses)
+    assert all(len(ct.members) == 1 for ct in coarsened_targets)
+
+
+def test_bench_find_owners(graph_rule_runner: PythonRuleRunner) -> None:
+    owners = _run_cold(
+        graph_rule_runner,
+        "find_owners",
+        lambda: graph_rule_runner.request(Owners, [OwnersRequest(SYNTHETIC_REPO.source_files)]),
+    )
+    assert set(owners) == set(SYNTHETIC_REPO.addresses)
+
+
+def test_bench_python_dependency_inference(graph_rule_runner: PythonRuleRunner) -> None:
+    targets = graph_rule_runner.request(Targets, [SYNTHETIC_REPO.addresses])
+    inferred = _run_cold(
+        graph_rule_runner,
+        "python_dependency_inference",
+        lambda: [
+            graph_rule_runner.request(
+                InferredDependencies,
+                [
+                    InferPythonImportDependencies(
+                        PythonImportDependenciesInferenceFieldSet.create(tgt)
+                    )
+                ],
+            )
+            for tgt in targets
+        ],
+    )
+    # Every module imports `fan_out` distinct modules, except for those in the first directory.
+    assert [len(deps.include) for deps in inferred] == [
+        0 if tgt.address.spec_path == SYNTHETIC_REPO.directories[0] else SYNTHETIC_REPO.fan_out
+        for tgt in targets
+    ]
@@ -9,14 +9,14 @@ import itertools
 import json
 import logging
 import os.path
-from collections import defaultdict
-from collections.abc import Coroutine, Iterable, Iterator, Mapping, Sequence
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from pathlib import PurePath
 from typing import Any, DefaultDict, NamedTuple, Type, TypeVar, cast
 
 from pants.base.deprecated import warn_or_error
-from pants.base.specs import AncestorGlobSpec, RawSpecsWithoutFileOwners, RecursiveGlobSpec
+from pants.base.specs import RawSpecsWithoutFileOwners, RecursiveGlobSpec
 from pants.build_graph.address import BuildFileAddressRequest, ResolveError
 from pants.engine.addresses import Address, Addresses, AddressInput, UnparsedAddressInputs
 from pants.engine.collection import Collection
@@ -35,6 +35,7 @@ from pants.engine.internals.build_files import (
 )
 from pants.engine.internals.mapper import AddressFamilies, SpecsFilter
 from pants.engine.internals.native_engine import AddressParseException
+from pants.engine.internals.owners_index import SourcesOwnersIndex
 from pants.engine.internals.parametrize import Parametrize, _TargetParametrization
 from pants.engine.internals.parametrize import (  # noqa: F401
     _TargetParametrizations as _TargetParametrizations,
@@ -720,10 +721,26 @@ async def find_all_unexpanded_targets() -> AllUnexpandedTargets:
 
 
 class CycleException(Exception):
-    def __init__(self, subject: Address, path: tuple[Address, ...]) -> None:
-        path_string = "\n".join((f"-> {a}" if a == subject else f"   {a}") for a in path)
+    def __init__(
+        self,
+        subject: Address,
+        path: tuple[Address, ...],
+        *,
+        additional_cycles: Sequence[tuple[Address, tuple[Address, ...]]] = (),
+    ) -> None:
+        def format_path(subject: Address, path: tuple[Address, ...]) -> str:
+            return "\n".join((f"-> {a}" if a == subject else f"   {a}") for a in path)
+
+        if additional_cycles:
+            cycles_string = "\n\n".join(
+                format_path(s, p) for s, p in ((subject, path), *additional_cycles)
+            )
+            header = f"The dependency graph contained {len(additional_cycles) + 1} cycles:"
+        else:
+            cycles_string = format_path(subject, path)
+            header = "The dependency graph contained a cycle:"
         super().__init__(
-            f"The dependency graph contained a cycle:\n{path_string}\n\nTo fix this, first verify "
+            f"{header}\n{cycles_string}\n\nTo fix this, first verify "
             "if your code has an actual import cycle. If it does, you likely need to re-architect "
             "your code to avoid the cycle.\n\nIf there is no cycle in your code, then you may need "
             "to use more granular targets. Split up the problematic targets into smaller targets "
@@ -735,55 +752,85 @@ class CycleException(Exception):
         )
         self.subject = subject
         self.path = path
+        self.additional_cycles = tuple(additional_cycles)
+
+
+def _shortest_path(
+    sources: Iterable[Address],
+    dependency_mapping: Mapping[Address, Iterable[Address]],
+    is_target: Callable[[Address], bool],
+) -> tuple[Address, ...]:
+    """Breadth-first search for the shortest path from any of `sources` to a matching address.
+
+    The sources themselves are not tested, so a path of length 1 may only be found if one of them
+    has a dependency which matches. Returns an empty tuple if there is no such path.
+    """
+    parents: dict[Address, Address | None] = {}
+    queue: deque[Address] = deque()
+    for source in sources:
+        if source not in parents:
+            parents[source] = None
+            queue.append(source)
+    while queue:
+        address = queue.popleft()
+        for dep in dependency_mapping.get(address, ()):
+            if is_target(dep):
+                path = [dep]
+                current: Address | None = address
+                while current is not None:
+                    path.append(current)
+                    current = parents[current]
+                return tuple(reversed(path))
+            if dep not in parents:
+                parents[dep] = address
+                queue.append(dep)
+    return ()
 
 
 def _detect_cycles(
-    roots: tuple[Address, ...], dependency_mapping: dict[Address, tuple[Address, ...]]
+    roots: tuple[Address, ...], dependency_mapping: Mapping[Address, tuple[Address, ...]]
 ) -> None:
-    path_stack: OrderedSet[Address] = OrderedSet()
-    visited: set[Address] = set()
-
-    def maybe_report_cycle(address: Address) -> None:
-        # NB: File-level dependencies are cycle tolerant.
-        if address.is_file_target or address not in path_stack:
-            return
-
-        # The path of the cycle is shorter than the entire path to the cycle: if the suffix of
-        # the path representing the cycle contains a file dep, it is ignored.
-        in_cycle = False
-        for path_address in path_stack:
-            if in_cycle and path_address.is_file_target:
-                # There is a file address inside the cycle: do not report it.
-                return
-            elif in_cycle:
-                # Not a file address.
-                continue
-            else:
-                # We're entering the suffix of the path that contains the cycle if we've reached
-                # the address in question.
-                in_cycle = path_address == address
-        # If we did not break out early, it's because there were no file addresses in the cycle.
-        raise CycleException(address, (*path_stack, address))
-
-    def visit(address: Address):
-        if address in visited:
-            maybe_report_cycle(address)
-            return
-        path_stack.add(address)
-        visited.add(address)
-
-        for dep_address in dependency_mapping[address]:
-            visit(dep_address)
-
-        path_stack.remove(address)
-
-    for root in roots:
-        visit(root)
-        if path_stack:
-            raise AssertionError(
-                f"The stack of visited nodes should have been empty at the end of recursion, "
-                f"but it still contained: {path_stack}"
-            )
+    """Raise a `CycleException` describing every cycle in the mapping which is not tolerated.
+
+    File-level dependencies are cycle tolerant: a cycle is only reported if none of its members is
+    a file-level target. So rather than walking paths, we compute the strongly connected components
+    of the subgraph without any file-level targets (in O(V+E)), and report each component which
+    contains a cycle.
+    """
+    non_file_mapping = {
+        address: [dep for dep in deps if not dep.is_file_target]
+        for address, deps in dependency_mapping.items()
+        if not address.is_file_target
+    }
+    cyclic_components = [
+        component
+        for component in native_engine.strongly_connected_components(list(non_file_mapping.items()))
+        if len(component) > 1 or component[0] in non_file_mapping.get(component[0], ())
+    ]
+    if not cyclic_components:
+        return
+
+    cycles = []
+    for component in cyclic_components:
+        component_set = frozenset(component)
+        # Find the shortest path from the roots into the cycle, and then the shortest path around
+        # the cycle from the address at which it was entered.
+        subject = next((root for root in roots if root in component_set), None)
+        if subject is None:
+            path_to_cycle = _shortest_path(roots, dependency_mapping, component_set.__contains__)
+            subject = path_to_cycle[-1]
+            path_to_cycle = path_to_cycle[:-1]
+        else:
+            path_to_cycle = ()
+        cycle = _shortest_path(
+            (subject,),
+            {a: [d for d in non_file_mapping.get(a, ()) if d in component_set] for a in component},
+            subject.__eq__,
+        )
+        cycles.append((subject, (*path_to_cycle, *cycle)))
+
+    (subject, path), *additional_cycles = sorted(cycles, key=lambda c: (len(c[1]), c[1]))
+    raise CycleException(subject, path, additional_cycles=additional_cycles)
 
 
 @dataclass(frozen=True)
@@ -1051,7 +1098,7 @@ async def coarsened_targets(
 
             # For each member of the component, include the CoarsenedTarget for each of its external
             # dependencies.
-            coarsened_target = CoarsenedTarget(
+            coarsened_target = CoarsenedTarget.create(
                 (addresses_to_targets[a] for a in component),
                 (
                     coarsened_targets[d]
@@ -1233,9 +1280,50 @@ def find_source_blocks_owners(
     return Owners(owners)
 
 
+@dataclass(frozen=True)
+class _AllSourcesOwners:
+    """Every (unexpanded) target in the project, indexed by the sources that it owns and by the
+    directory that it is defined in.
+
+    This is the output of a rule so that the engine memoizes it until a BUILD file changes, rather
+    than each `OwnersRequest` re-indexing its candidate targets.
+    """
+
+    sources_index: SourcesOwnersIndex[Target]
+    targets_by_spec_path: FrozenDict[str, tuple[Target, ...]]
+
+
+def _index_sources_owners(targets: Iterable[Target]) -> SourcesOwnersIndex[Target]:
+    index: SourcesOwnersIndex[Target] = SourcesOwnersIndex()
+    for tgt in targets:
+        sources_field = tgt.get(SourcesField)
+        filespec = sources_field.filespec
+        index.add(
+            tgt,
+            filespec["includes"],
+            filespec.get("excludes", []),
+            sources_field.filespec_matcher.matches,
+        )
+    return index
+
+
+@rule(
+    desc="Index the sources of all targets", level=LogLevel.DEBUG, _masked_types=[EnvironmentName]
+)
+async def index_all_sources_owners(targets: AllUnexpandedTargets) -> _AllSourcesOwners:
+    targets_by_spec_path: DefaultDict[str, list[Target]] = defaultdict(list)
+    for tgt in targets:
+        targets_by_spec_path[tgt.address.spec_path].append(tgt)
+    return _AllSourcesOwners(
+        _index_sources_owners(targets),
+        FrozenDict((spec_path, tuple(tgts)) for spec_path, tgts in targets_by_spec_path.items()),
+    )
+
+
 @rule(desc="Find which targets own certain files", _masked_types=[EnvironmentName])
 async def find_owners(
     owners_request: OwnersRequest,
+    specs_filter: SpecsFilter,
     local_environment_name: ChosenLocalEnvironmentName,
 ) -> Owners:
     block_owners: tuple[Owners, ...] = (
@@ -1248,88 +1336,71 @@ async def find_owners(
     )
 
     # Determine which of the sources are live and which are deleted.
-    sources_paths = await path_globs_to_paths(PathGlobs(owners_request.sources))
+    sources_paths, all_sources_owners = await concurrently(
+        path_globs_to_paths(PathGlobs(owners_request.sources)),
+        index_all_sources_owners(**implicitly()),
+    )
 
     live_files = FrozenOrderedSet(sources_paths.files)
     deleted_files = FrozenOrderedSet(s for s in owners_request.sources if s not in live_files)
-    live_dirs = FrozenOrderedSet(os.path.dirname(s) for s in live_files)
-    deleted_dirs = FrozenOrderedSet(os.path.dirname(s) for s in deleted_files)
-
-    def create_live_and_deleted_gets(
-        *, filter_by_global_options: bool
-    ) -> tuple[
-        Coroutine[Any, Any, FilteredTargets | Targets],
-        Coroutine[Any, Any, UnexpandedTargets],
-    ]:
-        """Walk up the buildroot looking for targets that would conceivably claim changed sources.
-
-        For live files, we use Targets, which causes generated targets to be used rather than their
-        target generators. For deleted files we use UnexpandedTargets, which have the original
-        declared `sources` globs from target generators.
-
-        We ignore unrecognized files, which can happen e.g. when finding owners for deleted files.
-        """
-        live_raw_specs = RawSpecsWithoutFileOwners(
-            ancestor_globs=tuple(AncestorGlobSpec(directory=d) for d in live_dirs),
-            filter_by_global_options=filter_by_global_options,
-            description_of_origin="<owners rule - unused>",
-            unmatched_glob_behavior=GlobMatchErrorBehavior.ignore,
-        )
-        live_get = (
-            filter_targets(**implicitly({live_raw_specs: RawSpecsWithoutFileOwners}))
-            if filter_by_global_options
-            else resolve_targets(**implicitly({live_raw_specs: RawSpecsWithoutFileOwners}))
-        )
-        deleted_get = resolve_unexpanded_targets(
-            **implicitly(
-                RawSpecsWithoutFileOwners(
-                    ancestor_globs=tuple(AncestorGlobSpec(directory=d) for d in deleted_dirs),
-                    filter_by_global_options=filter_by_global_options,
-                    description_of_origin="<owners rule - unused>",
-                    unmatched_glob_behavior=GlobMatchErrorBehavior.ignore,
-                ),
-            )
-        )
-        return live_get, deleted_get
-
-    live_get, deleted_get = create_live_and_deleted_gets(
-        filter_by_global_options=owners_request.filter_by_global_options
-    )
-    live_candidate_tgts, deleted_candidate_tgts = await concurrently(live_get, deleted_get)
-
-    result = set()
-    unmatched_sources = set(owners_request.sources)
-    for live in (True, False):
-        candidate_tgts: Sequence[Target]
-        if live:
-            candidate_tgts = live_candidate_tgts
-            sources_set = live_files
-        else:
-            candidate_tgts = deleted_candidate_tgts
-            sources_set = deleted_files
 
+    # The targets defined in a BUILD file which is itself one of the (live) sources.
+    build_file_owners: list[Target] = []
+    if owners_request.match_if_owning_build_file_included_in_sources:
+        build_file_candidates = [
+            tgt
+            for spec_path in {os.path.dirname(s) for s in live_files}
+            for tgt in all_sources_owners.targets_by_spec_path.get(spec_path, ())
+        ]
         build_file_addresses = await concurrently(  # noqa: PNT30: requires triage
             find_build_file(
                 BuildFileAddressRequest(
                     tgt.address, description_of_origin="<owners rule - cannot trigger>"
                 )
             )
-            for tgt in candidate_tgts
+            for tgt in build_file_candidates
         )
+        build_file_owners.extend(
+            tgt
+            for tgt, bfa in zip(build_file_candidates, build_file_addresses)
+            if bfa.rel_path in live_files
+        )
+    build_file_owner_generators = {
+        tgt.address.maybe_convert_to_target_generator() for tgt in build_file_owners
+    }
 
-        for candidate_tgt, bfa in zip(candidate_tgts, build_file_addresses):
-            matching_files = set(
-                candidate_tgt.get(SourcesField).filespec_matcher.matches(list(sources_set))
-            )
+    # For live files, we use the targets that their owners expand to, so that generated targets are
+    # used rather than their target generators. The sources of those (usually generated, and so
+    # literal) targets are then matched by a much smaller index.
+    live_unexpanded_owners = all_sources_owners.sources_index.owners_of(live_files)
+    live_candidate_tgts = await resolve_targets(
+        UnexpandedTargets(FrozenOrderedSet([*live_unexpanded_owners, *build_file_owners])),
+        **implicitly(),
+    )
+    live_owners = _index_sources_owners(live_candidate_tgts).owners_of(live_files)
 
-            if not matching_files and not (
-                owners_request.match_if_owning_build_file_included_in_sources
-                and bfa.rel_path in sources_set
-            ):
-                continue
+    # For deleted files, we can only use the declared `sources` globs of target generators and
+    # other unexpanded targets.
+    deleted_owners = all_sources_owners.sources_index.owners_of(deleted_files)
 
+    def include(tgt: Target) -> bool:
+        return not owners_request.filter_by_global_options or specs_filter.matches(tgt)
+
+    result = set()
+    unmatched_sources = set(owners_request.sources)
+    for tgt in live_candidate_tgts:
+        matching_files = live_owners.get(tgt, set())
+        if not matching_files and (
+            tgt.address.maybe_convert_to_target_generator() not in build_file_owner_generators
+        ):
+            continue
+        if include(tgt):
             unmatched_sources -= matching_files
-            result.add(candidate_tgt.address)
+            result.add(tgt.address)
+    for tgt, matching_files in deleted_owners.items():
+        if include(tgt):
+            unmatched_sources -= matching_files
+            result.add(tgt.address)
 
     if (
         unmatched_sources
@@ -1744,9 +1815,12 @@ async def resolve_dependencies(
     # SpecialCasedDependencies.
     special_cased_fields = tuple(
         field
-        for field in tgt.field_values.values()
-        if isinstance(field, SpecialCasedDependencies)
-        and request.should_traverse_deps_predicate(tgt, field) == DepsTraversalBehavior.INCLUDE
+        for field in (
+            tgt[field_type]
+            for field_type in tgt.field_types
+            if issubclass(field_type, SpecialCasedDependencies)
+        )
+        if request.should_traverse_deps_predicate(tgt, field) == DepsTraversalBehavior.INCLUDE
     )
     # We can't use `resolve_unparsed_address_inputs()` directly due to a graph cycle.
     special_cased = await concurrently(
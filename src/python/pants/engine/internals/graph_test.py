@@ -28,6 +28,7 @@ from pants.engine.internals.graph import (
     TransitiveExcludesNotSupportedError,
     _DependencyMapping,
     _DependencyMappingRequest,
+    _detect_cycles,
     _TargetParametrizations,
     hydrate_sources,
 )
@@ -655,6 +656,43 @@ def test_dep_no_cycle_indirect(transitive_targets_rule_runner: RuleRunner) -> No
     }
 
 
+def test_dep_cycles_reported_together() -> None:
+    t1, t2, t3, t4, t5 = (Address("", target_name=f"t{i}") for i in range(1, 6))
+    f1 = Address("", relative_file_path="f1.txt", target_name="f")
+    mapping = {
+        t1: (t2, t4, f1),
+        t2: (t3,),
+        t3: (t2,),
+        t4: (t5,),
+        t5: (t4,),
+        # A cycle through a file-level target is tolerated.
+        f1: (t1,),
+    }
+    with pytest.raises(CycleException) as e:
+        _detect_cycles((t1,), mapping)
+    assert e.value.subject == t2
+    assert e.value.path == (t1, t2, t3, t2)
+    assert e.value.additional_cycles == ((t4, (t1, t4, t5, t4)),)
+    assert "contained 2 cycles" in str(e.value)
+
+    del mapping[t2], mapping[t3], mapping[t4], mapping[t5]
+    mapping[t1] = (f1,)
+    _detect_cycles((t1,), mapping)
+
+
+def test_dep_no_cycle_deep_chain() -> None:
+    # Cycle detection must not recurse per level of the graph.
+    chain = [Address("", target_name=f"t{i}") for i in range(20_000)]
+    mapping: dict[Address, tuple[Address, ...]] = {a: (b,) for a, b in zip(chain, chain[1:])}
+    mapping[chain[-1]] = ()
+    _detect_cycles((chain[0],), mapping)
+    mapping[chain[-1]] = (chain[0],)
+    with pytest.raises(CycleException) as e:
+        _detect_cycles((chain[0],), mapping)
+    assert e.value.subject == chain[0]
+    assert e.value.path == (*chain, chain[0])
+
+
 def test_name_explicitly_set(transitive_targets_rule_runner: RuleRunner) -> None:
     transitive_targets_rule_runner.write_files(
         {
@@ -0,0 +1,141 @@
+# Copyright 2025 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import os.path
+from collections.abc import Callable, Iterable, Sequence
+from typing import Generic, TypeVar
+
+_K = TypeVar("_K")
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+def _has_glob_chars(path_component: str) -> bool:
+    return any(c in _GLOB_CHARS for c in path_component)
+
+
+def _literal_dir_prefix(glob: str) -> tuple[str, ...]:
+    """The leading directory components of `glob` that contain no wildcards.
+
+    For example, `src/python/**/*.py` yields `("src", "python")`, and `src/app.py` yields
+    `("src",)`.
+    """
+    components = os.path.normpath(glob).split(os.sep)
+    prefix = []
+    for component in components[:-1]:
+        if component in ("", ".") or _has_glob_chars(component):
+            break
+        if component == "..":
+            # A glob that escapes its directory cannot be anchored in the trie: fall back to the
+            # root so that it is considered for every path.
+            return ()
+        prefix.append(component)
+    return tuple(prefix)
+
+
+_GlobOwner = tuple[_K, Callable[[Sequence[str]], Sequence[str]]]
+
+
+class _TrieNode(Generic[_K]):
+    __slots__ = ("children", "literal_files", "glob_owners")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode[_K]] = {}
+        # File name within this directory -> keys which own that exact file.
+        self.literal_files: dict[str, list[_K]] = {}
+        # Keys whose globs are anchored at this directory, and must be matched per-path.
+        self.glob_owners: list[_GlobOwner[_K]] = []
+
+    def child(self, component: str) -> _TrieNode[_K]:
+        node = self.children.get(component)
+        if node is None:
+            node = self.children[component] = _TrieNode()
+        return node
+
+
+class SourcesOwnersIndex(Generic[_K]):
+    """A directory trie mapping source paths (relative to the build root) to the keys that own them.
+
+    Each owner is inserted with its (build root relative) include and exclude globs. Owners whose
+    includes are all literal file paths become literal-file leaves, and are matched with a single
+    dict lookup. Any other owner becomes a glob leaf in the deepest directory that all of its
+    includes share a literal prefix with, and is only consulted (via its `matcher`) for paths that
+    live below that directory.
+
+    Looking up a path then costs a walk from the root to the path's directory rather than a match
+    against every owner, and each glob owner is matched once against a whole batch of paths.
+    """
+
+    def __init__(self) -> None:
+        self._root: _TrieNode[_K] = _TrieNode()
+
+    def _node_for(self, components: Iterable[str]) -> _TrieNode[_K]:
+        node = self._root
+        for component in components:
+            node = node.child(component)
+        return node
+
+    def add(
+        self,
+        key: _K,
+        includes: Sequence[str],
+        excludes: Sequence[str],
+        matcher: Callable[[Sequence[str]], Sequence[str]],
+    ) -> None:
+        """Register `key` as owning the paths matched by `includes` and not `excludes`.
+
+        `matcher` must filter a sequence of paths down to those matched by the globs: it is only
+        called for paths which might match.
+        """
+        if not includes:
+            return
+        if not excludes and not any(_has_glob_chars(include) for include in includes):
+            for include in includes:
+                dirname, basename = os.path.split(os.path.normpath(include))
+                node = self._node_for(dirname.split(os.sep) if dirname else ())
+                node.literal_files.setdefault(basename, []).append(key)
+            return
+
+        prefixes = [_literal_dir_prefix(include) for include in includes]
+        common: list[str] = []
+        for components in zip(*prefixes):
+            if any(component != components[0] for component in components):
+                break
+            common.append(components[0])
+        self._node_for(common).glob_owners.append((key, matcher))
+
+    def owners_of(self, paths: Iterable[str]) -> dict[_K, set[str]]:
+        """The keys owning any of `paths`, each mapped to the subset of `paths` that it owns.
+
+        Each glob owner's `matcher` is called at most once, with all of the paths below its anchor.
+        """
+        result: dict[_K, set[str]] = {}
+        # Keyed by the identity of each glob owner entry, since matchers need not be hashable.
+        pending: dict[int, tuple[_GlobOwner[_K], list[str]]] = {}
+
+        def visit_globs(node: _TrieNode[_K], path: str) -> None:
+            for glob_owner in node.glob_owners:
+                pending.setdefault(id(glob_owner), (glob_owner, []))[1].append(path)
+
+        for path in paths:
+            dirname, basename = os.path.split(path)
+            node: _TrieNode[_K] | None = self._root
+            for component in dirname.split(os.sep) if dirname else ():
+                assert node is not None
+                visit_globs(node, path)
+                node = node.children.get(component)
+                if node is None:
+                    break
+            if node is None:
+                continue
+            visit_globs(node, path)
+            for key in node.literal_files.get(basename, ()):
+                result.setdefault(key, set()).add(path)
+
+        for (key, matcher), candidate_paths in pending.values():
+            matched = matcher(candidate_paths)
+            if matched:
+                result.setdefault(key, set()).update(matched)
+        return result
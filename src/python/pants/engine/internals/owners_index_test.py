@@ -0,0 +1,105 @@
+# Copyright 2025 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import fnmatch
+from collections.abc import Callable, Sequence
+
+from pants.engine.internals.owners_index import SourcesOwnersIndex
+
+
+def fnmatcher(
+    includes: Sequence[str], excludes: Sequence[str] = ()
+) -> Callable[[Sequence[str]], Sequence[str]]:
+    def matches(paths: Sequence[str]) -> list[str]:
+        return [
+            p
+            for p in paths
+            if any(fnmatch.fnmatchcase(p, i) for i in includes)
+            and not any(fnmatch.fnmatchcase(p, e) for e in excludes)
+        ]
+
+    return matches
+
+
+def make_index(owners: dict[str, tuple[list[str], list[str]]]) -> SourcesOwnersIndex[str]:
+    index: SourcesOwnersIndex[str] = SourcesOwnersIndex()
+    for key, (includes, excludes) in owners.items():
+        index.add(key, includes, excludes, fnmatcher(includes, excludes))
+    return index
+
+
+def owners_of(index: SourcesOwnersIndex[str], path: str) -> list[str]:
+    return sorted(index.owners_of([path]))
+
+
+def test_literal_files() -> None:
+    index = make_index(
+        {
+            "a": (["src/a.py"], []),
+            "a_and_b": (["src/a.py", "src/sub/b.py"], []),
+            "root": (["c.py"], []),
+        }
+    )
+    assert owners_of(index, "src/a.py") == ["a", "a_and_b"]
+    assert owners_of(index, "src/sub/b.py") == ["a_and_b"]
+    assert owners_of(index, "c.py") == ["root"]
+    assert owners_of(index, "src/c.py") == []
+    assert owners_of(index, "other/a.py") == []
+
+
+def test_globs() -> None:
+    index = make_index(
+        {
+            "src": (["src/*.py"], []),
+            "excluded": (["src/*.py"], ["src/test_*.py"]),
+            "unanchored": (["*.md"], []),
+            "split": (["src/a/*.txt", "src/b/*.txt"], []),
+        }
+    )
+    assert owners_of(index, "src/app.py") == ["excluded", "src"]
+    assert owners_of(index, "src/test_app.py") == ["src"]
+    assert owners_of(index, "src/a/data.txt") == ["split"]
+    assert owners_of(index, "src/b/data.txt") == ["split"]
+    assert owners_of(index, "src/c/data.txt") == []
+    assert owners_of(index, "README.md") == ["unanchored"]
+
+
+def test_glob_matcher_only_called_below_anchor() -> None:
+    calls: list[str] = []
+
+    def matcher(paths: Sequence[str]) -> list[str]:
+        calls.extend(paths)
+        return list(paths)
+
+    index: SourcesOwnersIndex[str] = SourcesOwnersIndex()
+    index.add("deep", ["src/python/project/*.py"], [], matcher)
+    assert owners_of(index, "src/java/Foo.java") == []
+    assert owners_of(index, "src/python/other/app.py") == []
+    assert not calls
+    assert owners_of(index, "src/python/project/app.py") == ["deep"]
+    assert calls == ["src/python/project/app.py"]
+
+
+def test_batched_lookup() -> None:
+    calls: list[list[str]] = []
+
+    def matcher(paths: Sequence[str]) -> list[str]:
+        calls.append(list(paths))
+        return [p for p in paths if p.endswith(".py")]
+
+    index: SourcesOwnersIndex[str] = SourcesOwnersIndex()
+    index.add("glob", ["src/**/*.py"], [], matcher)
+    index.add("literal", ["src/a/app.py"], [], matcher)
+    assert index.owners_of(["src/a/app.py", "src/b/lib.py", "src/b/data.txt", "other.py"]) == {
+        "glob": {"src/a/app.py", "src/b/lib.py"},
+        "literal": {"src/a/app.py"},
+    }
+    # The glob owner is matched against all of the paths below its anchor in a single call.
+    assert calls == [["src/a/app.py", "src/b/lib.py", "src/b/data.txt"]]
+
+
+def test_no_includes() -> None:
+    index = make_index({"empty": ([], [])})
+    assert owners_of(index, "anything.py") == []
@@ -3,19 +3,20 @@
 
 from __future__ import annotations
 
+import ast
+import functools
 import inspect
 import itertools
 import logging
 import re
 import threading
-import tokenize
 import traceback
 import typing
 from collections.abc import Callable, Iterable, Mapping
 from dataclasses import InitVar, dataclass, field
 from difflib import get_close_matches
-from io import StringIO
 from pathlib import PurePath
+from types import CodeType
 from typing import Annotated, Any, TypeVar
 
 import typing_extensions
@@ -449,7 +450,7 @@ class Parser:
             defined_symbols = set()
             while True:
                 try:
-                    code = compile(build_file_content, filepath, "exec", dont_inherit=True)
+                    code = compile_build_file(filepath, build_file_content).code
                     exec(code, global_symbols)
                 except NameError as e:
                     bad_symbol = _extract_symbol_from_name_error(e)
@@ -476,7 +477,7 @@ class Parser:
             return self._parse_state.parsed_targets()
 
         try:
-            code = compile(build_file_content, filepath, "exec", dont_inherit=True)
+            code = compile_build_file(filepath, build_file_content).code
             exec(code, global_symbols)
         except NameError as e:
             frame = traceback.extract_tb(e.__traceback__, limit=-1)[0]
@@ -509,24 +510,90 @@ class Parser:
         return self._parse_state.parsed_targets()
 
 
+@dataclass(frozen=True)
+class CompiledBuildFile:
+    """A BUILD file (or prelude), compiled with a single pass over its AST."""
+
+    code: CodeType
+    # The names of the environment variables read via `env()`.
+    env_vars: tuple[str, ...]
+    # The line of the first import statement, if any.
+    import_lineno: int | None
+
+
+class _BuildFileVisitor(ast.NodeVisitor):
+    def __init__(self, filename: str):
+        super().__init__()
+        self.env_vars: set[str] = set()
+        self.import_lineno: int | None = None
+        self.filename = filename
+
+    def visit_Import(self, node: ast.Import | ast.ImportFrom) -> None:
+        if self.import_lineno is None or node.lineno < self.import_lineno:
+            self.import_lineno = node.lineno
+
+    visit_ImportFrom = visit_Import
+
+    def visit_Call(self, node: ast.Call) -> None:
+        is_env = isinstance(node.func, ast.Name) and node.func.id == "env"
+        for arg in node.args:
+            if not is_env:
+                self.visit(arg)
+                continue
+
+            # Only first arg may be checked as env name
+            is_env = False
+
+            value = (
+                arg.value if isinstance(arg, ast.Constant) and isinstance(arg.value, str) else None
+            )
+            if value:
+                # Found env name in this call, we're done here.
+                self.env_vars.add(value)
+                return
+            else:
+                logger.warning(
+                    f"{self.filename}:{arg.lineno}: Only constant string values as variable name to "
+                    f"`env()` is currently supported. This `env()` call will always result in "
+                    "the default value only."
+                )
+
+        for kwarg in node.keywords:
+            self.visit(kwarg)
+
+
+# NB: BUILD files are re-parsed whenever anything they depend on changes (e.g. the `__defaults__`
+# of a parent directory), usually with unchanged content. The key includes the path, since it is
+# recorded in the code object.
+@functools.lru_cache(maxsize=8192)
+def compile_build_file(filepath: str, build_file_content: str) -> CompiledBuildFile:
+    """Parse a BUILD file once, to find its env var references and imports, and compile it.
+
+    Raises `SyntaxError` if the content is not valid Python.
+    """
+    tree = ast.parse(build_file_content, filepath)
+    visitor = _BuildFileVisitor(filepath)
+    visitor.visit(tree)
+    return CompiledBuildFile(
+        code=compile(tree, filepath, "exec", dont_inherit=True),
+        env_vars=tuple(sorted(visitor.env_vars)),
+        import_lineno=visitor.import_lineno,
+    )
+
+
 def error_on_imports(build_file_content: str, filepath: str) -> None:
     # This is poor sandboxing; there are many ways to get around this. But it's sufficient to tell
     # users who aren't malicious that they're doing something wrong, and it has a low performance
     # overhead.
-    if "import" not in build_file_content:
+    lineno = compile_build_file(filepath, build_file_content).import_lineno
+    if lineno is None:
         return
-    io_wrapped_python = StringIO(build_file_content)
-    for token in tokenize.generate_tokens(io_wrapped_python.readline):
-        token_str = token[1]
-        lineno, _ = token[2]
-        if token_str != "import":
-            continue
-        raise ParseError(
-            f"Import used in {filepath} at line {lineno}. Import statements are banned in "
-            "BUILD files and macros (that act like a normal BUILD file) because they can easily "
-            "break Pants caching and lead to stale results. "
-            f"\n\nInstead, consider writing a plugin ({doc_url('docs/writing-plugins/overview')})."
-        )
+    raise ParseError(
+        f"Import used in {filepath} at line {lineno}. Import statements are banned in "
+        "BUILD files and macros (that act like a normal BUILD file) because they can easily "
+        "break Pants caching and lead to stale results. "
+        f"\n\nInstead, consider writing a plugin ({doc_url('docs/writing-plugins/overview')})."
+    )
 
 
 def _extract_symbol_from_name_error(err: NameError) -> str:
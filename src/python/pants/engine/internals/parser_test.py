@@ -19,6 +19,7 @@ from pants.engine.internals.parser import (
     ParseError,
     Parser,
     _extract_symbol_from_name_error,
+    compile_build_file,
 )
 from pants.engine.target import InvalidFieldException, RegisteredTargetTypes, StringField
 from pants.engine.unions import UnionMembership
@@ -255,3 +256,27 @@ def test_unrecognized_symbol_in_prelude(
         'build_file_dir', 'caof', 'env', 'macro', 'obj']
         """
     )
+
+
+def test_compile_build_file() -> None:
+    content = dedent(
+        """\
+        tgt(name=env("NAME"), tags=[env("TAG", "default")])
+
+        def macro():
+            from os import path
+        """
+    )
+    compiled = compile_build_file("dir/BUILD", content)
+    assert compiled.env_vars == ("NAME", "TAG")
+    assert compiled.import_lineno == 4
+    assert compiled.code.co_filename == "dir/BUILD"
+    # The result is cached by path and content.
+    assert compile_build_file("dir/BUILD", content) is compiled
+    assert compile_build_file("other/BUILD", content).code.co_filename == "other/BUILD"
+
+    assert compile_build_file("dir/BUILD", "x = 'import os'  # import os").import_lineno is None
+    # Only string constants name environment variables.
+    assert compile_build_file("dir/BUILD", "env('A'); env(1); env(None)").env_vars == ("A",)
+    with pytest.raises(SyntaxError):
+        compile_build_file("dir/BUILD", "tgt(")
@@ -315,6 +315,14 @@ class Scheduler:
     def invalidate_all(self) -> None:
         native_engine.graph_invalidate_all(self.py_scheduler)
 
+    def evict_least_recently_used(self, fraction: float) -> int:
+        """Evict the memoized values of the given fraction of the (non-running) nodes in the graph
+        to release memory, in order of the run in which they were last requested.
+
+        Returns the number of nodes whose values were evicted.
+        """
+        return native_engine.graph_evict_least_recently_used(self.py_scheduler, fraction)
+
     def check_invalidation_watcher_liveness(self) -> None:
         native_engine.check_invalidation_watcher_liveness(self.py_scheduler)
 
@@ -461,6 +469,13 @@ class SchedulerSession:
         self._maybe_visualize()
         return invalidated
 
+    def evict_least_recently_used(self, fraction: float) -> int:
+        """Evicts the memoized values of the least recently used fraction of the nodes in an
+        internal product Graph instance."""
+        evicted = self._scheduler.evict_least_recently_used(fraction)
+        self._maybe_visualize()
+        return evicted
+
     def metrics(self) -> dict[str, int]:
         """Returns metrics for this SchedulerSession as a dict of metric name to metric value."""
         return native_engine.scheduler_metrics(self.py_scheduler, self.py_session)
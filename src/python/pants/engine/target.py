@@ -11,6 +11,7 @@ import itertools
 import logging
 import os.path
 import textwrap
+import weakref
 import zlib
 from abc import ABC, ABCMeta, abstractmethod
 from collections import deque
@@ -20,7 +21,6 @@ from enum import Enum
 from operator import attrgetter
 from pathlib import PurePath
 from typing import (
-    AbstractSet,
     Any,
     ClassVar,
     Generic,
@@ -234,6 +234,50 @@ class FieldDefaults:
 _F = TypeVar("_F", bound=Field)
 
 
+class _FieldTypesTable:
+    """The registered field types of a target type, precomputed for constructing its instances."""
+
+    def __init__(self, field_types: Iterable[type[Field]]) -> None:
+        # In registration order.
+        self.field_types: tuple[type[Field], ...] = tuple(field_types)
+        # In the order used for `Target.field_values`.
+        self.field_types_by_alias: tuple[type[Field], ...] = tuple(
+            sorted(self.field_types, key=attrgetter("alias"))
+        )
+        self.field_types_view: KeysView[type[Field]] = dict.fromkeys(
+            self.field_types_by_alias
+        ).keys()
+        # In registration order, which determines which error is raised first for a target which
+        # is missing several required fields.
+        self.required_field_types: tuple[type[Field], ...] = tuple(
+            field_type for field_type in self.field_types if field_type.required
+        )
+        self.aliases_to_field_types: dict[str, type[Field]] = (
+            Target._get_field_aliases_to_field_types(self.field_types)
+        )
+        # Requested field types to the registered field type which is (or subclasses) them, if any.
+        self._registered_field_types: dict[type[Field], type[Field] | None] = {
+            field_type: field_type for field_type in self.field_types
+        }
+
+    def has_field_types(self, requested_fields: Iterable[type[Field]]) -> bool:
+        return all(
+            self.registered_field_type(requested_field) is not None
+            for requested_field in requested_fields
+        )
+
+    def registered_field_type(self, requested_field: type[_F]) -> type[_F] | None:
+        """The registered field type which is or subclasses `requested_field`, if any."""
+        try:
+            return cast("type[_F] | None", self._registered_field_types[requested_field])
+        except KeyError:
+            result = Target._find_registered_field_subclass(
+                requested_field, registered_fields=self.field_types_by_alias
+            )
+            self._registered_field_types[requested_field] = result
+            return result
+
+
 @dataclass(frozen=True)
 class Target:
     """A Target represents an addressable set of metadata.
@@ -256,7 +300,10 @@ class Target:
 
     # These get calculated in the constructor
     address: Address
-    field_values: FrozenDict[type[Field], Field]
+    # Only the fields which were explicitly set: the others are created when they are accessed.
+    # See `field_values`.
+    _explicit_field_values: FrozenDict[type[Field], Field]
+    _field_types_table: _FieldTypesTable
     residence_dir: str
     name_explicitly_set: bool
     description_of_origin: str
@@ -322,13 +369,15 @@ class Target:
         object.__setattr__(self, "origin_sources_blocks", origin_sources_blocks)
         object.__setattr__(self, "name_explicitly_set", name_explicitly_set)
         try:
+            field_types_table = self._get_field_types_table(union_membership)
+            object.__setattr__(self, "_field_types_table", field_types_table)
             object.__setattr__(
                 self,
-                "field_values",
-                self._calculate_field_values(
+                "_explicit_field_values",
+                self._calculate_explicit_field_values(
                     unhydrated_values,
                     address,
-                    union_membership,
+                    field_types_table,
                     ignore_unrecognized_fields=ignore_unrecognized_fields,
                 ),
             )
@@ -340,18 +389,16 @@ class Target:
             ) from e
 
     @final
-    def _calculate_field_values(
+    def _calculate_explicit_field_values(
         self,
         unhydrated_values: Mapping[str, Any],
         address: Address,
-        # See `__init__`.
-        union_membership: UnionMembership | None,
+        field_types_table: _FieldTypesTable,
         *,
         ignore_unrecognized_fields: bool,
     ) -> FrozenDict[type[Field], Field]:
-        all_field_types = self.class_field_types(union_membership)
         field_values = {}
-        aliases_to_field_types = self._get_field_aliases_to_field_types(all_field_types)
+        aliases_to_field_types = field_types_table.aliases_to_field_types
 
         for alias, value in unhydrated_values.items():
             if alias not in aliases_to_field_types:
@@ -374,18 +421,44 @@ class Target:
             field_type = aliases_to_field_types[alias]
             field_values[field_type] = field_type(value, address)
 
-        # For undefined fields, mark the raw value as missing.
-        for field_type in all_field_types:
-            if field_type in field_values:
-                continue
-            field_values[field_type] = field_type(NO_VALUE, address)
+        # Fields which were left unset are created when they are accessed, except for required
+        # fields, which must fail eagerly.
+        for field_type in field_types_table.required_field_types:
+            if field_type not in field_values:
+                field_values[field_type] = field_type(NO_VALUE, address)
         return FrozenDict(
-            sorted(
-                field_values.items(),
-                key=lambda field_type_to_val_pair: field_type_to_val_pair[0].alias,
-            )
+            (field_type, field_values[field_type])
+            for field_type in field_types_table.field_types_by_alias
+            if field_type in field_values
         )
 
+    @final
+    @property
+    def field_values(self) -> FrozenDict[type[Field], Field]:
+        """All of the registered fields of this target, ordered by alias.
+
+        Fields which were not explicitly set are created with their default values on each access,
+        so prefer `tgt.get()` or `tgt[]` to access individual fields.
+        """
+        return FrozenDict(
+            (field_type, self._field_value(field_type))
+            for field_type in self._field_types_table.field_types_by_alias
+        )
+
+    @final
+    def _field_value(self, field_type: type[_F]) -> _F:
+        """Get the instance of the given registered field type."""
+        field = self._explicit_field_values.get(field_type)
+        if field is None:
+            field = field_type(NO_VALUE, self.address)
+        return cast(_F, field)
+
+    @final
+    @classmethod
+    @memoized_method
+    def _get_field_types_table(cls, union_membership: UnionMembership | None) -> _FieldTypesTable:
+        return _FieldTypesTable(cls.class_field_types(union_membership))
+
     @final
     @classmethod
     def _get_field_aliases_to_field_types(
@@ -401,7 +474,7 @@ class Target:
     @final
     @property
     def field_types(self) -> KeysView[type[Field]]:
-        return self.field_values.keys()
+        return self._field_types_table.field_types_view
 
     @distinct_union_type_per_subclass
     class PluginField:
@@ -424,16 +497,21 @@ class Target:
         return f"{self.alias}({address}{fields})"
 
     def __hash__(self) -> int:
-        return hash((self.__class__, self.address, self.residence_dir, self.field_values))
+        return hash((self.__class__, self.address, self.residence_dir, self._explicit_field_values))
 
     def __eq__(self, other: Target | Any) -> bool:
         if not isinstance(other, Target):
             return NotImplemented
-        return (self.__class__, self.address, self.residence_dir, self.field_values) == (
+        return (
+            self.__class__,
+            self.address,
+            self.residence_dir,
+            self._explicit_field_values,
+        ) == (
             other.__class__,
             other.address,
             other.residence_dir,
-            other.field_values,
+            other._explicit_field_values,
         )
 
     def __lt__(self, other: Any) -> bool:
@@ -483,15 +561,10 @@ class Target:
 
     @final
     def _maybe_get(self, field: type[_F]) -> _F | None:
-        result = self.field_values.get(field, None)
-        if result is not None:
-            return cast(_F, result)
-        field_subclass = self._find_registered_field_subclass(
-            field, registered_fields=self.field_values.keys()
-        )
-        if field_subclass is not None:
-            return cast(_F, self.field_values[field_subclass])
-        return None
+        field_type = self._field_types_table.registered_field_type(field)
+        if field_type is None:
+            return None
+        return self._field_value(field_type)
 
     @final
     def __getitem__(self, field: type[_F]) -> _F:
@@ -538,22 +611,6 @@ class Target:
             return result
         return field(default_raw_value, self.address)
 
-    @final
-    @classmethod
-    def _has_fields(
-        cls, fields: Iterable[type[Field]], *, registered_fields: AbstractSet[type[Field]]
-    ) -> bool:
-        unrecognized_fields = [field for field in fields if field not in registered_fields]
-        if not unrecognized_fields:
-            return True
-        for unrecognized_field in unrecognized_fields:
-            maybe_subclass = cls._find_registered_field_subclass(
-                unrecognized_field, registered_fields=registered_fields
-            )
-            if maybe_subclass is None:
-                return False
-        return True
-
     @final
     def has_field(self, field: type[Field]) -> bool:
         """Check that this target has registered the requested field.
@@ -572,7 +629,7 @@ class Target:
         custom subclass `CustomTags`, both `tgt.has_fields([Tags])` and
         `python_tgt.has_fields([CustomTags])` will return True.
         """
-        return self._has_fields(fields, registered_fields=self.field_values.keys())
+        return self._field_types_table.has_field_types(fields)
 
     @final
     @classmethod
@@ -604,7 +661,7 @@ class Target:
     ) -> bool:
         """Behaves like `Target.has_fields()`, but works as a classmethod rather than an instance
         method."""
-        return cls._has_fields(fields, registered_fields=cls.class_field_types(union_membership))
+        return cls._get_field_types_table(union_membership).has_field_types(fields)
 
     @final
     @classmethod
@@ -812,6 +869,13 @@ class AlwaysTraverseDeps(ShouldTraverseDepsPredicate):
 
 
 class CoarsenedTarget(EngineAwareParameter):
+    # Live instances, keyed by their members and the identities of their dependencies. Because
+    # dependencies are themselves interned, structurally equal DAGs built by different rule
+    # invocations share instances, and so usually compare equal by identity.
+    _interned: weakref.WeakValueDictionary[
+        tuple[FrozenOrderedSet[Target], tuple[int, ...]], CoarsenedTarget
+    ] = weakref.WeakValueDictionary()
+
     def __init__(self, members: Iterable[Target], dependencies: Iterable[CoarsenedTarget]) -> None:
         """A set of Targets which cyclically reach one another, and are thus indivisible.
 
@@ -825,6 +889,26 @@ class CoarsenedTarget(EngineAwareParameter):
         self.members = FrozenOrderedSet(members)
         self.dependencies = FrozenOrderedSet(dependencies)
         self._hashcode = hash((self.members, self.dependencies))
+        self._coarsened_closure: tuple[CoarsenedTarget, ...] | None = None
+
+    @classmethod
+    def create(
+        cls, members: Iterable[Target], dependencies: Iterable[CoarsenedTarget]
+    ) -> CoarsenedTarget:
+        """Return an interned CoarsenedTarget for the given members and dependencies.
+
+        An existing live instance with equal members and identical dependencies is returned if
+        there is one, which allows the (transitive) closure cached on it to be reused.
+        """
+        coarsened_target = cls(members, dependencies)
+        key = (coarsened_target.members, tuple(id(d) for d in coarsened_target.dependencies))
+        existing = cls._interned.get(key)
+        if existing is not None:
+            return existing
+        # NB: Racing creators may each store an instance: that is harmless, since the instances
+        # are equal.
+        cls._interned[key] = coarsened_target
+        return coarsened_target
 
     def debug_hint(self) -> str:
         return str(self)
@@ -848,9 +932,22 @@ class CoarsenedTarget(EngineAwareParameter):
     def coarsened_closure(
         self, visited: set[CoarsenedTarget] | None = None
     ) -> Iterator[CoarsenedTarget]:
-        """All CoarsenedTargets reachable from this root."""
+        """All CoarsenedTargets reachable from this root.
 
-        visited = set() if visited is None else visited
+        If `visited` is given, CoarsenedTargets in it are skipped (along with their dependencies),
+        and those yielded are added to it. Otherwise, the closure is computed once per instance,
+        and then reused.
+        """
+        if visited is not None:
+            # NB: Roots which share a `visited` set each walk only the portion of the graph that
+            # no other root has, and so the walks cost O(V+E) in total. Caching each root's
+            # complete closure here would instead cost the sum of their sizes.
+            return self._walk_closure(visited)
+        if self._coarsened_closure is None:
+            self._coarsened_closure = tuple(self._walk_closure(set()))
+        return iter(self._coarsened_closure)
+
+    def _walk_closure(self, visited: set[CoarsenedTarget]) -> Iterator[CoarsenedTarget]:
         queue = deque([self])
         while queue:
             ct = queue.popleft()
@@ -864,24 +961,25 @@ class CoarsenedTarget(EngineAwareParameter):
         return self._hashcode
 
     def _eq_helper(self, other: CoarsenedTarget, equal_items: set[tuple[int, int]]) -> bool:
-        key = (id(self), id(other))
-        if key[0] == key[1] or key in equal_items:
-            return True
-
-        is_eq = (
-            self._hashcode == other._hashcode
-            and self.members == other.members
-            and len(self.dependencies) == len(other.dependencies)
-            and all(
-                l._eq_helper(r, equal_items) for l, r in zip(self.dependencies, other.dependencies)
-            )
-        )
-
-        # NB: We only track equal items because any non-equal item will cause the entire
-        # operation to shortcircuit.
-        if is_eq:
+        # NB: This walks the two DAGs with an explicit stack rather than recursively, so that deep
+        # graphs cannot exhaust the interpreter's stack. Pairs are recorded in `equal_items` as
+        # they are reached rather than once they have been fully compared: that is safe because
+        # any non-equal pair causes the entire operation to shortcircuit.
+        stack = [(self, other)]
+        while stack:
+            left, right = stack.pop()
+            key = (id(left), id(right))
+            if key[0] == key[1] or key in equal_items:
+                continue
+            if not (
+                left._hashcode == right._hashcode
+                and left.members == right.members
+                and len(left.dependencies) == len(right.dependencies)
+            ):
+                return False
             equal_items.add(key)
-        return is_eq
+            stack.extend(zip(left.dependencies, right.dependencies))
+        return True
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, CoarsenedTarget):
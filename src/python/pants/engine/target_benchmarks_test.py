@@ -0,0 +1,112 @@
+# Copyright 2025 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import gc
+import os
+import time
+import tracemalloc
+from collections.abc import Callable
+from functools import partial
+
+from pants.engine.addresses import Address
+from pants.engine.target import BoolField, StringField, StringSequenceField, Target
+from pants.testutil.benchmark_util import BenchmarkResults
+
+# NB: These benchmarks only run when their results are requested. When running under Pants, pass
+# the target count through with `--test-extra-env-vars`.
+TARGETS_ENV_VAR = "PANTS_TARGET_BENCHMARKS_TARGETS"
+
+BENCHMARK_RESULTS = BenchmarkResults("PANTS_TARGET_BENCHMARKS_RESULTS")
+pytestmark = BENCHMARK_RESULTS.opt_in
+write_results = BENCHMARK_RESULTS.write_results_fixture()
+
+# A synthetic target type with as many fields as a target type accumulates from plugins in a
+# large repo, most of which are left unset in BUILD files.
+_FIELD_COUNT = 40
+
+_results = BENCHMARK_RESULTS.results
+
+
+def _target_count() -> int:
+    return int(os.environ.get(TARGETS_ENV_VAR, "100000"))
+
+
+def _field_type(index: int) -> type:
+    base = (StringField, BoolField, StringSequenceField)[index % 3]
+    attrs: dict = {"alias": f"field_{index}", "help": "A synthetic field."}
+    if base is BoolField:
+        attrs["default"] = False
+    return type(f"SyntheticField{index}", (base,), attrs)
+
+
+class SyntheticTarget(Target):
+    alias = "synthetic"
+    core_fields = tuple(_field_type(i) for i in range(_FIELD_COUNT))
+    help = "A synthetic target."
+
+
+def _field_value(index: int, target_index: int) -> str | bool | list[str]:
+    return (f"value-{target_index}", True, ["a", "b"])[index % 3]
+
+
+def _create_targets(target_count: int, *, set_field_count: int) -> list[SyntheticTarget]:
+    return [
+        SyntheticTarget(
+            {f"field_{f}": _field_value(f, i) for f in range(set_field_count)},
+            Address(f"src/dir{i % 100}", target_name=f"t{i}"),
+        )
+        for i in range(target_count)
+    ]
+
+
+def _allocated_bytes(create: Callable[[], object]) -> int:
+    """The bytes which remain allocated by the object that `create` returns."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        created = create()
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del created
+    return allocated
+
+
+def test_bench_target_memory() -> None:
+    target_count = _target_count()
+    bytes_per_target = {
+        set_field_count: _allocated_bytes(
+            partial(_create_targets, target_count, set_field_count=set_field_count)
+        )
+        / target_count
+        for set_field_count in (3, _FIELD_COUNT)
+    }
+    _results["target_memory"] = {
+        "targets": target_count,
+        "fields": _FIELD_COUNT,
+        "bytes_per_target_by_set_field_count": bytes_per_target,
+    }
+    # Fields which are left unset are not stored, and so cost nothing per target.
+    assert bytes_per_target[3] < bytes_per_target[_FIELD_COUNT]
+
+
+class UnrelatedField(StringField):
+    alias = "unrelated"
+    help = "A field which is not registered on the synthetic target."
+
+
+def test_bench_field_lookups() -> None:
+    # Requesting the base classes of registered fields (as `FieldSet.required_fields` usually do)
+    # exercises the subclass lookup, and requesting unregistered fields exercises misses.
+    registered_fields = (StringField, BoolField, StringSequenceField)
+    targets = _create_targets(_target_count(), set_field_count=3)
+    start = time.perf_counter()
+    for tgt in targets:
+        assert tgt.has_fields(registered_fields)
+        assert not tgt.has_fields((*registered_fields, UnrelatedField))
+        assert tgt.get(StringField).value is not None
+        assert tgt.get(UnrelatedField).value is None
+    elapsed = time.perf_counter() - start
+    _results["field_lookups"] = {"targets": len(targets), "seconds": elapsed}
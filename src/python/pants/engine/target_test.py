@@ -262,6 +262,50 @@ def test_has_fields() -> None:
     )
 
 
+def test_field_subclass_lookups() -> None:
+    class CustomVersion(FortranVersion):
+        alias = "custom_version"
+
+    class CustomTarget(Target):
+        alias = "custom"
+        core_fields = (FortranExtensions, CustomVersion)
+
+    empty_union_membership = UnionMembership.empty()
+    # NB: Lookups are memoized per target type, and so these are repeated (and interleaved between
+    # target types) to check that the results are consistent.
+    for i in range(2):
+        fortran_tgt = FortranTarget({"version": "dev0"}, Address("", target_name=f"fortran{i}"))
+        custom_tgt = CustomTarget({"custom_version": "dev1"}, Address("", target_name=f"custom{i}"))
+
+        # A request for a superclass of a registered field finds the registered subclass.
+        for superclass in (FortranVersion, StringField):
+            assert custom_tgt.has_field(superclass) is True
+            assert custom_tgt.has_fields([FortranExtensions, superclass]) is True
+            assert (
+                CustomTarget.class_has_field(superclass, union_membership=empty_union_membership)
+                is True
+            )
+            assert custom_tgt[superclass] is custom_tgt[CustomVersion]
+            assert custom_tgt.get(superclass) is custom_tgt[CustomVersion]
+            assert custom_tgt.get(superclass).value == "dev1"
+
+        # While a request for a subclass of a registered field does not find it.
+        assert fortran_tgt.has_field(CustomVersion) is False
+        assert fortran_tgt.has_fields([FortranExtensions, CustomVersion]) is False
+        assert (
+            FortranTarget.class_has_field(CustomVersion, union_membership=empty_union_membership)
+            is False
+        )
+        with pytest.raises(KeyError):
+            fortran_tgt[CustomVersion]
+        assert fortran_tgt.get(CustomVersion).value is None
+
+        # And each target type finds its own registered field.
+        assert fortran_tgt.get(FortranVersion) is fortran_tgt[FortranVersion]
+        assert fortran_tgt.get(StringField).value == "dev0"
+        assert custom_tgt.has_field(UnrelatedField) is False
+
+
 def test_add_custom_fields() -> None:
     class CustomField(BoolField):
         alias = "custom_field"
@@ -466,6 +510,39 @@ def test_async_field_mixin() -> None:
     assert hash(field) != hash(subclass)
 
 
+def test_only_explicit_fields_stored() -> None:
+    class AsyncField(StringField, AsyncFieldMixin):
+        alias = "async_field"
+
+    class RequiredField(StringField):
+        alias = "required_field"
+        required = True
+
+    class SparseTarget(Target):
+        alias = "sparse"
+        core_fields = (FortranExtensions, FortranVersion, AsyncField, RequiredField)
+
+    tgt = SparseTarget({"version": "dev0", "required_field": "x"}, Address("", target_name="t"))
+    # Only the fields which were set are stored...
+    assert set(tgt._explicit_field_values) == {FortranVersion, RequiredField}
+    # ...and the others are created with their defaults when accessed.
+    assert tgt[FortranExtensions].value == ()
+    assert tgt[AsyncField].value is None
+    assert tgt[AsyncField].address == tgt.address
+    assert list(tgt.field_types) == [AsyncField, FortranExtensions, RequiredField, FortranVersion]
+    assert list(tgt.field_values) == list(tgt.field_types)
+    assert tgt.field_values[FortranExtensions] == tgt[FortranExtensions]
+
+    # Targets with the same explicit fields are equal.
+    assert tgt == SparseTarget(
+        {"required_field": "x", "version": "dev0"}, Address("", target_name="t")
+    )
+
+    # Required fields are still validated eagerly.
+    with pytest.raises(InvalidTargetException):
+        SparseTarget({"version": "dev0"}, Address("", target_name="t"))
+
+
 def test_target_validate() -> None:
     with pytest.raises(InvalidTargetException):
         FortranTarget({FortranVersion.alias: "bad"}, Address("", target_name="t"))
@@ -529,6 +606,53 @@ def test_coarsened_target_closure() -> None:
     assert_closure([ct1, ct2, ct3], all_targets)
 
 
+def test_coarsened_target_interning() -> None:
+    a, b = (FortranTarget({}, Address(name)) for name in string.ascii_lowercase[:2])
+
+    ct_a = CoarsenedTarget.create([a], [])
+    assert CoarsenedTarget.create([a], []) is ct_a
+    assert CoarsenedTarget.create([b], [ct_a]) is CoarsenedTarget.create([b], [ct_a])
+    # Equal, but not identical, dependencies produce a distinct (but equal) instance.
+    uninterned = CoarsenedTarget.create([b], [CoarsenedTarget([a], [])])
+    assert uninterned is not CoarsenedTarget.create([b], [ct_a])
+    assert uninterned == CoarsenedTarget.create([b], [ct_a])
+
+
+def test_coarsened_target_deep_graph() -> None:
+    targets = [FortranTarget({}, Address(f"t{i}")) for i in range(5000)]
+
+    def chain() -> CoarsenedTarget:
+        ct = CoarsenedTarget([targets[0]], [])
+        for tgt in targets[1:]:
+            ct = CoarsenedTarget([tgt], [ct])
+        return ct
+
+    # Neither equality nor the closure recurse, and so neither exhausts the stack.
+    root = chain()
+    assert root == chain()
+    assert len(list(root.closure())) == len(targets)
+    # The cached closure is reused, and a shared `visited` set prunes the walk.
+    assert list(root.coarsened_closure()) == list(root.coarsened_closure())
+    visited = set(next(iter(root.dependencies)).coarsened_closure())
+    assert list(root.coarsened_closure(visited)) == [root]
+
+
+def test_coarsened_targets_closure_prunes_shared_walk() -> None:
+    a, b, c = (FortranTarget({}, Address(name)) for name in string.ascii_lowercase[:3])
+    ct_a = CoarsenedTarget([a], [])
+    ct_b = CoarsenedTarget([b], [ct_a])
+    ct_c = CoarsenedTarget([c], [ct_a])
+
+    cts = CoarsenedTargets([ct_b, ct_c])
+    assert list(cts.closure()) == [b, a, c]
+    assert list(cts.coarsened_closure()) == [ct_b, ct_a, ct_c]
+    # Roots which share a walk don't cache their (possibly overlapping) complete closures.
+    assert all(ct._coarsened_closure is None for ct in (ct_a, ct_b, ct_c))
+    # But a closure requested on its own is cached.
+    assert list(ct_b.coarsened_closure()) == [ct_b, ct_a]
+    assert ct_b._coarsened_closure == (ct_b, ct_a)
+
+
 # -----------------------------------------------------------------------------------------------
 # Test file-level target generation
 # -----------------------------------------------------------------------------------------------
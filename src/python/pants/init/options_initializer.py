@@ -4,12 +4,18 @@
 from __future__ import annotations
 
 import dataclasses
+import hashlib
 import importlib
 import logging
+import os
+import re
 import sys
+import threading
+from collections import OrderedDict
 from collections.abc import Iterator
 from contextlib import contextmanager
 from pathlib import Path
+from typing import Any, TypeVar
 
 import pkg_resources
 
@@ -30,10 +36,13 @@ from pants.option.errors import UnknownFlagsError
 from pants.option.global_options import DynamicRemoteOptions
 from pants.option.options import Options
 from pants.option.options_bootstrapper import OptionsBootstrapper
+from pants.util.memo import InstanceKey
 from pants.util.requirements import parse_requirements_file
 
 logger = logging.getLogger(__name__)
 
+_V = TypeVar("_V")
+
 
 def _initialize_build_configuration(
     plugin_resolver: PluginResolver,
@@ -126,6 +135,63 @@ def create_bootstrap_scheduler(
     )
 
 
+_INTERPOLATED_ENV_VAR_RE = re.compile(rb"%\(env\.([^)]+)\)s")
+
+
+def _options_cache_key(options_bootstrapper: OptionsBootstrapper) -> tuple[Any, ...] | None:
+    """A key for the options computed from this bootstrapper, or None if they should not be cached.
+
+    Options are a function of the args, the content of the config files and the env vars that are
+    read by name: those starting with `PANTS_`, and those interpolated into config files as
+    `%(env.NAME)s`. Other env vars (which might differ on every run) are not part of the key.
+    However, the `@fromfile` syntax may read values from arbitrary other files, so we don't cache
+    when it might be in use.
+    """
+    if any("@" in arg for arg in options_bootstrapper.args) or any(
+        value.startswith("@")
+        for name, value in options_bootstrapper.env.items()
+        if name.startswith("PANTS_")
+    ):
+        return None
+
+    bootstrap_options = options_bootstrapper.bootstrap_options.for_global_scope()
+    config_files = list(bootstrap_options.pants_config_files)
+    if options_bootstrapper.allow_pantsrc and bootstrap_options.pantsrc:
+        config_files.extend(os.path.expanduser(path) for path in bootstrap_options.pantsrc_files)
+
+    config_digests: list[str | None] = []
+    interpolated_env_vars: set[str] = set()
+    for path in config_files:
+        try:
+            with open(path, "rb") as f:
+                content = f.read()
+        except FileNotFoundError:
+            config_digests.append(None)
+            continue
+        if b'"@' in content or b"'@" in content:
+            return None
+        config_digests.append(hashlib.sha256(content).hexdigest())
+        interpolated_env_vars.update(
+            match.decode() for match in _INTERPOLATED_ENV_VAR_RE.findall(content)
+        )
+
+    env = options_bootstrapper.env
+    options_env = tuple(
+        sorted(
+            (name, value)
+            for name, value in env.items()
+            if name.startswith("PANTS_") or name in interpolated_env_vars
+        )
+    )
+    return (
+        options_bootstrapper.args,
+        options_bootstrapper.allow_pantsrc,
+        options_env,
+        tuple(config_files),
+        tuple(config_digests),
+    )
+
+
 class OptionsInitializer:
     """Initializes BuildConfiguration and Options instances given an OptionsBootstrapper.
 
@@ -147,12 +213,51 @@ class OptionsInitializer:
         self._bootstrap_scheduler = create_bootstrap_scheduler(options_bootstrapper, executor)
         self._plugin_resolver = PluginResolver(self._bootstrap_scheduler)
 
+        # The most recently computed `BuildConfiguration`s and `Options`, so that repeated runs in
+        # pantsd with unchanged args, env and config files don't reload backends or re-register
+        # every subsystem's options.
+        self._cache_lock = threading.Lock()
+        self._build_config_cache: OrderedDict[tuple[Any, ...], BuildConfiguration] = OrderedDict()
+        self._options_cache: OrderedDict[tuple[Any, ...], Options] = OrderedDict()
+
+    _MAX_CACHED = 8
+
+    def _cache_get(
+        self, cache: OrderedDict[tuple[Any, ...], _V], key: tuple[Any, ...]
+    ) -> _V | None:
+        with self._cache_lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+            return value
+
+    def _cache_put(
+        self, cache: OrderedDict[tuple[Any, ...], _V], key: tuple[Any, ...], value: _V
+    ) -> None:
+        with self._cache_lock:
+            cache[key] = value
+            while len(cache) > self._MAX_CACHED:
+                cache.popitem(last=False)
+
     def build_config(
         self,
         options_bootstrapper: OptionsBootstrapper,
         env: CompleteEnvironmentVars,
     ) -> BuildConfiguration:
-        return _initialize_build_configuration(self._plugin_resolver, options_bootstrapper, env)
+        key = _options_cache_key(options_bootstrapper)
+        if key is not None:
+            # The env is only consumed by plugin resolution.
+            if options_bootstrapper.bootstrap_options.for_global_scope().plugins:
+                key = (*key, env)
+            build_config = self._cache_get(self._build_config_cache, key)
+            if build_config is not None:
+                return build_config
+        build_config = _initialize_build_configuration(
+            self._plugin_resolver, options_bootstrapper, env
+        )
+        if key is not None:
+            self._cache_put(self._build_config_cache, key, build_config)
+        return build_config
 
     def options(
         self,
@@ -163,8 +268,19 @@ class OptionsInitializer:
         *,
         raise_: bool,
     ) -> Options:
+        key = _options_cache_key(options_bootstrapper)
+        if key is not None:
+            # NB: Cached `BuildConfiguration`s are reused, so compare them by identity rather than
+            # by (expensive) equality.
+            key = (*key, InstanceKey(build_config), union_membership)
+            options = self._cache_get(self._options_cache, key)
+            if options is not None:
+                return options
         with self.handle_unknown_flags(options_bootstrapper, env, raise_=raise_):
-            return options_bootstrapper.full_options(build_config, union_membership)
+            options = options_bootstrapper.full_options(build_config, union_membership)
+            if key is not None:
+                self._cache_put(self._options_cache, key, options)
+            return options
 
     @contextmanager
     def handle_unknown_flags(
@@ -3,9 +3,12 @@
 
 import unittest
 
+from pants.build_graph.build_configuration import BuildConfiguration
 from pants.engine.env_vars import CompleteEnvironmentVars
 from pants.engine.internals.scheduler import ExecutionError
+from pants.engine.unions import UnionMembership
 from pants.init.options_initializer import OptionsInitializer
+from pants.option.options import Options
 from pants.option.options_bootstrapper import OptionsBootstrapper
 from pants.testutil import rule_runner
 
@@ -38,3 +41,29 @@ class OptionsInitializerTest(unittest.TestCase):
             "The `--no-watch-filesystem` option may not be set if `--pantsd` or `--loop` is set.",
             str(exc.exception),
         )
+
+    def test_reuses_build_config_and_options(self) -> None:
+        def create(*args: str, env: dict[str, str] | None = None) -> OptionsBootstrapper:
+            return OptionsBootstrapper.create(
+                args=["--backend-packages=[]", *args], env=env or {}, allow_pantsrc=False
+            )
+
+        env = CompleteEnvironmentVars({})
+        initializer = OptionsInitializer(create(), rule_runner.EXECUTOR)
+
+        def initialize(ob: OptionsBootstrapper) -> tuple[BuildConfiguration, Options]:
+            build_config = initializer.build_config(ob, env)
+            union_membership = UnionMembership.from_rules(build_config.union_rules)
+            options = initializer.options(ob, env, build_config, union_membership, raise_=True)
+            return build_config, options
+
+        build_config, options = initialize(create())
+        # An equal bootstrapper (as created for each pantsd run) reuses the same instances.
+        self.assertEqual((build_config, options), initialize(create()))
+        self.assertIs(build_config, initialize(create())[0])
+        self.assertIs(options, initialize(create())[1])
+        # Env vars that options don't read do not affect the key.
+        self.assertIs(options, initialize(create(env={"PWD": "/elsewhere"}))[1])
+        # But different args or `PANTS_` env vars do.
+        self.assertIsNot(options, initialize(create("--level=debug"))[1])
+        self.assertIsNot(options, initialize(create(env={"PANTS_LEVEL": "debug"}))[1])
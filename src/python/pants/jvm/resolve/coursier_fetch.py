@@ -12,6 +12,7 @@ import os
 from collections import defaultdict
 from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
+from functools import cached_property
 from itertools import chain
 from typing import TYPE_CHECKING, Any
 
@@ -221,11 +222,17 @@ class CoursierResolvedLockfile:
             f"need to update your lockfile by running `coursier-resolve --names={key.name}`."
         )
 
+    @cached_property
+    def _entries_by_group_artifact(self) -> dict[tuple[str, str], CoursierLockfileEntry]:
+        # NB: Instances are memoized by the engine per lockfile, so this index is built once per
+        # lockfile rather than once per lookup.
+        return {(i.coord.group, i.coord.artifact): i for i in self.entries}
+
     def direct_dependencies(
         self, key: CoursierResolveKey, coord: Coordinate
     ) -> tuple[CoursierLockfileEntry, tuple[CoursierLockfileEntry, ...]]:
         """Return the entry for the given Coordinate, and for its direct dependencies."""
-        entries = {(i.coord.group, i.coord.artifact): i for i in self.entries}
+        entries = self._entries_by_group_artifact
         entry = entries.get((coord.group, coord.artifact))
         if entry is None:
             raise self._coordinate_not_found(key, coord)
@@ -236,7 +243,7 @@ class CoursierResolvedLockfile:
         self, key: CoursierResolveKey, coord: Coordinate
     ) -> tuple[CoursierLockfileEntry, tuple[CoursierLockfileEntry, ...]]:
         """Return the entry for the given Coordinate, and for its transitive dependencies."""
-        entries = {(i.coord.group, i.coord.artifact): i for i in self.entries}
+        entries = self._entries_by_group_artifact
         entry = entries.get((coord.group, coord.artifact))
         if entry is None:
             raise self._coordinate_not_found(key, coord)
@@ -299,7 +306,8 @@ class CoursierResolvedLockfile:
             "entries": [entry.to_json_dict() for entry in self.entries],
         }
 
-        return toml.dumps(lockfile).encode("utf-8")
+        serialized: str = toml.dumps(lockfile)
+        return serialized.encode("utf-8")
 
 
 def classpath_dest_filename(coord: str, src_filename: str) -> str:
@@ -533,15 +541,32 @@ async def coursier_resolve_lockfile(
     return CoursierResolvedLockfile(entries=tuple(new_entries))
 
 
+@dataclass(frozen=True)
+class _CoursierLockfileDigest:
+    """The Digest of a single serialized lockfile."""
+
+    digest: Digest
+
+
 @rule
-async def get_coursier_lockfile_for_resolve(
-    coursier_resolve: CoursierResolveKey,
+async def parse_coursier_lockfile(
+    lockfile_digest: _CoursierLockfileDigest,
 ) -> CoursierResolvedLockfile:
-    lockfile_digest_contents = await get_digest_contents(coursier_resolve.digest)
+    # NB: This rule is keyed only by the Digest of the lockfile (rather than by the name and path
+    # of a resolve), so each distinct lockfile is parsed once, and resolves which share a lockfile
+    # share the parsed instance (and its index of entries).
+    lockfile_digest_contents = await get_digest_contents(lockfile_digest.digest)
     lockfile_contents = lockfile_digest_contents[0].content
     return CoursierResolvedLockfile.from_serialized(lockfile_contents)
 
 
+@rule
+async def get_coursier_lockfile_for_resolve(
+    coursier_resolve: CoursierResolveKey,
+) -> CoursierResolvedLockfile:
+    return await parse_coursier_lockfile(_CoursierLockfileDigest(coursier_resolve.digest))
+
+
 class ResolvedClasspathEntries(Collection[ClasspathEntry]):
     """A collection of resolved classpath entries."""
 
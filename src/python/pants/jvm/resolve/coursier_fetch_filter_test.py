@@ -11,7 +11,11 @@ import pytest
 
 from pants.engine.fs import EMPTY_DIGEST
 from pants.jvm.resolve.coordinate import Coordinate, Coordinates
-from pants.jvm.resolve.coursier_fetch import CoursierLockfileEntry, CoursierResolvedLockfile
+from pants.jvm.resolve.coursier_fetch import (
+    CoursierError,
+    CoursierLockfileEntry,
+    CoursierResolvedLockfile,
+)
 from pants.jvm.resolve.key import CoursierResolveKey
 
 coord1 = Coordinate("test", "art1", "1.0.0")
@@ -82,6 +86,20 @@ def test_filter_transitive_includes_transitive_deps(lockfile: CoursierResolvedLo
     assert len(filtered) == 5
 
 
+def test_missing_coordinate(lockfile: CoursierResolvedLockfile) -> None:
+    with pytest.raises(CoursierError, match="was not present in resolve `example`"):
+        filter(Coordinate("test", "missing", "1.0.0"), lockfile, True)
+
+
+def test_lookups_do_not_affect_equality(lockfile: CoursierResolvedLockfile) -> None:
+    # Looking up coordinates indexes the entries of the lockfile, which must not leak into its
+    # identity as an engine value.
+    fresh = CoursierResolvedLockfile(entries=lockfile.entries)
+    assert filter(coord5, lockfile, True) == filter(coord5, lockfile, True)
+    assert lockfile == fresh
+    assert hash(lockfile) == hash(fresh)
+
+
 def filter(coordinate, lockfile, transitive) -> Sequence[Coordinate]:
     key = CoursierResolveKey("example", "example.json", EMPTY_DIGEST)
     root, deps = (
@@ -1138,8 +1138,12 @@ class BootstrapOptions:
             """
             The maximum amount of time to wait for the invocation to start until
             raising a timeout exception.
-            Because pantsd currently does not support parallel runs,
-            any prior running Pants command must be finished for the current one to start.
+            pantsd runs invocations with compatible bootstrap options concurrently if
+            `--rule-threads-core` is at least 3, although an invocation whose goals might write
+            to the workspace (such as `fmt`, `fix`, `test` or `generate-lockfiles`) waits for any
+            other such invocation. An invocation which needs to restart the scheduler (because its
+            bootstrap options differ) must wait for all prior running Pants commands to finish
+            before it starts.
             To never timeout, use the value -1.
             """
         ),
@@ -1156,7 +1160,9 @@ class BootstrapOptions:
             although all previous in-memory caching will be lost. Setting too low means that
             you may miss out on some caching, whereas setting too high may over-consume
             resources and may result in the operating system killing Pantsd due to memory
-            overconsumption (e.g. via the OOM killer).
+            overconsumption (e.g. via the OOM killer). Before restarting, pantsd will attempt to
+            release memory by evicting values from its graph: see
+            `--pantsd-memory-eviction-threshold`.
 
             You can suffix with `GiB`, `MiB`, `KiB`, or `B` to indicate the unit, e.g.
             `2GiB` or `2.12GiB`. A bare number will be in bytes.
@@ -1165,6 +1171,23 @@ class BootstrapOptions:
             """
         ),
     )
+    pantsd_memory_eviction_threshold = FloatOption(
+        advanced=True,
+        default=0.75,
+        help=softwrap(
+            """
+            The fraction of `--pantsd-max-memory-usage` above which pantsd will evict values from
+            its graph, rather than waiting to restart.
+
+            An eviction discards the memoized values of the least recently used half of the nodes
+            in the graph (ordered by the run which last used them), so that values used by recent
+            runs stay warm. Set to `1.0` to disable eviction. If an eviction does not reduce memory
+            usage, pantsd waits exponentially longer before evicting again. If evictions do not
+            release enough memory, the daemon will still restart once `--pantsd-max-memory-usage`
+            is exceeded.
+            """
+        ),
+    )
 
     # These facilitate configuring the native engine.
     print_stacktrace = BoolOption(
@@ -1210,7 +1233,8 @@ class BootstrapOptions:
             The number of threads to keep active and ready to execute `@rule` logic (see
             also: `--rule-threads-max`).
 
-            Values less than 2 are not currently supported.
+            Values less than 2 are not currently supported. pantsd runs at most one fewer
+            concurrent invocations than this value: see `--pantsd-timeout-when-multiple-invocations`.
 
             This value is independent of the number of processes that may be spawned in
             parallel locally (controlled by `--process-execution-local-parallelism`).
@@ -2054,6 +2078,16 @@ class GlobalOptions(BootstrapOptions, Subsystem):
                 )
             )
 
+        if not 0 < opts.pantsd_memory_eviction_threshold <= 1:
+            raise OptionsError(
+                softwrap(
+                    f"""
+                    The `--pantsd-memory-eviction-threshold` option must be greater than 0 and at
+                    most 1, but it was set to {opts.pantsd_memory_eviction_threshold}.
+                    """
+                )
+            )
+
         if not opts.watch_filesystem and (opts.pantsd or opts.loop):
             raise OptionsError(
                 softwrap(
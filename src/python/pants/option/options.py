@@ -445,6 +445,7 @@ class Options:
 
         pairs = []
         registrar = self.get_registrar(scope)
+        values = self.for_scope(scope)
         # Sort the arguments, so that the fingerprint is consistent.
         for option_info in sorted(registrar.option_registrations_iter()):
             if not option_info.kwargs.get("fingerprint", True):
@@ -452,7 +453,7 @@ class Options:
             if daemon_only and not option_info.kwargs.get("daemon", False):
                 continue
             dest = option_info.kwargs["dest"]
-            val = self.for_scope(scope)[dest]
+            val = values[dest]
             # If we have a list then we delegate to the fingerprinting implementation of the members.
             if is_list_option(option_info.kwargs):
                 val_type = option_info.kwargs.get("member_type", str)
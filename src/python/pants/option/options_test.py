@@ -44,6 +44,7 @@ from pants.option.option_types import OptionInfo, StrOption
 from pants.option.options import Options
 from pants.option.options_fingerprinter import OptionEncoder
 from pants.option.ranked_value import Rank, RankedValue
+from pants.option.registrar import OptionRegistrar
 from pants.option.scope import GLOBAL_SCOPE, ScopeInfo
 from pants.option.subsystem import Subsystem
 from pants.util.contextutil import pushd, temporary_dir, temporary_file, temporary_file_path
@@ -1296,6 +1297,17 @@ def test_fingerprintable_daemon_only() -> None:
     assert [("explicitly_daemoned", str, "shall_be_fingerprinted")] == pairs
 
 
+def test_option_registrations_iter_sees_later_registrations() -> None:
+    registrar = OptionRegistrar(GLOBAL_SCOPE)
+    registrar.register("--first", type=int, default=1)
+    assert [info.kwargs["dest"] for info in registrar.option_registrations_iter()] == ["first"]
+
+    registrar.register("--second", type=list, member_type=int)
+    infos = list(registrar.option_registrations_iter())
+    assert [info.kwargs["dest"] for info in infos] == ["first", "second"]
+    assert infos[1].kwargs["default"] == []
+
+
 def assert_fromfile(parse_func, expected_append=None, append_contents=None):
     def _do_assert_fromfile(dest, expected, contents, passthru_flags=""):
         with temporary_file(binary_mode=False) as fp:
@@ -103,6 +103,10 @@ class OptionRegistrar:
         # List of (args, kwargs) registration pairs, exactly as captured at registration time.
         self._option_registrations: list[tuple[tuple[str, ...], dict[str, Any]]] = []
 
+        # The normalized form of `_option_registrations`, computed on demand and cleared whenever
+        # an option is registered.
+        self._normalized_registrations: tuple[OptionInfo, ...] | None = None
+
         # Map of dest -> history.
         self._history: dict[str, OptionValueHistory] = {}
 
@@ -139,9 +143,12 @@ class OptionRegistrar:
             return nkwargs
 
         # Yield our directly-registered options.
-        for args, kwargs in self._option_registrations:
-            normalized_kwargs = normalize_kwargs(args, kwargs)
-            yield OptionInfo(args, normalized_kwargs)
+        if self._normalized_registrations is None:
+            self._normalized_registrations = tuple(
+                OptionInfo(args, normalize_kwargs(args, kwargs))
+                for args, kwargs in self._option_registrations
+            )
+        yield from self._normalized_registrations
 
     def register(self, *args, **kwargs) -> None:
         """Register an option."""
@@ -158,6 +165,7 @@ class OptionRegistrar:
 
         # Record the args. We'll do the underlying parsing on-demand.
         self._option_registrations.append((args, kwargs))
+        self._normalized_registrations = None
 
         # Look for direct conflicts.
         for arg in args:
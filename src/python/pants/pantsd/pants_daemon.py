@@ -117,6 +117,7 @@ class PantsDaemon(PantsDaemonProcessManager):
             ),
             pid=os.getpid(),
             max_memory_usage_in_bytes=bootstrap_options.pantsd_max_memory_usage,
+            memory_eviction_threshold=bootstrap_options.pantsd_memory_eviction_threshold,
         )
 
         store_gc_service = StoreGCService(
@@ -10,10 +10,13 @@ from contextlib import contextmanager
 from typing import Any, Protocol
 
 from pants.build_graph.build_configuration import BuildConfiguration
+from pants.engine.console import Console
+from pants.engine.engine_aware import SideEffecting
 from pants.engine.env_vars import CompleteEnvironmentVars
+from pants.engine.goal import Goal
 from pants.engine.internals.native_engine import PyExecutor
 from pants.engine.unions import UnionMembership
-from pants.init.engine_initializer import EngineInitializer, GraphScheduler
+from pants.init.engine_initializer import EngineInitializer, GraphScheduler, GraphSession
 from pants.init.options_initializer import OptionsInitializer
 from pants.option.global_options import AuthPluginResult, DynamicRemoteOptions
 from pants.option.option_value_container import OptionValueContainer
@@ -26,6 +29,10 @@ from pants.pantsd.service.pants_service import PantsServices
 logger = logging.getLogger(__name__)
 
 
+class SchedulerRestartRequired(Exception):
+    """Raised when a run which may not restart the scheduler would need to in order to proceed."""
+
+
 class PantsServicesConstructor(Protocol):
     def __call__(
         self,
@@ -58,6 +65,9 @@ class PantsDaemonCore:
         self._scheduler: GraphScheduler | None = None
         self._services: PantsServices | None = None
 
+        # Whether each Goal of the current scheduler might write to the workspace.
+        self._goal_writes_to_workspace: dict[type[Goal], bool] = {}
+
         self._prior_options_map: dict[str, Any] | None = None
         self._prior_dynamic_remote_options: DynamicRemoteOptions | None = None
         self._prior_auth_plugin_result: AuthPluginResult | None = None
@@ -107,6 +117,7 @@ class PantsDaemonCore:
             self._scheduler = EngineInitializer.setup_graph(
                 bootstrap_options, build_config, dynamic_remote_options, self._executor
             )
+            self._goal_writes_to_workspace = {}
 
             self._services = self._services_constructor(bootstrap_options, self._scheduler)
             logger.info("Scheduler initialized.")
@@ -115,12 +126,79 @@ class PantsDaemonCore:
             self._scheduler = None
             raise e
 
-    def prepare(
+    def can_share_scheduler(self, options_bootstrapper: OptionsBootstrapper) -> bool:
+        """Returns true if a run with the given options could use the current scheduler.
+
+        A run which can share the scheduler may run concurrently with other such runs, but might
+        still discover (once its full options have been computed) that the scheduler needs to be
+        restarted: see `prepare`.
+        """
+        with self._lifecycle_lock:
+            return (
+                self._scheduler is not None
+                and self._prior_options_map is not None
+                and self._prior_options_map
+                == OptionsFingerprinter.options_map_for_scope(
+                    GLOBAL_SCOPE, options_bootstrapper.bootstrap_options
+                )
+            )
+
+    def goals_writing_to_workspace(
         self, options_bootstrapper: OptionsBootstrapper, env: CompleteEnvironmentVars
+    ) -> list[str]:
+        """Returns the goals of a run which might write to the workspace.
+
+        These are the goals whose rule graphs consume a side-effecting type such as the `Workspace`
+        or an `InteractiveProcess`, and (conservatively) builtin goals and goals which are not
+        known to the current scheduler. Runs which share the scheduler may run concurrently with
+        such a run, but should not run concurrently with another run which writes to the
+        workspace.
+        """
+        build_config = self._options_initializer.build_config(options_bootstrapper, env)
+        union_membership = UnionMembership.from_rules(build_config.union_rules)
+        options = self._options_initializer.options(
+            options_bootstrapper, env, build_config, union_membership, raise_=True
+        )
+        if options.builtin_or_auxiliary_goal:
+            return [options.builtin_or_auxiliary_goal]
+
+        with self._lifecycle_lock:
+            if self._scheduler is None:
+                return list(options.goals)
+            result = []
+            for goal in options.goals:
+                goal_product = self._scheduler.goal_map.get(goal)
+                if goal_product is None:
+                    result.append(goal)
+                    continue
+                writes_to_workspace = self._goal_writes_to_workspace.get(goal_product)
+                if writes_to_workspace is None:
+                    writes_to_workspace = any(
+                        issubclass(consumed_type, SideEffecting)
+                        and not issubclass(consumed_type, Console)
+                        for consumed_type in self._scheduler.scheduler.rule_graph_consumed_types(
+                            GraphSession.goal_param_types, goal_product
+                        )
+                    )
+                    self._goal_writes_to_workspace[goal_product] = writes_to_workspace
+                if writes_to_workspace:
+                    result.append(goal)
+            return result
+
+    def prepare(
+        self,
+        options_bootstrapper: OptionsBootstrapper,
+        env: CompleteEnvironmentVars,
+        *,
+        allow_restart: bool = True,
     ) -> tuple[GraphScheduler, OptionsInitializer]:
         """Get a scheduler for the given options_bootstrapper.
 
         Runs in a client context (generally in DaemonPantsRunner) so logging is sent to the client.
+
+        If `allow_restart` is False (because other runs may be using the current scheduler) and the
+        scheduler would need to be (re)initialized, raises `SchedulerRestartRequired` without
+        modifying any state.
         """
 
         with self._handle_exceptions():
@@ -159,6 +237,10 @@ class PantsDaemonCore:
 
         with self._lifecycle_lock:
             if self._scheduler is None or scheduler_restart_explanation:
+                if not allow_restart:
+                    raise SchedulerRestartRequired(
+                        scheduler_restart_explanation or "No scheduler has been initialized"
+                    )
                 # No existing options to compare (first run) or options have changed. Create a new
                 # scheduler and services.
                 bootstrap_options = options_bootstrapper.bootstrap_options.for_global_scope()
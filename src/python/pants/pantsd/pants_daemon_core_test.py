@@ -1,25 +1,31 @@
 # Copyright 2020 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
+import pytest
+
 from pants.engine.env_vars import CompleteEnvironmentVars
 from pants.engine.internals.native_engine import PyExecutor
-from pants.pantsd.pants_daemon_core import PantsDaemonCore
+from pants.pantsd.pants_daemon_core import PantsDaemonCore, SchedulerRestartRequired
 from pants.pantsd.service.pants_service import PantsServices
 from pants.testutil.option_util import create_options_bootstrapper
 
 
-def test_prepare_scheduler() -> None:
+def create_core() -> PantsDaemonCore:
     # A core with no services.
     def create_services(bootstrap_options, graph_scheduler):
         return PantsServices()
 
-    env = CompleteEnvironmentVars({})
-    core = PantsDaemonCore(
+    return PantsDaemonCore(
         create_options_bootstrapper([]),
         PyExecutor(core_threads=2, max_threads=4),
         create_services,
     )
 
+
+def test_prepare_scheduler() -> None:
+    env = CompleteEnvironmentVars({})
+    core = create_core()
+
     first_scheduler, first_options_initializer = core.prepare(
         create_options_bootstrapper(["-ldebug"]),
         env,
@@ -30,3 +36,48 @@ def test_prepare_scheduler() -> None:
     )
     assert first_scheduler is not second_scheduler
     assert first_options_initializer is second_options_initializer
+
+
+def test_prepare_scheduler_without_restart() -> None:
+    env = CompleteEnvironmentVars({})
+    core = create_core()
+
+    # There is no scheduler to share until one has been initialized.
+    assert not core.can_share_scheduler(create_options_bootstrapper(["-ldebug"]))
+    with pytest.raises(SchedulerRestartRequired):
+        core.prepare(create_options_bootstrapper(["-ldebug"]), env, allow_restart=False)
+
+    scheduler, _ = core.prepare(create_options_bootstrapper(["-ldebug"]), env)
+
+    # Runs with the same bootstrap options can share the scheduler...
+    assert core.can_share_scheduler(create_options_bootstrapper(["-ldebug"]))
+    assert (
+        scheduler
+        is core.prepare(create_options_bootstrapper(["-ldebug"]), env, allow_restart=False)[0]
+    )
+
+    # ...but runs which would restart it cannot.
+    assert not core.can_share_scheduler(create_options_bootstrapper(["-lwarn"]))
+    with pytest.raises(SchedulerRestartRequired):
+        core.prepare(create_options_bootstrapper(["-lwarn"]), env, allow_restart=False)
+    assert scheduler is core.prepare(create_options_bootstrapper(["-ldebug"]), env)[0]
+
+
+@pytest.mark.parametrize(
+    "args, expected",
+    [
+        (["lint"], []),
+        (["fmt"], ["fmt"]),
+        (["lint", "fmt"], ["fmt"]),
+        (["help"], ["help"]),
+    ],
+)
+def test_goals_writing_to_workspace(args: list[str], expected: list[str]) -> None:
+    env = CompleteEnvironmentVars({})
+    core = create_core()
+    core.prepare(create_options_bootstrapper(["-ldebug"]), env)
+
+    # Runs which might write to the workspace still share the scheduler.
+    options_bootstrapper = create_options_bootstrapper(["-ldebug", *args])
+    assert core.can_share_scheduler(options_bootstrapper)
+    assert core.goals_writing_to_workspace(options_bootstrapper, env) == expected
@@ -609,7 +609,11 @@ class TestPantsDaemonIntegration(PantsDaemonIntegrationTestBase):
 
     def test_sigint_kills_request_waiting_for_lock(self):
         """Test that, when a pailgun request is blocked waiting for another one to end, sending
-        SIGINT to the blocked run will kill it."""
+        SIGINT to the blocked run will kill it.
+
+        The blocked run uses different bootstrap options, so that it needs exclusive access to
+        restart the scheduler rather than running concurrently.
+        """
         config = {"GLOBAL": {"pantsd_timeout_when_multiple_invocations": -1.0, "level": "debug"}}
         with self.pantsd_test_context(extra_config=config) as (workdir, config, checker):
             # Run a process that will wait forever.
@@ -620,7 +624,7 @@ class TestPantsDaemonIntegration(PantsDaemonIntegrationTestBase):
 
             # And another that will block on the first.
             blocking_run_handle = self.run_pants_with_workdir_without_waiting(
-                command=["goals"], workdir=workdir, config=config
+                command=["--level=info", "goals"], workdir=workdir, config=config
             )
 
             # Block until the second request is waiting for the lock.
@@ -641,6 +645,35 @@ class TestPantsDaemonIntegration(PantsDaemonIntegrationTestBase):
             result.assert_success()
             checker.assert_running()
 
+    def test_compatible_requests_run_concurrently(self):
+        """Test that a request with the same bootstrap options as a running request does not wait
+        for it, even if the running request might write to the workspace.
+
+        There must be at least 3 `rule_threads_core` for runs to share the scheduler.
+        """
+        config = {
+            "GLOBAL": {"pantsd_timeout_when_multiple_invocations": 30.0, "rule_threads_core": 4}
+        }
+        with self.pantsd_test_context(extra_config=config) as (workdir, config, checker):
+            # Run a process that will wait until we create its file.
+            waiter_handle, _, _, file_to_create = launch_waiter(workdir=workdir, config=config)
+
+            checker.assert_started()
+            checker.assert_running()
+
+            # A compatible read-only request completes while the first is still running.
+            result = self.run_pants_with_workdir(
+                ["list", "testprojects/src/python/coordinated_runs:"],
+                workdir=workdir,
+                config=config,
+            )
+            result.assert_success()
+            self.assertNotIn("Another pants invocation is running", result.stderr)
+            checker.assert_running()
+
+            safe_file_dump(file_to_create, "content!")
+            waiter_handle.join().assert_success()
+
     def test_pantsd_unicode_environment(self):
         with self.pantsd_successful_run_context(extra_env={"XXX": "¡"}) as ctx:
             result = ctx.runner(["help"])
@@ -1,6 +1,7 @@
 # Copyright 2016 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
+import gc
 import logging
 import time
 from typing import cast
@@ -27,6 +28,14 @@ class SchedulerService(PantsService):
     INVALIDATION_POLL_INTERVAL = 0.5
     # A grace period after startup that we will wait before enforcing our pid.
     PIDFILE_GRACE_PERIOD = 5
+    # The fraction of the graph's nodes (least recently used first) to evict under memory pressure.
+    MEMORY_EVICTION_FRACTION = 0.5
+    # The minimum interval between evictions: memory is not necessarily returned to the OS
+    # immediately (or at all) after an eviction, so evicting on every loop would only discard work.
+    # The interval doubles (up to the maximum) after each eviction which does not reduce memory
+    # usage.
+    MEMORY_EVICTION_INTERVAL = 60
+    MAX_MEMORY_EVICTION_INTERVAL = 60 * 60
 
     def __init__(
         self,
@@ -37,6 +46,7 @@ class SchedulerService(PantsService):
         pidfile: str,
         pid: int,
         max_memory_usage_in_bytes: int,
+        memory_eviction_threshold: float,
     ) -> None:
         """
         :param graph_scheduler: The GraphScheduler instance for graph construction.
@@ -48,6 +58,9 @@ class SchedulerService(PantsService):
         :param pid: This processes' pid.
         :param max_memory_usage_in_bytes: The maximum memory usage of the process: the service will
                                           shut down if it observes more than this amount in use.
+        :param memory_eviction_threshold: The fraction of `max_memory_usage_in_bytes` above which
+                                          the service will evict the values of the least recently
+                                          used nodes in the graph.
         """
         super().__init__()
         self._graph_helper = graph_scheduler
@@ -70,6 +83,14 @@ class SchedulerService(PantsService):
         self._pidfile = pidfile
         self._pid = pid
         self._max_memory_usage_in_bytes = max_memory_usage_in_bytes
+        self._memory_eviction_threshold_in_bytes = int(
+            max_memory_usage_in_bytes * memory_eviction_threshold
+        )
+        self._last_memory_eviction: float | None = None
+        self._memory_eviction_interval = self.MEMORY_EVICTION_INTERVAL
+        # Counters for the evictions which have been triggered by memory pressure.
+        self.memory_eviction_count = 0
+        self.memory_evicted_node_count = 0
 
     def _get_snapshot(self, globs: tuple[str, ...], poll: bool) -> Snapshot | None:
         """Returns a Snapshot of the input globs.
@@ -115,10 +136,13 @@ class SchedulerService(PantsService):
         if int(pid_from_file) != self._pid:
             raise Exception(f"Another instance of pantsd is running at {pid_from_file}")
 
+    def _memory_usage_in_bytes(self) -> int:
+        return cast(int, psutil.Process(self._pid).memory_info()[0])
+
     def _check_memory_usage(self):
-        memory_usage_in_bytes = psutil.Process(self._pid).memory_info()[0]
+        memory_usage_in_bytes = self._memory_usage_in_bytes()
+        bytes_per_mib = 1_048_576
         if memory_usage_in_bytes > self._max_memory_usage_in_bytes:
-            bytes_per_mib = 1_048_576
             raise Exception(
                 softwrap(
                     f"""
@@ -129,6 +153,45 @@ class SchedulerService(PantsService):
                 )
             )
 
+        if memory_usage_in_bytes <= self._memory_eviction_threshold_in_bytes:
+            return
+        now = time.time()
+        if (
+            self._last_memory_eviction is not None
+            and now - self._last_memory_eviction < self._memory_eviction_interval
+        ):
+            return
+        self._last_memory_eviction = now
+
+        evicted = self._scheduler.evict_least_recently_used(self.MEMORY_EVICTION_FRACTION)
+        # Values released by the engine may participate in reference cycles.
+        gc.collect()
+        self.memory_eviction_count += 1
+        self.memory_evicted_node_count += evicted
+        memory_usage_after_eviction_in_bytes = self._memory_usage_in_bytes()
+        if memory_usage_after_eviction_in_bytes < memory_usage_in_bytes:
+            self._memory_eviction_interval = self.MEMORY_EVICTION_INTERVAL
+        else:
+            # The memory was either not freed, or not returned to the OS: evicting again soon would
+            # likely only discard more work.
+            self._memory_eviction_interval = min(
+                self._memory_eviction_interval * 2, self.MAX_MEMORY_EVICTION_INTERVAL
+            )
+        self._logger.info(
+            softwrap(
+                f"""
+                pantsd process {self._pid} was using {memory_usage_in_bytes / bytes_per_mib:.2f}
+                MiB of memory (above the `--pantsd-memory-eviction-threshold` of
+                {self._memory_eviction_threshold_in_bytes / bytes_per_mib:.2f} MiB): evicted the
+                {evicted} least recently used nodes in the graph, leaving
+                {memory_usage_after_eviction_in_bytes / bytes_per_mib:.2f} MiB in use
+                ({self.memory_evicted_node_count} nodes evicted over
+                {self.memory_eviction_count} evictions so far). The next eviction will be at
+                least {self._memory_eviction_interval} seconds from now.
+                """
+            )
+        )
+
     def _check_invalidation_watcher_liveness(self):
         self._scheduler.check_invalidation_watcher_liveness()
 
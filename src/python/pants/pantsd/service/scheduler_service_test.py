@@ -0,0 +1,89 @@
+# Copyright 2025 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+from typing import cast
+from unittest import mock
+
+import pytest
+
+from pants.pantsd.service.scheduler_service import SchedulerService
+
+MAX_MEMORY_USAGE = 1000
+
+
+def make_service(memory_eviction_threshold: float) -> SchedulerService:
+    graph_scheduler = mock.Mock()
+    graph_scheduler.scheduler.evict_least_recently_used.return_value = 10
+    return SchedulerService(
+        graph_scheduler=graph_scheduler,
+        build_root="/",
+        invalidation_globs=(),
+        pidfile="pidfile",
+        pid=1,
+        max_memory_usage_in_bytes=MAX_MEMORY_USAGE,
+        memory_eviction_threshold=memory_eviction_threshold,
+    )
+
+
+def check_memory_usage(
+    monkeypatch: pytest.MonkeyPatch,
+    service: SchedulerService,
+    *,
+    now: float,
+    before: int,
+    after: int | None = None,
+) -> None:
+    usages = iter([before] if after is None else [before, after])
+    monkeypatch.setattr(service, "_memory_usage_in_bytes", lambda: next(usages))
+    monkeypatch.setattr("pants.pantsd.service.scheduler_service.time.time", lambda: now)
+    service._check_memory_usage()
+
+
+def test_memory_eviction_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = make_service(memory_eviction_threshold=1.0)
+    check_memory_usage(monkeypatch, service, now=0, before=MAX_MEMORY_USAGE)
+    assert service.memory_eviction_count == 0
+
+    with pytest.raises(Exception, match="--pantsd-max-memory-usage"):
+        check_memory_usage(monkeypatch, service, now=0, before=MAX_MEMORY_USAGE + 1)
+
+
+def test_memory_eviction_backs_off(monkeypatch: pytest.MonkeyPatch) -> None:
+    interval = SchedulerService.MEMORY_EVICTION_INTERVAL
+    service = make_service(memory_eviction_threshold=0.5)
+    check_memory_usage(monkeypatch, service, now=0, before=400)
+    assert service.memory_eviction_count == 0
+
+    # An eviction which does not reduce memory usage doubles the interval before the next one.
+    check_memory_usage(monkeypatch, service, now=0, before=600, after=600)
+    assert service.memory_eviction_count == 1
+    assert service.memory_evicted_node_count == 10
+    cast(mock.Mock, service._scheduler).evict_least_recently_used.assert_called_with(
+        SchedulerService.MEMORY_EVICTION_FRACTION
+    )
+    check_memory_usage(monkeypatch, service, now=interval, before=600)
+    assert service.memory_eviction_count == 1
+    check_memory_usage(monkeypatch, service, now=interval * 2, before=600, after=600)
+    assert service.memory_eviction_count == 2
+    check_memory_usage(monkeypatch, service, now=interval * 5, before=600)
+    assert service.memory_eviction_count == 2
+    check_memory_usage(monkeypatch, service, now=interval * 6, before=600, after=600)
+    assert service.memory_eviction_count == 3
+
+    # While one which does reduce it resets the interval.
+    now = interval * 14
+    check_memory_usage(monkeypatch, service, now=now, before=600, after=500)
+    assert service.memory_eviction_count == 4
+    check_memory_usage(monkeypatch, service, now=now + interval, before=600, after=500)
+    assert service.memory_eviction_count == 5
+
+
+def test_memory_eviction_interval_is_capped(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = make_service(memory_eviction_threshold=0.5)
+    now = 0
+    for _ in range(10):
+        check_memory_usage(monkeypatch, service, now=now, before=600, after=600)
+        now += SchedulerService.MAX_MEMORY_EVICTION_INTERVAL
+    assert service.memory_eviction_count == 10
@@ -223,62 +223,120 @@ class OptionalSourceRootsResult:
     path_to_optional_root: FrozenDict[PurePath, OptionalSourceRoot]
 
 
-@rule
-async def get_optional_source_root(
-    source_root_request: SourceRootRequest, source_root_config: SourceRootConfig
-) -> OptionalSourceRoot:
-    """Rule to request a SourceRoot that may not exist."""
+@dataclass(frozen=True)
+class MarkerFileDirsRequest:
+    """Find which of the given directories contain a source root marker file.
+
+    The directories are sorted and deduplicated, so that requests for the same set of directories
+    share a single marker file lookup, regardless of which source root request they came from.
+    """
+
+    dirs: tuple[PurePath, ...]
+
+    def __init__(self, dirs: Iterable[PurePath]) -> None:
+        object.__setattr__(self, "dirs", tuple(sorted(set(dirs))))
+
+
+class MarkerFileDirs(DeduplicatedCollection[PurePath]):
+    sort_input = True
+
+
+def _validate_marker_filenames(marker_filenames: Iterable[str]) -> None:
+    for marker_filename in marker_filenames:
+        if (
+            os.path.basename(marker_filename) != marker_filename
+            or "*" in marker_filename
+            or "!" in marker_filename
+        ):
+            raise InvalidMarkerFileError(f"Marker filename must be a base name: {marker_filename}")
+
+
+async def _find_optional_source_roots(
+    dirs: Iterable[PurePath], source_root_config: SourceRootConfig
+) -> dict[PurePath, OptionalSourceRoot]:
+    """Find the nearest source root at or above each of the given directories.
+
+    Root patterns are matched in memory, once per distinct ancestor directory. Then, all of the
+    ancestors which are nearer to a requested directory than its nearest pattern-matched root are
+    checked for marker files with a single (memoized) `MarkerFileDirsRequest`, rather than one
+    lookup per directory.
+    """
     pattern_matcher = source_root_config.get_pattern_matcher()
-    path = source_root_request.path
+    marker_filenames = source_root_config.marker_filenames
+    _validate_marker_filenames(marker_filenames)
+
+    pattern_matches: dict[PurePath, bool] = {}
+
+    def matches_root_patterns(path: PurePath) -> bool:
+        matches = pattern_matches.get(path)
+        if matches is None:
+            matches = pattern_matches[path] = pattern_matcher.matches_root_patterns(path)
+        return matches
+
+    # For each directory: its ancestors (nearest first) that are nearer than its nearest
+    # pattern-matched root, and that root (if any).
+    marker_candidates: dict[PurePath, list[PurePath]] = {}
+    pattern_roots: dict[PurePath, PurePath | None] = {}
+    for d in dirs:
+        candidates: list[PurePath] = []
+        pattern_root = None
+        for ancestor in (d, *d.parents):
+            if matches_root_patterns(ancestor):
+                pattern_root = ancestor
+                break
+            candidates.append(ancestor)
+        marker_candidates[d] = candidates
+        pattern_roots[d] = pattern_root
+
+    dirs_with_markers = MarkerFileDirs()
+    candidate_dirs = set(itertools.chain.from_iterable(marker_candidates.values()))
+    if marker_filenames and candidate_dirs:
+        dirs_with_markers = await find_marker_file_dirs(
+            MarkerFileDirsRequest(candidate_dirs), **implicitly()
+        )
 
-    # Check if the requested path itself is a source root.
+    result: dict[PurePath, OptionalSourceRoot] = {}
+    for d, candidates in marker_candidates.items():
+        root = next((c for c in candidates if c in dirs_with_markers), pattern_roots[d])
+        result[d] = OptionalSourceRoot(SourceRoot(str(root)) if root is not None else None)
+    return result
 
-    # A) Does it match a pattern?
-    if pattern_matcher.matches_root_patterns(path):
-        return OptionalSourceRoot(SourceRoot(str(path)))
 
-    # B) Does it contain a marker file?
+@rule
+async def find_marker_file_dirs(
+    request: MarkerFileDirsRequest, source_root_config: SourceRootConfig
+) -> MarkerFileDirs:
     marker_filenames = source_root_config.marker_filenames
-    if marker_filenames:
-        for marker_filename in marker_filenames:
-            if (
-                os.path.basename(marker_filename) != marker_filename
-                or "*" in marker_filename
-                or "!" in marker_filename
-            ):
-                raise InvalidMarkerFileError(
-                    f"Marker filename must be a base name: {marker_filename}"
-                )
-        paths = await path_globs_to_paths(PathGlobs([str(path / mf) for mf in marker_filenames]))
-        if len(paths.files) > 0:
-            return OptionalSourceRoot(SourceRoot(str(path)))
+    paths = await path_globs_to_paths(
+        PathGlobs([str(d / mf) for d in request.dirs for mf in marker_filenames])
+    )
+    return MarkerFileDirs(PurePath(f).parent for f in paths.files)
 
-    # The requested path itself is not a source root, but maybe its parent is.
-    if str(path) != ".":
-        return await get_optional_source_root(SourceRootRequest(path.parent), **implicitly())
 
-    # The requested path is not under a source root.
-    return OptionalSourceRoot(None)
+@rule
+async def get_optional_source_root(
+    source_root_request: SourceRootRequest, source_root_config: SourceRootConfig
+) -> OptionalSourceRoot:
+    """Rule to request a SourceRoot that may not exist."""
+    roots = await _find_optional_source_roots([source_root_request.path], source_root_config)
+    return roots[source_root_request.path]
 
 
 @rule
 async def get_optional_source_roots(
-    source_roots_request: SourceRootsRequest,
+    source_roots_request: SourceRootsRequest, source_root_config: SourceRootConfig
 ) -> OptionalSourceRootsResult:
     """Rule to request source roots that may not exist."""
     # A file cannot be a source root, so request for its parent.
     # In the typical case, where we have multiple files with the same parent, this can
-    # dramatically cut down on the number of engine requests.
+    # dramatically cut down on the amount of work.
     dirs: set[PurePath] = set(source_roots_request.dirs)
     file_to_dir: dict[PurePath, PurePath] = {
         file: file.parent for file in source_roots_request.files
     }
     dirs.update(file_to_dir.values())
 
-    roots = await concurrently(
-        get_optional_source_root(SourceRootRequest(d), **implicitly()) for d in dirs
-    )
-    dir_to_root = dict(zip(dirs, roots))
+    dir_to_root = await _find_optional_source_roots(dirs, source_root_config)
 
     path_to_optional_root: dict[PurePath, OptionalSourceRoot] = {}
     for d in source_roots_request.dirs:
@@ -296,7 +354,7 @@ async def get_source_roots(source_roots_request: SourceRootsRequest) -> SourceRo
     That way callers don't have to unpack OptionalSourceRoots if they know they expect a SourceRoot
     to exist and are willing to error if it doesn't.
     """
-    osrr = await get_optional_source_roots(source_roots_request)
+    osrr = await get_optional_source_roots(source_roots_request, **implicitly())
     path_to_root = {}
     for path, osr in osrr.path_to_optional_root.items():
         if osr.source_root is None:
@@ -347,24 +405,20 @@ async def all_roots(source_root_config: SourceRootConfig) -> AllSourceRoots:
         path_globs_to_paths(PathGlobs(globs=sorted(marker_file_matches))),
     )
 
-    responses = await concurrently(
-        itertools.chain(
-            (
-                get_optional_source_root(SourceRootRequest(PurePath(d)), **implicitly())
-                for d in pattern_paths.dirs
-            ),
-            # We don't technically need to issue a SourceRootRequest for the marker files,
-            # since we know that their immediately enclosing dir is a source root by definition.
-            # However we may as well verify this formally, so that we're not replicating that
-            # logic here.
-            (
-                get_optional_source_root(SourceRootRequest(PurePath(f)), **implicitly())
-                for f in marker_paths.files
-            ),
-        )
+    # We don't technically need to look up the source roots of the marker files, since we know that
+    # their immediately enclosing dir is a source root by definition. However we may as well verify
+    # this formally, so that we're not replicating that logic here.
+    responses = await get_optional_source_roots(
+        SourceRootsRequest(
+            files=(PurePath(f) for f in marker_paths.files),
+            dirs=(PurePath(d) for d in pattern_paths.dirs),
+        ),
+        **implicitly(),
     )
     all_source_roots = {
-        response.source_root for response in responses if response.source_root is not None
+        response.source_root
+        for response in responses.path_to_optional_root.values()
+        if response.source_root is not None
     }
     return AllSourceRoots(all_source_roots)
 
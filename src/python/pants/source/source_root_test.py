@@ -1,7 +1,6 @@
 # Copyright 2015 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
-import os
 from collections.abc import Iterable
 from pathlib import PurePath
 
@@ -10,18 +9,23 @@ import pytest
 from pants.engine.fs import PathGlobs, Paths
 from pants.engine.rules import QueryRule
 from pants.source.source_root import (
+    MarkerFileDirs,
+    MarkerFileDirsRequest,
     OptionalSourceRoot,
+    OptionalSourceRootsResult,
     SourceRoot,
     SourceRootConfig,
     SourceRootRequest,
     SourceRootsRequest,
     SourceRootsResult,
     all_roots,
+    find_marker_file_dirs,
     get_optional_source_root,
 )
 from pants.source.source_root import rules as source_root_rules
 from pants.testutil.option_util import create_subsystem
-from pants.testutil.rule_runner import MockGet, RuleRunner, run_rule_with_mocks
+from pants.testutil.rule_runner import RuleRunner, run_rule_with_mocks
+from pants.util.frozendict import FrozenDict
 
 
 def _find_root(
@@ -36,26 +40,22 @@ def _find_root(
         marker_filenames=list(marker_filenames or []),
     )
 
-    # This inner function is passed as the callable to the mock, to allow recursion in the rule.
     def _mock_fs_check(pathglobs: PathGlobs) -> Paths:
-        for glob in pathglobs.globs:
-            if glob in (existing_marker_files or []):
-                d, f = os.path.split(pathglobs.globs[0])
-                return Paths(files=(f,), dirs=(d,))
-        return Paths(files=tuple(), dirs=tuple())
+        existing = set(existing_marker_files or [])
+        return Paths(files=tuple(glob for glob in pathglobs.globs if glob in existing), dirs=())
+
+    def _find_marker_file_dirs(request: MarkerFileDirsRequest) -> MarkerFileDirs:
+        return run_rule_with_mocks(
+            find_marker_file_dirs,
+            rule_args=[request, source_root_config],
+            mock_calls={"pants.engine.intrinsics.path_globs_to_paths": _mock_fs_check},
+        )
 
     def _do_find_root(src_root_req: SourceRootRequest) -> OptionalSourceRoot:
         return run_rule_with_mocks(
             get_optional_source_root,
             rule_args=[src_root_req, source_root_config],
-            mock_calls={"pants.engine.intrinsics.path_globs_to_paths": _mock_fs_check},
-            mock_gets=[
-                MockGet(
-                    output_type=OptionalSourceRoot,
-                    input_types=(SourceRootRequest,),
-                    mock=_do_find_root,
-                ),
-            ],
+            mock_calls={"pants.source.source_root.find_marker_file_dirs": _find_marker_file_dirs},
         )
 
     source_root = _do_find_root(SourceRootRequest(PurePath(path))).source_root
@@ -219,18 +219,26 @@ def test_all_roots() -> None:
     def provider_rule(_: PathGlobs) -> Paths:
         return Paths((), dirs)
 
-    def source_root_mock_rule(req: SourceRootRequest) -> OptionalSourceRoot:
-        for d in dirs:
-            if str(req.path).startswith(d):
-                return OptionalSourceRoot(SourceRoot(str(req.path)))
-        return OptionalSourceRoot(None)
+    def source_roots_mock_rule(req: SourceRootsRequest) -> OptionalSourceRootsResult:
+        return OptionalSourceRootsResult(
+            FrozenDict(
+                {
+                    path: OptionalSourceRoot(
+                        SourceRoot(str(path))
+                        if any(str(path).startswith(d) for d in dirs)
+                        else None
+                    )
+                    for path in req.dirs
+                }
+            )
+        )
 
     output = run_rule_with_mocks(
         all_roots,
         rule_args=[source_root_config],
         mock_calls={
             "pants.engine.intrinsics.path_globs_to_paths": provider_rule,
-            "pants.source.source_root.get_optional_source_root": source_root_mock_rule,
+            "pants.source.source_root.get_optional_source_roots": source_roots_mock_rule,
         },
     )
 
@@ -264,8 +272,10 @@ def test_all_roots_with_root_at_buildroot() -> None:
         rule_args=[source_root_config],
         mock_calls={
             "pants.engine.intrinsics.path_globs_to_paths": provider_rule,
-            "pants.source.source_root.get_optional_source_root": lambda req: OptionalSourceRoot(
-                SourceRoot(".")
+            "pants.source.source_root.get_optional_source_roots": lambda req: (
+                OptionalSourceRootsResult(
+                    FrozenDict({path: OptionalSourceRoot(SourceRoot(".")) for path in req.dirs})
+                )
             ),
         },
     )
@@ -291,3 +301,9 @@ def test_source_roots_request() -> None:
         PurePath("src/python/foo"): SourceRoot("src/python"),
         PurePath("src/python/baz/qux"): SourceRoot("src/python"),
     } == dict(res.path_to_root)
+
+
+def test_marker_file_dirs_request_is_keyed_on_the_set_of_dirs() -> None:
+    assert MarkerFileDirsRequest(
+        [PurePath("b"), PurePath("a"), PurePath("b")]
+    ) == MarkerFileDirsRequest([PurePath("a"), PurePath("b")])
@@ -0,0 +1,50 @@
+# Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import pytest
+
+
+class BenchmarkResults:
+    """Results of the benchmarks in a test module, written as JSON to the path in an env var.
+
+    Set the env var to an absolute path to write the results to it, e.g. to compare them across
+    changes. When running under Pants, pass it through with `--test-extra-env-vars`.
+
+        BENCHMARK_RESULTS = BenchmarkResults("PANTS_MY_BENCHMARKS_RESULTS")
+        # For benchmarks which are too slow to run by default.
+        pytestmark = BENCHMARK_RESULTS.opt_in
+        write_results = BENCHMARK_RESULTS.write_results_fixture()
+    """
+
+    def __init__(self, env_var: str) -> None:
+        self.env_var = env_var
+        self.results: dict[str, Any] = {}
+
+    @property
+    def path(self) -> str | None:
+        return os.environ.get(self.env_var) or None
+
+    @property
+    def opt_in(self) -> pytest.MarkDecorator:
+        """Skip the marked benchmarks unless their results were requested."""
+        return pytest.mark.skipif(not self.path, reason=f"Set {self.env_var} to run benchmarks.")
+
+    def write_results_fixture(self) -> Callable[[], Iterator[None]]:
+        """A module fixture which writes the results once all of the module's benchmarks ran."""
+
+        @pytest.fixture(scope="module", autouse=True)
+        def write_results() -> Iterator[None]:
+            yield
+            if not self.path:
+                return
+            with open(self.path, "w") as f:
+                json.dump(self.results, f, indent=2)
+
+        return write_results
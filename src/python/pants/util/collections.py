@@ -6,6 +6,7 @@ from __future__ import annotations
 import collections
 import collections.abc
 import gc
+import heapq
 import math
 from collections.abc import Callable, Iterable, Iterator, MutableMapping
 from sys import getsizeof
@@ -151,3 +152,46 @@ def partition_sequentially(
             yield emit_batch()
     if batch:
         yield emit_batch()
+
+
+def partition_by_weight(
+    items: Iterable[_T],
+    *,
+    key: Callable[[_T], str],
+    weight: Callable[[_T], float],
+    num_partitions: int,
+    size_max: int | None = None,
+) -> list[list[_T]]:
+    """Partitions the given items into `num_partitions` batches of roughly equal weight.
+
+    Uses the "longest processing time first" heuristic: items are visited in order of decreasing
+    weight, and each is added to the batch with the smallest total weight so far. Ties are broken
+    using `key`, so that the output is deterministic for a given input. Empty batches are omitted,
+    and the items within each batch are sorted by `key`.
+
+    If `size_max` is given, batches which already hold `size_max` items are skipped, and if all
+    of the batches are full, additional batches are created.
+    """
+    weighted_items = sorted(((weight(item), key(item), item) for item in items), key=_neg_weight)
+    num_partitions = max(1, min(num_partitions, len(weighted_items)))
+    # A heap of (total weight, batch index): the index breaks ties deterministically.
+    heap = [(0.0, i) for i in range(num_partitions)]
+    batches: list[list[tuple[str, _T]]] = [[] for _ in range(num_partitions)]
+    for item_weight, item_key, item in weighted_items:
+        if heap:
+            total, i = heapq.heappop(heap)
+        else:
+            total, i = 0.0, len(batches)
+            batches.append([])
+        batches[i].append((item_key, item))
+        if size_max is None or len(batches[i]) < size_max:
+            heapq.heappush(heap, (total + item_weight, i))
+    return [
+        [item for _, item in sorted(batch, key=lambda keyed: keyed[0])]
+        for batch in batches
+        if batch
+    ]
+
+
+def _neg_weight(weighted_item: tuple[float, str, Any]) -> tuple[float, str]:
+    return -weighted_item[0], weighted_item[1]
@@ -12,6 +12,7 @@ from pants.util.collections import (
     assert_single_element,
     ensure_list,
     ensure_str_list,
+    partition_by_weight,
     partition_sequentially,
     recursively_update,
 )
@@ -107,3 +108,42 @@ def test_partition_sequentially(size_target: int) -> None:
     for to_add in [item for i, item in enumerate(all_items) if i % 2 == 1]:
         updated_partitions = partitioned_buckets([to_add, *base_items])
         assert 1 <= len(base_partitions ^ updated_partitions) <= 4
+
+
+def test_partition_by_weight() -> None:
+    weights = {"a": 10, "b": 7, "c": 6, "d": 5, "e": 4, "f": 1}
+
+    def partitioned(items: list[str], num_partitions: int) -> list[list[str]]:
+        return partition_by_weight(
+            items, key=str, weight=weights.__getitem__, num_partitions=num_partitions
+        )
+
+    assert partitioned(list(weights), 1) == [sorted(weights)]
+    # LPT: a(10) -> 0, b(7) -> 1, c(6) -> 1, d(5) -> 0, e(4) -> 1, f(1) -> 0.
+    assert partitioned(list(weights), 2) == [["a", "d", "f"], ["b", "c", "e"]]
+    # The result does not depend on input order.
+    assert partitioned(list(reversed(weights)), 2) == partitioned(list(weights), 2)
+    # Empty batches are omitted.
+    assert partitioned(["a", "b"], 5) == [["a"], ["b"]]
+    assert partitioned([], 3) == []
+
+
+def test_partition_by_weight_size_max() -> None:
+    # Two slow items and many fast ones: without a maximum size, all of the fast items would be
+    # packed into a single batch.
+    weights = {"s0": 100, "s1": 100, **{f"f{i:02}": 1 for i in range(10)}}
+
+    def partitioned(num_partitions: int, size_max: int | None) -> list[list[str]]:
+        return partition_by_weight(
+            list(weights),
+            key=str,
+            weight=weights.__getitem__,
+            num_partitions=num_partitions,
+            size_max=size_max,
+        )
+
+    assert partitioned(3, None) == [["s0"], ["s1"], [f"f{i:02}" for i in range(10)]]
+    assert partitioned(3, 8) == [["f08", "s0"], ["f09", "s1"], [f"f{i:02}" for i in range(8)]]
+    assert all(len(batch) <= 8 for batch in partitioned(3, 8))
+    # If every batch is full, more are created.
+    assert [len(batch) for batch in partitioned(1, 5)] == [5, 5, 2]
@@ -147,23 +147,24 @@ class GitWorktree(EngineAwareReturnType):
             result.update(diff)
 
         if include_untracked:
-            # There is no git diff flag to include untracked files, so we get
-            # the list of untracked files and manually create the diff by
-            # comparing each file to an empty /dev/null.
+            # There is no git diff flag to include untracked files. Rather than running
+            # `git diff --no-index /dev/null <file>` once per untracked file, we list the untracked
+            # files once, and compute the (single) hunk that such a diff would contain directly.
+            requested_paths = set(paths)
             untracked_files = (
                 self._git(
                     "ls-files",
                     "--other",
                     "--exclude-standard",
                     "--full-name",
+                    "--",
+                    *[str(relative_to / path) for path in requested_paths],
                 )
                 .decode()
                 .splitlines()
             )
-            for file in set(untracked_files).intersection(paths):
-                untracked_diff = self._git_diff("--no-index", "/dev/null", str(relative_to / file))
-                assert len(untracked_diff) == 1
-                result[file] = next(iter(untracked_diff.values()))
+            for file in requested_paths.intersection(untracked_files):
+                result[file] = _diff_hunks_against_empty_file(Path(relative_to, file))
 
         return result
 
@@ -193,6 +194,23 @@ class GitWorktree(EngineAwareReturnType):
         return id(self) == id(other)
 
 
+# The number of leading bytes in which git looks for a NUL byte to decide whether a file is binary.
+_GIT_BINARY_DETECTION_LENGTH = 8000
+
+
+def _diff_hunks_against_empty_file(path: Path) -> tuple[Hunk, ...]:
+    """The hunks in the output of `git diff --no-index /dev/null <path>`.
+
+    A diff against an empty file contains at most one hunk, covering every line of the file. Empty
+    and binary files produce no hunks, which `DiffParser` represents as a single empty hunk.
+    """
+    content = os.readlink(path).encode() if path.is_symlink() else path.read_bytes()
+    if not content or b"\0" in content[:_GIT_BINARY_DETECTION_LENGTH]:
+        return (Hunk(left=None, right=TextBlock(start=0, count=0)),)
+    num_lines = content.count(b"\n") + (0 if content.endswith(b"\n") else 1)
+    return (Hunk(left=TextBlock(start=0, count=0), right=TextBlock(start=1, count=num_lines)),)
+
+
 class ParseError(Exception):
     pass
 
@@ -24,6 +24,7 @@ from pants.vcs.git import (
     GitWorktree,
     GitWorktreeRequest,
     MaybeGitWorktree,
+    _diff_hunks_against_empty_file,
     get_git_worktree,
 )
 from pants.vcs.hunk import Hunk, TextBlock
@@ -363,6 +364,20 @@ def test_commit_with_new_untracked_file_adds_file(
     assert expected({}) == changed(git)(include_untracked=True)
 
 
+@pytest.mark.parametrize(
+    "content",
+    [b"", b"one line", b"one line\n", b"two\nlines\n", b"\n\n\n", b"binary\0content\n"],
+)
+def test_diff_hunks_against_empty_file(tmp_path: Path, content: bytes) -> None:
+    path = tmp_path / "file"
+    path.write_bytes(content)
+    git_diff = subprocess.run(
+        ["git", "diff", "--no-index", "/dev/null", str(path)], stdout=subprocess.PIPE
+    ).stdout
+    (expected,) = DiffParser().parse_unified_diff(git_diff).values()
+    assert expected == _diff_hunks_against_empty_file(path)
+
+
 @parametrize_changed_files
 def test_bad_ref_stderr_issues_13396(
     git: MutatingGitWorktree, name: str, changed: Any, expected: Any
@@ -125,6 +125,7 @@ fn native_engine(py: Python, m: &Bound<'_, PyModule>) -> PyO3Result<()> {
     m.add_function(wrap_pyfunction!(graph_invalidate_paths, m)?)?;
     m.add_function(wrap_pyfunction!(graph_invalidate_all_paths, m)?)?;
     m.add_function(wrap_pyfunction!(graph_invalidate_all, m)?)?;
+    m.add_function(wrap_pyfunction!(graph_evict_least_recently_used, m)?)?;
     m.add_function(wrap_pyfunction!(graph_len, m)?)?;
     m.add_function(wrap_pyfunction!(graph_visualize, m)?)?;
 
@@ -1421,6 +1422,19 @@ fn graph_invalidate_all(py: Python, py_scheduler: &Bound<'_, PyScheduler>) {
         .enter(|| py.allow_threads(|| scheduler.invalidate_all()))
 }
 
+#[pyfunction]
+fn graph_evict_least_recently_used(
+    py: Python,
+    py_scheduler: &Bound<'_, PyScheduler>,
+    fraction: f64,
+) -> u64 {
+    let scheduler = &py_scheduler.borrow().0;
+    scheduler
+        .core
+        .executor
+        .enter(|| py.allow_threads(|| scheduler.evict_least_recently_used(fraction) as u64))
+}
+
 #[pyfunction]
 fn check_invalidation_watcher_liveness(py_scheduler: &Bound<'_, PyScheduler>) -> PyO3Result<()> {
     let scheduler = &py_scheduler.borrow().0;
@@ -2069,7 +2083,8 @@ fn stdio_thread_set_destination(stdio_destination: &Bound<'_, PyStdioDestination
     stdio_destination.borrow().0.set_for_current_thread();
 }
 
-// TODO: Needs to be thread-local / associated with the Console.
+// NB: The log path is associated with the current thread's stdio Destination, and so is specific
+// to the run on this thread.
 #[pyfunction]
 #[pyo3(signature = (log_path))]
 fn set_per_run_log_path(py: Python, log_path: Option<PathBuf>) {
@@ -117,6 +117,14 @@ impl Scheduler {
         self.core.graph.clear();
     }
 
+    ///
+    /// Evict the values of the given fraction of the nodes in the graph, least recently used first,
+    /// returning the number of nodes that were evicted.
+    ///
+    pub fn evict_least_recently_used(&self, fraction: f64) -> usize {
+        self.core.graph.evict_least_recently_used(fraction)
+    }
+
     ///
     /// Return Scheduler and per-Session metrics.
     ///
@@ -234,6 +234,9 @@ pub(crate) struct Entry<N: Node> {
     node: Arc<N>,
 
     state: Arc<Mutex<EntryState<N>>>,
+
+    // The most recent RunId in which this Node was requested, which orders eviction.
+    last_requested: Arc<atomic::AtomicU32>,
 }
 
 impl<N: Node> Entry<N> {
@@ -246,6 +249,7 @@ impl<N: Node> Entry<N> {
         Entry {
             node: Arc::new(node),
             state: Arc::new(Mutex::new(EntryState::initial())),
+            last_requested: Arc::new(atomic::AtomicU32::new(0)),
         }
     }
 
@@ -466,6 +470,11 @@ impl<N: Node> Entry<N> {
         context: &Context<N>,
         entry_id: EntryId,
     ) -> BoxFuture<'_, NodeResult<N>> {
+        // NB: RunIds increase monotonically within a Graph, but concurrent runs may request a Node in
+        // any order.
+        self.last_requested
+            .fetch_max(context.run_id().0, atomic::Ordering::Relaxed);
+
         let mut state = self.state.lock();
 
         // First check whether the Node is already complete, or is currently running: in both of these
@@ -776,6 +785,77 @@ impl<N: Node> Entry<N> {
         };
     }
 
+    ///
+    /// The most recent RunId in which this Node was requested (including to clean a dependent).
+    ///
+    pub(crate) fn last_requested(&self) -> RunId {
+        RunId(self.last_requested.load(atomic::Ordering::Relaxed))
+    }
+
+    ///
+    /// True if this Node is not running, and holds a value which `evict` would drop.
+    ///
+    pub(crate) fn is_evictable(&self) -> bool {
+        match *self.state.lock() {
+            EntryState::Running { .. } => false,
+            EntryState::NotStarted {
+                ref previous_result,
+                ..
+            } => previous_result.is_some(),
+            EntryState::Completed { .. } => true,
+        }
+    }
+
+    ///
+    /// Evicts the value of this Node (if it is not currently running) by clearing it and dropping
+    /// its previous result, rather than retaining that result for cleaning. An evicted Node will
+    /// re-run the next time it is requested.
+    ///
+    /// Running Nodes are skipped, so that eviction never interrupts in-flight work.
+    ///
+    /// Returns true if a value was evicted.
+    ///
+    pub(crate) fn evict(&mut self) -> bool {
+        let mut state = self.state.lock();
+
+        let (evicted, next_state) = match mem::replace(&mut *state, EntryState::initial()) {
+            s @ EntryState::Running { .. } => (false, s),
+            EntryState::NotStarted {
+                run_token,
+                generation,
+                pollers,
+                previous_result,
+            } => (
+                previous_result.is_some(),
+                EntryState::NotStarted {
+                    run_token,
+                    generation,
+                    pollers,
+                    previous_result: None,
+                },
+            ),
+            EntryState::Completed {
+                run_token,
+                generation,
+                ..
+            } => {
+                test_trace_log!("Evicting node {:?}", self.node);
+                // Dropping the pollers notifies them of a change, as in `clear`.
+                (
+                    true,
+                    EntryState::NotStarted {
+                        run_token: run_token.next(),
+                        generation,
+                        pollers: Vec::new(),
+                        previous_result: None,
+                    },
+                )
+            }
+        };
+        *state = next_state;
+        evicted
+    }
+
     ///
     /// Dirties this Node, which will cause it to examine its dependencies the next time it is
     /// requested, and re-run if any of them have changed generations.
@@ -206,6 +206,31 @@ impl<N: Node> InnerGraph<N> {
         }
     }
 
+    fn evict_least_recently_used(&mut self, fraction: f64) -> usize {
+        let mut candidates = self
+            .nodes
+            .values()
+            .filter_map(|&eid| {
+                let entry = self.pg.node_weight(eid)?;
+                entry
+                    .is_evictable()
+                    .then(|| (entry.last_requested().0, eid))
+            })
+            .collect::<Vec<_>>();
+        let count = (candidates.len() as f64 * fraction).ceil() as usize;
+        candidates.sort_unstable_by_key(|&(last_requested, _)| last_requested);
+
+        let mut evicted = 0;
+        for (_, eid) in candidates.into_iter().take(count) {
+            if let Some(entry) = self.pg.node_weight_mut(eid) {
+                if entry.evict() {
+                    evicted += 1;
+                }
+            }
+        }
+        evicted
+    }
+
     ///
     /// Clears the values of all "invalidation root" Nodes and dirties their transitive dependents.
     ///
@@ -628,6 +653,18 @@ impl<N: Node> Graph<N> {
         inner.clear()
     }
 
+    ///
+    /// Clears the state of the given fraction of the (non-running) Nodes which hold values, in order
+    /// of the RunId in which they were last requested, and drops their previous results in order to
+    /// release the memory held by those values. Returns the number of Nodes which were evicted.
+    ///
+    /// Unlike `clear`, evicted Nodes will re-run rather than be cleaned when they are next requested.
+    ///
+    pub fn evict_least_recently_used(&self, fraction: f64) -> usize {
+        let mut inner = self.inner.lock();
+        inner.evict_least_recently_used(fraction)
+    }
+
     pub fn invalidate_from_roots<P: Fn(&N) -> bool>(
         &self,
         log_dirtied: bool,
@@ -107,6 +107,40 @@ async fn invalidate_and_rerun() {
     assert_eq!(context.runs(), vec![TNode::new(1), TNode::new(2)]);
 }
 
+#[tokio::test]
+async fn evict_least_recently_used() {
+    let graph = empty_graph();
+
+    // Create three nodes in one run, and then request the first of them again in a later run.
+    let context = graph.context(TContext::new());
+    assert_eq!(
+        graph.create(TNode::new(2), &context).await,
+        Ok(vec![T(0, 0), T(1, 0), T(2, 0)])
+    );
+    let context = graph.context(TContext::new());
+    assert_eq!(
+        graph.create(TNode::new(0), &context).await,
+        Ok(vec![T(0, 0)])
+    );
+    assert!(context.runs().is_empty());
+
+    // Evict half of them (rounding up): the two which were least recently requested.
+    assert_eq!(graph.evict_least_recently_used(0.5), 2);
+
+    // Because their previous results were dropped, the evicted nodes must re-run rather than being
+    // cleaned, while the node which was requested more recently is still memoized.
+    let context = graph.context(TContext::new());
+    assert_eq!(
+        graph.create(TNode::new(2), &context).await,
+        Ok(vec![T(0, 0), T(1, 0), T(2, 0)])
+    );
+    assert_eq!(context.runs(), vec![TNode::new(2), TNode::new(1)]);
+
+    // Evicting everything leaves nothing to evict.
+    assert_eq!(graph.evict_least_recently_used(1.0), 3);
+    assert_eq!(graph.evict_least_recently_used(1.0), 0);
+}
+
 #[tokio::test]
 async fn invalidate_uncacheable() {
     let graph = empty_graph();
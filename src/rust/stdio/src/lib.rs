@@ -122,8 +122,12 @@ impl fmt::Debug for InnerDestination {
     }
 }
 
+///
+/// The second field is the file (if any) to which the logs of the run using this Destination are
+/// written: see `set_per_run_log`.
+///
 #[derive(Debug)]
-pub struct Destination(Mutex<InnerDestination>);
+pub struct Destination(Mutex<InnerDestination>, Mutex<Option<File>>);
 
 impl Destination {
     ///
@@ -189,6 +193,24 @@ impl Destination {
         }
     }
 
+    ///
+    /// Set (or clear) the file to which the logs of the run using this Destination are written.
+    ///
+    /// Because the Destination is per-run, concurrent runs each log to their own file.
+    ///
+    pub fn set_per_run_log(&self, per_run_log: Option<File>) {
+        *self.1.lock() = per_run_log;
+    }
+
+    ///
+    /// Write the given content to the per-run log file, if one is set, ignoring any errors.
+    ///
+    pub fn write_per_run_log(&self, content: &[u8]) {
+        if let Some(ref mut file) = *self.1.lock() {
+            let _ = file.write_all(content);
+        }
+    }
+
     ///
     /// Set whether to use color for stderr.
     ///
@@ -389,7 +411,7 @@ thread_local! {
   ///
   /// See set_thread_destination.
   ///
-  static THREAD_DESTINATION: RefCell<Arc<Destination>> = RefCell::new(Arc::new(Destination(Mutex::new(InnerDestination::Logging))))
+  static THREAD_DESTINATION: RefCell<Arc<Destination>> = RefCell::new(Arc::new(Destination(Mutex::new(InnerDestination::Logging), Mutex::new(None))))
 }
 
 // Note: The behavior of this task_local! invocation is affected by the `tokio_no_const_thread_local`
@@ -408,9 +430,12 @@ pub fn new_console_destination(
     stdout_fd: RawFd,
     stderr_fd: RawFd,
 ) -> Arc<Destination> {
-    Arc::new(Destination(Mutex::new(InnerDestination::Console(
-        Console::new(stdin_fd, stdout_fd, stderr_fd),
-    ))))
+    Arc::new(Destination(
+        Mutex::new(InnerDestination::Console(Console::new(
+            stdin_fd, stdout_fd, stderr_fd,
+        ))),
+        Mutex::new(None),
+    ))
 }
 
 ///